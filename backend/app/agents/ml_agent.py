@@ -312,12 +312,13 @@ class MLTechnicalAgent:
         if len(data) < period + 1:
             return 50.0
 
-        deltas = np.diff(data)
+        # Only the last `period` deltas are used, so diff just that tail.
+        deltas = np.diff(data[-(period + 1):])
         gains = np.where(deltas > 0, deltas, 0)
         losses = np.where(deltas < 0, -deltas, 0)
 
-        avg_gain = np.mean(gains[-period:])
-        avg_loss = np.mean(losses[-period:])
+        avg_gain = np.mean(gains)
+        avg_loss = np.mean(losses)
 
         if avg_loss == 0:
             return 100.0
@@ -174,7 +174,7 @@ async def get_pending_signals(current_user: User = Depends(get_current_user)):
         db_signals = result.scalars().all()
 
     # in-memory 시그널에 없는 DB 시그널만 추가 (중복 방지)
-    mem_db_ids = {getattr(s, "_db_id", None) for s in mem_signals}
+    mem_db_ids = {s.db_id for s in mem_signals}
     db_only = [s for s in db_signals if s.id not in mem_db_ids]
 
     db_formatted = [
@@ -43,11 +43,17 @@ class Settings(BaseSettings):
 
     # DART API
     dart_api_key: Optional[str] = None
+    # DART 고유번호 목록 로컬 캐시 (JSON {종목코드: 고유번호}) — 재시작 시 Redis/다운로드 생략용
+    dart_corp_code_cache_path: str = "~/.cache/signal_smith/dart_corp_codes.json"
 
     # OpenAI
     openai_api_key: Optional[str] = None
     openai_base_url: Optional[str] = None
     openai_model: str = "gpt-4o-mini"
+    openai_max_concurrency: int = 20  # 동시 OpenAI 호출 상한
+    openai_rpm: int = 500             # 분당 OpenAI 요청 상한 (계정 티어에 맞게 조정)
+    openai_max_retries: int = 5       # 429/5xx 재시도 횟수 (SDK 백오프)
+    rebalance_use_batch_api: bool = False  # 일일 리밸런싱을 Batch API로 처리 (24시간 내 완료, 비용 50%)
 
     # Anthropic
     anthropic_api_key: Optional[str] = None
@@ -78,6 +84,8 @@ class Settings(BaseSettings):
     # Trading Settings
     trading_enabled: bool = True
     max_position_size: int = 1000000
+    # KRX 휴장일 캐시 (JSON 배열 ["YYYY-MM-DD", ...]) — 하드코딩 연도 이후 휴장일 확장용
+    krx_holiday_cache_path: str = "~/.cache/signal_smith/krx_holidays.json"
 
     # Portfolio Risk Management (Phase 1)
     min_position_pct: float = 8.0          # 최소 포지션 크기 (총자산 대비 %)
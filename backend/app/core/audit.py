@@ -7,13 +7,17 @@ Provides both sync (Celery) and async (FastAPI) functions that:
 DB write failures are logged but never propagated — audit is non-fatal.
 """
 
+import asyncio
 import logging
-from typing import Optional
+from typing import Coroutine, Optional
 
 from app.models.transaction import SignalEvent
 
 logger = logging.getLogger(__name__)
 
+# Strong references to fire-and-forget audit writes (the loop only keeps weak ones)
+_background_tasks: set[asyncio.Task] = set()
+
 
 def log_signal_event(
     event_type: str,
@@ -89,3 +93,22 @@ async def log_signal_event_async(
             await session.commit()
     except Exception:
         logger.warning("Failed to persist signal_event to DB", exc_info=True)
+
+
+def log_in_background(coro: Coroutine) -> None:
+    """Run an audit coroutine without waiting for the DB write.
+
+    For rejection paths where the caller only needs the decision.
+    Pending writes are flushed by drain_background_events().
+    """
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+async def drain_background_events() -> None:
+    """Wait for background audit writes started on the current event loop."""
+    loop = asyncio.get_running_loop()
+    pending = [t for t in _background_tasks if t.get_loop() is loop]
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
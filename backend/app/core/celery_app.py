@@ -109,6 +109,13 @@ celery_app.conf.beat_schedule = {
         "options": {"queue": "default"},
     },
 
+    # 리밸런싱 Batch API 결과 수집 - 30분마다 (REBALANCE_USE_BATCH_API 사용 시)
+    "collect-rebalance-batches": {
+        "task": "app.services.tasks.collect_rebalance_batches",
+        "schedule": 1800.0,  # Every 30 minutes
+        "options": {"queue": "low_priority"},
+    },
+
     # 계좌 요약 (잔고+보유종목) 캐시 갱신 - 30초마다
     "refresh-account-summary": {
         "task": "app.services.tasks.refresh_account_summary",
@@ -135,5 +142,6 @@ celery_app.conf.task_routes = {
     "app.services.tasks.monitor_holdings_sell": {"queue": "default"},
     "app.services.tasks.refresh_stock_universe": {"queue": "default"},
     "app.services.tasks.rebalance_holdings": {"queue": "default"},
+    "app.services.tasks.collect_rebalance_batches": {"queue": "low_priority"},
     "app.services.tasks.refresh_account_summary": {"queue": "high_priority"},
 }
@@ -33,17 +33,20 @@ async def lifespan(app: FastAPI):
     from app.services.council.orchestrator import council_orchestrator
     await council_orchestrator.restore_pending_signals()
 
-    # DART 기업코드 캐시 프리로드 (점검 시간 대비)
-    try:
-        from app.services.dart_client import dart_client
-        await dart_client._load_corp_codes()
-    except Exception as e:
-        logger.warning(f"DART 기업코드 프리로드 실패 (점검 중일 수 있음): {e}")
+    # DART 기업코드 캐시 프리로드 (점검 시간 대비, 백그라운드 — 앱 시작을 막지 않음)
+    from app.services.dart_client import dart_client
+    dart_client.start_corp_code_preload()
 
     yield
 
     # Shutdown: release connections
     logger.info("Shutting down — releasing connections")
+    from app.core.audit import drain_background_events
+    from app.services.council.llm_utils import close_llm_clients
+    from app.services.dart_client import dart_client
+    await drain_background_events()
+    await close_llm_clients()
+    await dart_client.close()
     await close_redis()
     await engine.dispose()
     sync_engine.dispose()
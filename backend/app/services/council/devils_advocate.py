@@ -7,6 +7,7 @@ GPT 반대론자 (Devil's Advocate)
 - 투자 리스크를 극대화하여 제시
 """
 
+import asyncio
 import logging
 from typing import Optional
 import json
@@ -15,6 +16,7 @@ from openai import AsyncOpenAI
 
 from app.config import settings
 from .models import CouncilMessage, AnalystRole
+from .llm_utils import get_openai_client, openai_call_slot
 from .technical_indicators import TechnicalAnalysisResult
 from app.services.dart_client import FinancialData
 
@@ -79,21 +81,25 @@ class DevilsAdvocate:
     def __init__(self):
         self._client: Optional[AsyncOpenAI] = None
         self._initialized = False
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
 
     def _initialize(self):
-        """OpenAI 클라이언트 초기화 (CLIProxiAPI 경유)"""
-        if self._initialized:
+        """OpenAI 클라이언트 초기화 (CLIProxiAPI 경유)
+
+        Celery 태스크는 호출마다 새 이벤트 루프를 쓰므로 루프가 바뀌면 그 루프의 클라이언트로 교체한다.
+        """
+        loop = asyncio.get_running_loop()
+        if self._initialized and self._client_loop is loop:
             return
 
         if not settings.openai_api_key:
             raise ValueError("OPENAI_API_KEY가 설정되지 않았습니다")
 
-        self._client = AsyncOpenAI(
-            api_key=settings.openai_api_key,
-            base_url=settings.openai_base_url,
-        )
+        self._client = get_openai_client(settings.openai_api_key, settings.openai_base_url)
+        self._client_loop = loop
+        if not self._initialized:
+            logger.info(f"GPT 반대론자 초기화 (모델: {settings.openai_model})")
         self._initialized = True
-        logger.info(f"GPT 반대론자 초기화 (모델: {settings.openai_model})")
 
     def _build_previous_analyses(self, messages: list[CouncilMessage]) -> str:
         """이전 분석가 의견 구성"""
@@ -135,15 +141,16 @@ class DevilsAdvocate:
         )
 
         try:
-            response = await self._client.chat.completions.create(
-                model=settings.openai_model,
-                messages=[
-                    {"role": "system", "content": self.SYSTEM_PROMPT},
-                    {"role": "user", "content": prompt},
-                ],
-                temperature=0.8,  # 다양한 반박을 위해 높은 temperature
-                max_tokens=2048,
-            )
+            async with openai_call_slot():
+                response = await self._client.chat.completions.create(
+                    model=settings.openai_model,
+                    messages=[
+                        {"role": "system", "content": self.SYSTEM_PROMPT},
+                        {"role": "user", "content": prompt},
+                    ],
+                    temperature=0.8,  # 다양한 반박을 위해 높은 temperature
+                    max_tokens=2048,
+                )
 
             response_text = response.choices[0].message.content
 
@@ -10,6 +10,7 @@ Claude 펀더멘털 분석가
 v2: DART API 실제 재무제표 데이터 연동
 """
 
+import asyncio
 import logging
 from typing import Optional
 import json
@@ -18,6 +19,7 @@ from openai import AsyncOpenAI
 
 from app.config import settings
 from .models import CouncilMessage, AnalystRole
+from .llm_utils import build_conversation, get_openai_client
 from app.services.dart_client import FinancialData
 
 logger = logging.getLogger(__name__)
@@ -100,34 +102,29 @@ class FundamentalAnalyst:
     def __init__(self):
         self._client: Optional[AsyncOpenAI] = None
         self._initialized = False
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
 
     def _initialize(self):
-        """OpenAI 호환 클라이언트 초기화 (CLIProxiAPI 경유)"""
-        if self._initialized:
+        """OpenAI 호환 클라이언트 초기화 (CLIProxiAPI 경유)
+
+        Celery 태스크는 호출마다 새 이벤트 루프를 쓰므로 루프가 바뀌면 그 루프의 클라이언트로 교체한다.
+        """
+        loop = asyncio.get_running_loop()
+        if self._initialized and self._client_loop is loop:
             return
 
         if not settings.anthropic_api_key:
             raise ValueError("ANTHROPIC_API_KEY가 설정되지 않았습니다")
 
-        self._client = AsyncOpenAI(
-            api_key=settings.anthropic_api_key,
-            base_url=settings.anthropic_base_url or "https://api.anthropic.com/v1",
-        )
+        self._client = get_openai_client(settings.anthropic_api_key, settings.anthropic_base_url or "https://api.anthropic.com/v1")
+        self._client_loop = loop
+        if not self._initialized:
+            logger.info(f"Claude 펀더멘털 분석가 초기화 (모델: {settings.anthropic_model})")
         self._initialized = True
-        logger.info(f"Claude 펀더멘털 분석가 초기화 (모델: {settings.anthropic_model})")
 
     def _build_conversation(self, messages: list[CouncilMessage]) -> str:
         """이전 대화 내용 구성"""
-        if not messages:
-            return "(첫 번째 발언입니다)"
-
-        lines = []
-        for msg in messages[-6:]:  # 최근 6개 메시지만
-            speaker = msg.speaker
-            content = msg.content[:200]  # 길이 제한
-            lines.append(f"[{speaker}]: {content}")
-
-        return "\n".join(lines)
+        return build_conversation(messages)
 
     async def analyze(
         self,
@@ -136,12 +133,18 @@ class FundamentalAnalyst:
         news_title: str,
         previous_messages: list[CouncilMessage],
         financial_data: Optional[FinancialData] = None,
-        request: str = "펀더멘털 분석을 수행하고 투자 비율을 제안해주세요."
+        request: str = "펀더멘털 분석을 수행하고 투자 비율을 제안해주세요.",
+        conversation: Optional[str] = None,
     ) -> CouncilMessage:
-        """펀더멘털 분석 수행"""
+        """펀더멘털 분석 수행
+
+        conversation: 미리 구성된 이전 대화 (CouncilMeeting.conversation_text()).
+            없으면 previous_messages로 구성한다.
+        """
         self._initialize()
 
-        conversation = self._build_conversation(previous_messages)
+        if conversation is None:
+            conversation = self._build_conversation(previous_messages)
 
         # 재무 데이터 유무에 따라 프롬프트 선택
         if financial_data and financial_data.revenue:
@@ -292,12 +295,14 @@ class FundamentalAnalyst:
         previous_messages: list[CouncilMessage],
         quant_percent: float,
         fundamental_percent: float,
+        conversation: Optional[str] = None,
     ) -> CouncilMessage:
         """합의안 제안 (최종 투자 비율 + 보유 기한 결정)"""
         self._initialize()
 
         avg_percent = (quant_percent + fundamental_percent) / 2
-        conversation = self._build_conversation(previous_messages)
+        if conversation is None:
+            conversation = self._build_conversation(previous_messages)
 
         prompt = self.CONSENSUS_PROMPT.format(
             symbol=symbol,
@@ -1,15 +1,154 @@
 """LLM 응답 파싱 및 호출 유틸리티"""
 
 import asyncio
-import json
+import contextlib
+import dataclasses
+import functools
+import hashlib
 import logging
-from typing import Optional
+import re
+import time
+import uuid
+import weakref
+from collections import OrderedDict
+from datetime import datetime
+from typing import Awaitable, Callable, Optional, Sequence
 
-from .models import AnalystRole, CouncilMessage
+import httpx
+import orjson
+from openai import AsyncOpenAI
+
+from app.config import settings
+from .models import CONVERSATION_CONTENT_LIMIT, CONVERSATION_TAIL, AnalystRole, CouncilMessage
 
 logger = logging.getLogger(__name__)
 
 
+# LLM 호출 공용 HTTP 연결 풀 (keep-alive로 TCP/TLS 연결 재사용)
+LLM_HTTP_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=50,
+    keepalive_expiry=30,
+)
+
+# 이벤트 루프별 (httpx 연결 풀, {(api_key, base_url): AsyncOpenAI})
+# Celery 태스크는 run_async(asyncio.run)로 매번 새 루프를 만들므로, 닫힌 루프에 묶인
+# 연결을 다음 태스크가 재사용하지 않도록 루프마다 따로 둔다.
+_llm_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, tuple[httpx.AsyncClient, dict[tuple[str, Optional[str]], AsyncOpenAI]]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_openai_client(api_key: str, base_url: Optional[str] = None) -> AsyncOpenAI:
+    """분석가 공용 AsyncOpenAI 클라이언트 (실행 중인 이벤트 루프 기준).
+
+    같은 루프에서 (api_key, base_url)이 같으면 같은 클라이언트를 반환하고, 그 루프의
+    모든 클라이언트가 하나의 httpx 연결 풀을 공유한다.
+    """
+    loop = asyncio.get_running_loop()
+    entry = _llm_clients.get(loop)
+    if entry is None:
+        entry = (httpx.AsyncClient(limits=LLM_HTTP_LIMITS), {})
+        _llm_clients[loop] = entry
+    http_client, clients = entry
+
+    key = (api_key, base_url)
+    client = clients.get(key)
+    if client is None:
+        # 429는 SDK가 Retry-After/지수 백오프+지터로 재시도
+        client = AsyncOpenAI(
+            api_key=api_key,
+            base_url=base_url,
+            http_client=http_client,
+            max_retries=settings.openai_max_retries,
+        )
+        clients[key] = client
+    return client
+
+
+async def close_llm_clients() -> None:
+    """현재 이벤트 루프의 LLM 클라이언트 연결 풀 종료 (앱 종료, Celery 태스크 종료 시)"""
+    entry = _llm_clients.pop(asyncio.get_running_loop(), None)
+    if entry is not None:
+        await entry[0].aclose()
+
+
+class AsyncRateLimiter:
+    """토큰 버킷 기반 요청 속도 제한 (period초당 max_rate회, 최대 max_rate회 버스트)"""
+
+    def __init__(self, max_rate: float, period: float = 60.0):
+        self.max_rate = max_rate
+        self.period = period
+        self._tokens = float(max_rate)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.max_rate,
+                    self._tokens + (now - self._updated) * self.max_rate / self.period,
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) * self.period / self.max_rate)
+
+
+# 이벤트 루프별 OpenAI 호출 제한 (Celery 태스크는 호출마다 새 루프를 생성)
+_openai_guards: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, tuple[asyncio.Semaphore, AsyncRateLimiter]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+@contextlib.asynccontextmanager
+async def openai_call_slot():
+    """OpenAI 호출 동시성(openai_max_concurrency)·RPM(openai_rpm) 제한.
+
+    한도를 넘는 호출이 한꺼번에 나가 429 재시도가 반복되는 것을 막는다.
+    스트리밍 호출은 응답 수신이 끝날 때까지 슬롯을 유지해야 한다.
+    """
+    loop = asyncio.get_running_loop()
+    guard = _openai_guards.get(loop)
+    if guard is None:
+        guard = (
+            asyncio.Semaphore(settings.openai_max_concurrency),
+            AsyncRateLimiter(settings.openai_rpm),
+        )
+        _openai_guards[loop] = guard
+    semaphore, limiter = guard
+    async with semaphore:
+        await limiter.acquire()
+        yield
+
+
+@functools.lru_cache(maxsize=256)
+def _format_conversation(tail: tuple[tuple[str, str], ...]) -> str:
+    return "\n".join(f"[{speaker}]: {content}" for speaker, content in tail)
+
+
+def build_conversation(messages: Sequence[CouncilMessage]) -> str:
+    """이전 대화 내용 구성 (최근 6개 메시지, 메시지당 200자).
+
+    회의 라운드마다 같은 꼬리 대화가 반복되므로 (발언자, 내용) 튜플 기준으로
+    완성된 문자열을 캐시한다. 동일한 프롬프트 접두사가 유지되는 효과도 있다.
+    회의 중에는 CouncilMeeting.conversation_text()가 미리 포맷된 줄을 제공한다.
+    """
+    if not messages:
+        return "(첫 번째 발언입니다)"
+    return _format_conversation(tuple(
+        (m.speaker, m.content[:CONVERSATION_CONTENT_LIMIT])
+        for m in messages[-CONVERSATION_TAIL:]
+    ))
+
+
+# ```json ... ``` 또는 ``` ... ``` 코드 블록 (닫는 펜스가 없으면 끝까지)
+_JSON_FENCE = re.compile(r"```(?:json)?(.*?)(?:```|\Z)", re.DOTALL)
+
+
 def parse_llm_json(response_text: str, defaults: Optional[dict] = None) -> tuple[dict, Optional[str]]:
     """LLM 응답에서 JSON 추출.
 
@@ -20,19 +159,55 @@ def parse_llm_json(response_text: str, defaults: Optional[dict] = None) -> tuple
     Returns:
         (parsed_dict, error_message) — 성공 시 error_message는 None
     """
-    try:
-        if "```json" in response_text:
-            json_str = response_text.split("```json")[1].split("```")[0]
-        elif "```" in response_text:
-            json_str = response_text.split("```")[1].split("```")[0]
-        else:
-            json_str = response_text
+    m = _JSON_FENCE.search(response_text)
+    json_str = m.group(1) if m else response_text
 
-        return json.loads(json_str.strip()), None
-    except (json.JSONDecodeError, IndexError) as e:
+    try:
+        return orjson.loads(json_str), None
+    except orjson.JSONDecodeError as e:
         return defaults or {}, str(e)
 
 
+async def read_streamed_json(stream) -> str:
+    """스트리밍 chat completion에서 첫 JSON 객체가 닫히는 즉시 수신 중단.
+
+    Returns:
+        수신한 텍스트 (parse_llm_json으로 파싱)
+    """
+    parts: list[str] = []
+    depth = 0
+    in_string = escaped = False
+    try:
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if not delta:
+                continue
+            parts.append(delta)
+            for ch in delta:
+                if in_string:
+                    if escaped:
+                        escaped = False
+                    elif ch == "\\":
+                        escaped = True
+                    elif ch == '"':
+                        in_string = False
+                elif ch == "{":
+                    depth += 1
+                elif depth == 0:
+                    continue  # 객체 시작 전 텍스트 (코드 펜스 등)
+                elif ch == '"':
+                    in_string = True
+                elif ch == "}":
+                    depth -= 1
+                    if depth == 0:
+                        return "".join(parts)
+    finally:
+        await stream.close()
+    return "".join(parts)
+
+
 async def call_analyst_with_timeout(
     coro,
     *,
@@ -61,3 +236,109 @@ async def call_analyst_with_timeout(
         return fallback_msg, False
     finally:
         await asyncio.sleep(2)  # rate limit throttle for Google/Antigravity providers
+
+
+class AnalystResponseCache:
+    """분석가 응답 완전 일치 캐시 (SHA-256 키, TTL + LRU 상한).
+
+    동일 종목·뉴스·대화 맥락으로 회의가 재실행될 때(재시도, 중복 뉴스 수신)
+    LLM 호출 없이 직전 응답을 재사용한다. 아직 응답이 오지 않은 동일 키 호출은
+    single_flight로 합쳐 선행 호출의 결과를 기다린다.
+    """
+
+    def __init__(self, ttl: float = 600.0, maxsize: int = 10_000):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, tuple[CouncilMessage, float]]" = OrderedDict()
+        self._inflight: dict[str, asyncio.Future] = {}
+
+    @staticmethod
+    def make_key(
+        role: str,
+        symbol: str,
+        news_title: str,
+        previous_messages: Sequence[CouncilMessage],
+        *context: str,
+    ) -> str:
+        """역할·종목·뉴스·이전 대화·추가 맥락(지표 텍스트 등)으로 키 생성"""
+        payload = orjson.dumps(
+            [
+                role,
+                symbol,
+                news_title,
+                [[m.role.value, m.speaker, m.content] for m in previous_messages],
+                list(context),
+            ]
+        )
+        return hashlib.sha256(payload).hexdigest()
+
+    def get(self, key: str) -> Optional[CouncilMessage]:
+        """캐시 조회 — 적중 시 새 id/timestamp를 가진 복사본 반환"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        msg, stored_at = entry
+        if time.monotonic() - stored_at > self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return self._copy(msg)
+
+    @staticmethod
+    def _copy(msg: CouncilMessage) -> CouncilMessage:
+        """새 id/timestamp를 가진 메시지 복사본 (회의별 메시지 식별자 분리)"""
+        return dataclasses.replace(
+            msg,
+            id=str(uuid.uuid4())[:8],
+            data=dict(msg.data) if msg.data is not None else None,
+            timestamp=datetime.now(),
+        )
+
+    async def single_flight(
+        self,
+        key: str,
+        make_coro: Callable[[], Awaitable[CouncilMessage]],
+    ) -> CouncilMessage:
+        """같은 키의 호출이 진행 중이면 그 결과를 기다리고, 아니면 make_coro 실행.
+
+        단일 이벤트 루프 안에서 조회·등록 사이에 await가 없으므로 별도 Lock은 불필요.
+        선행 호출이 취소(타임아웃)되면 대기자에게는 TimeoutError가 전달된다.
+        """
+        loop = asyncio.get_running_loop()
+        fut = self._inflight.get(key)
+        if fut is not None and fut.get_loop() is loop:
+            logger.info(f"진행 중인 동일 분석가 호출 대기: {key[:12]}")
+            return self._copy(await asyncio.shield(fut))
+
+        fut = loop.create_future()
+        # 대기자가 없을 때 "exception was never retrieved" 경고 방지
+        fut.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[key] = fut
+        try:
+            msg = await make_coro()
+        except asyncio.CancelledError:
+            fut.set_exception(asyncio.TimeoutError("선행 분석가 호출 취소"))
+            raise
+        except Exception as e:
+            fut.set_exception(e)
+            raise
+        else:
+            fut.set_result(msg)
+            return msg
+        finally:
+            if self._inflight.get(key) is fut:
+                del self._inflight[key]
+
+    def put(self, key: str, msg: CouncilMessage) -> None:
+        self._entries[key] = (msg, time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._inflight.clear()
+
+
+# 싱글톤 인스턴스
+analyst_response_cache = AnalystResponseCache()
@@ -1,12 +1,18 @@
 """AI 투자 회의 데이터 모델"""
 
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
-from enum import Enum
-from typing import Optional, List
+from enum import Enum, StrEnum
+from typing import Deque, Optional, List
 import uuid
 
 
+# 분석가 프롬프트에 포함할 이전 대화 범위 (최근 메시지 수, 메시지당 글자 수)
+CONVERSATION_TAIL = 6
+CONVERSATION_CONTENT_LIMIT = 200
+
+
 class SignalStatus(str, Enum):
     """시그널 상태"""
     PENDING = "pending"          # 승인 대기
@@ -18,6 +24,14 @@ class SignalStatus(str, Enum):
     QUEUED = "queued"            # 자동매매 구매 대기 (거래시간 외)
 
 
+class TradeAction(StrEnum):
+    """회의 결정 액션 (값은 InvestmentSignal.action / DB signal_type 문자열과 동일)"""
+    BUY = "BUY"
+    SELL = "SELL"
+    PARTIAL_SELL = "PARTIAL_SELL"
+    HOLD = "HOLD"
+
+
 class AnalystRole(str, Enum):
     """분석가 역할"""
     GEMINI_JUDGE = "gemini_judge"       # 뉴스 트리거 (레거시 명칭 유지)
@@ -27,7 +41,7 @@ class AnalystRole(str, Enum):
     MODERATOR = "moderator"             # 중재자 (합의 도출)
 
 
-@dataclass
+@dataclass(slots=True)
 class CouncilMessage:
     """회의 메시지"""
     id: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
@@ -48,13 +62,13 @@ class CouncilMessage:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class InvestmentSignal:
     """투자 시그널"""
     id: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
     symbol: str = ""                     # 종목코드
     company_name: str = ""               # 회사명
-    action: str = "BUY"                  # BUY, SELL, HOLD
+    action: str = TradeAction.BUY.value  # TradeAction 값 (BUY, SELL, PARTIAL_SELL, HOLD)
 
     # 투자 비율 및 금액
     allocation_percent: float = 0.0      # 총 자금 대비 비율 (%)
@@ -77,8 +91,22 @@ class InvestmentSignal:
     status: SignalStatus = SignalStatus.PENDING
     created_at: datetime = field(default_factory=datetime.now)
     executed_at: Optional[datetime] = None
+    db_id: Optional[int] = None          # DB trading_signals.id (저장 후 설정)
+
+    # to_dict() 결과 캐시 — 필드 변경 시 무효화
+    _dict_cache: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name, value):
+        if name != "_dict_cache":
+            object.__setattr__(self, "_dict_cache", None)
+        object.__setattr__(self, name, value)
 
     def to_dict(self) -> dict:
+        if self._dict_cache is None:
+            object.__setattr__(self, "_dict_cache", self._serialize())
+        return dict(self._dict_cache)
+
+    def _serialize(self) -> dict:
         return {
             "id": self.id,
             "symbol": self.symbol,
@@ -101,7 +129,7 @@ class InvestmentSignal:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class CouncilMeeting:
     """AI 투자 회의"""
     id: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
@@ -126,9 +154,24 @@ class CouncilMeeting:
     started_at: datetime = field(default_factory=datetime.now)
     ended_at: Optional[datetime] = None
 
+    # 프롬프트용 최근 대화 줄 — add_message 시점에 한 번만 포맷
+    _conversation: Deque[str] = field(
+        default_factory=lambda: deque(maxlen=CONVERSATION_TAIL),
+        init=False, repr=False, compare=False,
+    )
+
     def add_message(self, message: CouncilMessage):
         """메시지 추가"""
         self.messages.append(message)
+        self._conversation.append(
+            f"[{message.speaker}]: {message.content[:CONVERSATION_CONTENT_LIMIT]}"
+        )
+
+    def conversation_text(self) -> str:
+        """분석가 프롬프트용 이전 대화 (llm_utils.build_conversation과 같은 형식)"""
+        if not self._conversation:
+            return "(첫 번째 발언입니다)"
+        return "\n".join(self._conversation)
 
     def get_transcript(self) -> str:
         """회의록 텍스트 생성"""
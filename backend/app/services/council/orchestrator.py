@@ -10,37 +10,51 @@ v4: risk_gate / sell_meeting / order_executor 모듈로 분해
 
 import logging
 import asyncio
+import json
+from collections import deque
+from itertools import islice
 from datetime import date, datetime, timedelta
-from typing import Optional, List, Callable, Awaitable
+from typing import Optional, List, Dict, Deque, Callable, Awaitable
 
 from app.config import settings
 from app.services.kiwoom.rest_client import kiwoom_client, OrderSide, OrderType
 from .models import (
     CouncilMeeting, CouncilMessage, InvestmentSignal,
-    SignalStatus, AnalystRole
+    SignalStatus, AnalystRole, TradeAction
 )
 from .quant_analyst import quant_analyst
 from .fundamental_analyst import fundamental_analyst
 from .devils_advocate import devils_advocate
 from .technical_indicators import technical_calculator, TechnicalAnalysisResult
-from .llm_utils import call_analyst_with_timeout
+from .llm_utils import call_analyst_with_timeout, analyst_response_cache
 from app.services.dart_client import dart_client, FinancialData
 from .trading_hours import trading_hours, MarketSession, get_kst_now
 from .cost_manager import cost_manager, AnalysisDepth
 from .risk_gate import (
     check_buy_gates, check_data_quality_gate, determine_action,
-    clamp_stop_loss, clamp_target_price,
+    clamp_stop_loss, clamp_target_price, invalidate_account_snapshot,
 )
+from . import order_executor, sell_meeting
 
 logger = logging.getLogger(__name__)
 
 
+def _trunc(text: str, limit: int) -> str:
+    """limit 글자 초과 시 잘라서 '...' 부착"""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
 class CouncilOrchestrator:
     """AI 투자 회의 오케스트레이터"""
 
+    # 장기 실행 시 메모리 상한 (오래된 항목부터 제거)
+    MAX_MEETINGS = 1000
+    MAX_PENDING_SIGNALS = 5000
+
     def __init__(self):
-        self._meetings: List[CouncilMeeting] = []
-        self._pending_signals: List[InvestmentSignal] = []
+        self._meetings: Deque[CouncilMeeting] = deque(maxlen=self.MAX_MEETINGS)
+        self._meetings_by_id: Dict[str, CouncilMeeting] = {}
+        self._pending_signals: Deque[InvestmentSignal] = deque(maxlen=self.MAX_PENDING_SIGNALS)
         self._signal_callbacks: List[Callable[[InvestmentSignal], Awaitable[None]]] = []
         self._meeting_callbacks: List[Callable[[CouncilMeeting], Awaitable[None]]] = []
 
@@ -49,7 +63,14 @@ class CouncilOrchestrator:
         self.min_confidence = 0.6          # 최소 신뢰도
         self.meeting_trigger_score = 7     # 회의 소집 기준 점수
         self.respect_trading_hours = True  # 거래 시간 존중 여부
-        self._queued_executions: List[InvestmentSignal] = []  # 거래 시간 대기 큐
+        self._queued_executions: Deque[InvestmentSignal] = deque()  # 거래 시간 대기 큐
+
+        # 합의 라운드 생략 기준 (분석가 의견 일치 시)
+        self.consensus_max_spread = 2.0    # 투자 비율 차이 (%p)
+        self.consensus_min_score = 7       # 양측 최소 점수
+        self.consensus_max_risk = 7        # 반대론자 리스크 점수 상한 (미만)
+
+        self.allow_zero_price_analysis = False  # 현재가 없이도 AI 회의 진행 여부
 
     # ─── Callbacks ───
 
@@ -62,20 +83,24 @@ class CouncilOrchestrator:
         self._meeting_callbacks.append(callback)
 
     async def _notify_signal(self, signal: InvestmentSignal):
-        """시그널 알림"""
-        for callback in self._signal_callbacks:
-            try:
-                await callback(signal)
-            except Exception as e:
-                logger.error(f"시그널 콜백 오류: {e}")
+        """시그널 알림 (콜백 동시 실행 — 느린 콜백이 나머지를 지연시키지 않음)"""
+        results = await asyncio.gather(
+            *(callback(signal) for callback in self._signal_callbacks),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"시그널 콜백 오류: {result}")
 
     async def _notify_meeting_update(self, meeting: CouncilMeeting):
-        """회의 업데이트 알림"""
-        for callback in self._meeting_callbacks:
-            try:
-                await callback(meeting)
-            except Exception as e:
-                logger.error(f"회의 콜백 오류: {e}")
+        """회의 업데이트 알림 (콜백 동시 실행)"""
+        results = await asyncio.gather(
+            *(callback(meeting) for callback in self._meeting_callbacks),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"회의 콜백 오류: {result}")
 
     # ─── Data Fetching ───
 
@@ -140,6 +165,89 @@ class CouncilOrchestrator:
             logger.error(f"DART 재무제표 조회 오류 [{symbol}]: {e}")
             return None
 
+    # ─── Analyst Calls ───
+
+    async def _call_analyst_cached(
+        self,
+        cache_key: str,
+        make_coro: Callable[[], Awaitable[CouncilMessage]],
+        **fallback,
+    ) -> tuple[CouncilMessage, bool]:
+        """완전 일치 캐시 조회 후 미스일 때만 분석가 호출.
+
+        make_coro는 캐시 미스이고 같은 키의 호출이 진행 중이 아닐 때만 호출된다
+        (불필요한 코루틴 생성 방지, 동시 중복 호출은 single_flight로 합침).
+        타임아웃·오류 응답은 캐시하지 않는다.
+        """
+        cached = analyst_response_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"분석가 응답 캐시 적중: {cached.speaker}")
+            return cached, True
+
+        msg, ok = await call_analyst_with_timeout(
+            analyst_response_cache.single_flight(cache_key, make_coro), **fallback,
+        )
+        if ok and not (msg.data or {}).get("error"):
+            analyst_response_cache.put(cache_key, msg)
+        return msg, ok
+
+    # ─── Consensus ───
+
+    def _agreed_consensus(
+        self,
+        quant_percent: float,
+        fundamental_percent: float,
+        quant_score: float,
+        fundamental_score: float,
+        advocate_data: Optional[dict],
+    ) -> Optional[CouncilMessage]:
+        """두 분석가 의견이 일치하면 LLM 없이 합의 메시지 생성.
+
+        비율 차이가 consensus_max_spread 이하이고 두 점수 모두
+        consensus_min_score 이상이며 반대론자 리스크가 높지 않을 때만
+        평균을 채택한다. 그 외에는 None (LLM 합의 라운드 진행).
+        """
+        if abs(quant_percent - fundamental_percent) > self.consensus_max_spread:
+            return None
+        if min(quant_score, fundamental_score) < self.consensus_min_score:
+            return None
+        risk_score = (advocate_data or {}).get("risk_score", 5)
+        if not isinstance(risk_score, (int, float)) or risk_score >= self.consensus_max_risk:
+            return None
+
+        avg_percent = (quant_percent + fundamental_percent) / 2
+        return CouncilMessage(
+            role=AnalystRole.MODERATOR,
+            speaker="회의 중재자",
+            content=(
+                f"⚖️ **최종 합의**\n\n"
+                f"양 분석가 의견 일치 ({quant_percent}%, {fundamental_percent}%) — 평균 채택\n\n"
+                f"• 최종 투자 비율: {avg_percent:.1f}%"
+            ),
+            data={"suggested_percent": avg_percent, "holding_days": 7, "agreed": True},
+        )
+
+    async def _close_without_price(self, meeting: CouncilMeeting) -> CouncilMeeting:
+        """현재가 미확보 회의를 분석가 호출 없이 HOLD로 종료"""
+        logger.warning(f"[{meeting.symbol}] 현재가 정보 없음 — AI 회의 생략, HOLD 처리")
+        signal = InvestmentSignal(
+            symbol=meeting.symbol,
+            company_name=meeting.company_name,
+            action=TradeAction.HOLD.value,
+            consensus_reason="가격 정보 없음",
+        )
+        meeting.add_message(CouncilMessage(
+            role=AnalystRole.MODERATOR,
+            speaker="회의 중재자",
+            content="⚠️ **회의 생략**\n\n현재가 정보를 확인할 수 없어 매매 수량을 산정할 수 없습니다. HOLD로 처리합니다.",
+            data=signal.to_dict(),
+        ))
+        meeting.signal = signal
+        meeting.ended_at = datetime.now()
+        self.add_meeting(meeting)
+        await self._notify_meeting_update(meeting)
+        return meeting
+
     # ─── BUY Meeting ───
 
     async def start_meeting(
@@ -163,13 +271,19 @@ class CouncilOrchestrator:
             trigger_source=trigger_source,
         )
 
-        # 0. 키움증권에서 실제 차트 데이터 조회
-        technical_data = await self._fetch_technical_data(symbol)
-        financial_data = await self._fetch_financial_data(symbol)
+        # 0. 키움증권 차트 데이터와 DART 재무제표를 동시에 조회 (서로 독립)
+        technical_data, financial_data = await asyncio.gather(
+            self._fetch_technical_data(symbol),
+            self._fetch_financial_data(symbol),
+        )
 
         if technical_data and technical_data.current_price > 0:
             current_price = technical_data.current_price
 
+        # 가격 정보가 없으면 수량 산정이 불가 → LLM 호출 전에 HOLD로 종료
+        if current_price <= 0 and not self.allow_zero_price_analysis:
+            return await self._close_without_price(meeting)
+
         # 1. 회의 소집 메시지
         chart_status = "📈 키움증권 실시간 데이터" if technical_data else "⚠️ 차트 데이터 없음"
         dart_status = "📋 DART 재무제표" if financial_data else "⚠️ 재무제표 없음"
@@ -230,15 +344,29 @@ AI 회의를 통해 투자 여부를 최종 결정합니다.
         # 2. 라운드 1: 초기 분석
         meeting.current_round = 1
 
+        # 응답 캐시 키에 포함할 입력 데이터 맥락
+        tech_context = technical_data.to_prompt_text() if technical_data else ""
+        fin_context = financial_data.to_prompt_text() if financial_data else ""
+        trigger_context = (
+            json.dumps(quant_triggers, sort_keys=True, default=str)
+            if trigger_source == "quant" else ""
+        )
+
         # GPT 퀀트 분석
-        quant_msg, quant_ok = await call_analyst_with_timeout(
-            quant_analyst.analyze(
+        quant_msg, quant_ok = await self._call_analyst_cached(
+            analyst_response_cache.make_key(
+                AnalystRole.GPT_QUANT.value, symbol, news_title, meeting.messages,
+                tech_context, trigger_context,
+            ),
+            lambda: quant_analyst.analyze(
                 symbol=symbol,
                 company_name=company_name,
                 news_title=news_title,
                 previous_messages=meeting.messages,
+                conversation=meeting.conversation_text(),
                 technical_data=technical_data,
                 quant_trigger_data=quant_triggers if trigger_source == "quant" else None,
+                stream=True,
             ),
             fallback_role=AnalystRole.GPT_QUANT,
             fallback_speaker="퀀트 분석가",
@@ -253,12 +381,17 @@ AI 회의를 통해 투자 여부를 최종 결정합니다.
         quant_score = quant_msg.data.get("score", 5) if quant_msg.data else 5
 
         # Claude 펀더멘털 분석
-        fundamental_msg, fund_ok = await call_analyst_with_timeout(
-            fundamental_analyst.analyze(
+        fundamental_msg, fund_ok = await self._call_analyst_cached(
+            analyst_response_cache.make_key(
+                AnalystRole.CLAUDE_FUNDAMENTAL.value, symbol, news_title, meeting.messages,
+                fin_context,
+            ),
+            lambda: fundamental_analyst.analyze(
                 symbol=symbol,
                 company_name=company_name,
                 news_title=news_title,
                 previous_messages=meeting.messages,
+                conversation=meeting.conversation_text(),
                 financial_data=financial_data,
             ),
             fallback_role=AnalystRole.CLAUDE_FUNDAMENTAL,
@@ -276,8 +409,12 @@ AI 회의를 통해 투자 여부를 최종 결정합니다.
         # 3. 라운드 2: 반대론자 도전
         meeting.current_round = 2
 
-        advocate_msg, adv_ok = await call_analyst_with_timeout(
-            devils_advocate.challenge(
+        advocate_msg, adv_ok = await self._call_analyst_cached(
+            analyst_response_cache.make_key(
+                AnalystRole.GPT_DEVILS_ADVOCATE.value, symbol, news_title, meeting.messages,
+                tech_context, fin_context,
+            ),
+            lambda: devils_advocate.challenge(
                 symbol=symbol,
                 company_name=company_name,
                 news_title=news_title,
@@ -296,23 +433,40 @@ AI 회의를 통해 투자 여부를 최종 결정합니다.
         # 4. 라운드 3: 최종 판결 (Opus)
         meeting.current_round = 3
 
-        consensus_msg, cons_ok = await call_analyst_with_timeout(
-            fundamental_analyst.propose_consensus(
-                symbol=symbol,
-                company_name=company_name,
-                news_title=news_title,
-                previous_messages=meeting.messages,
-                quant_percent=quant_percent,
-                fundamental_percent=fundamental_percent,
-            ),
-            fallback_role=AnalystRole.CLAUDE_FUNDAMENTAL,
-            fallback_speaker="최종 합의",
-            fallback_content="[시스템 경고] 의견 통합 과정 지연으로 양측 분석가 의견의 산술 평균을 최종 비율로 적용합니다.",
-            fallback_data={"suggested_percent": (quant_percent + fundamental_percent) / 2},
+        consensus_msg = self._agreed_consensus(
+            quant_percent, fundamental_percent, quant_score, fundamental_score,
+            advocate_msg.data,
         )
-        meeting.add_message(consensus_msg)
-        if cons_ok:
+        if consensus_msg is not None:
+            logger.info(
+                f"[{symbol}] 분석가 의견 일치 — 합의 LLM 호출 생략 "
+                f"({quant_percent}% / {fundamental_percent}%)"
+            )
+            meeting.add_message(consensus_msg)
             await self._notify_meeting_update(meeting)
+        else:
+            consensus_msg, cons_ok = await self._call_analyst_cached(
+                analyst_response_cache.make_key(
+                    "consensus", symbol, news_title, meeting.messages,
+                    str(quant_percent), str(fundamental_percent),
+                ),
+                lambda: fundamental_analyst.propose_consensus(
+                    symbol=symbol,
+                    company_name=company_name,
+                    news_title=news_title,
+                    previous_messages=meeting.messages,
+                    conversation=meeting.conversation_text(),
+                    quant_percent=quant_percent,
+                    fundamental_percent=fundamental_percent,
+                ),
+                fallback_role=AnalystRole.CLAUDE_FUNDAMENTAL,
+                fallback_speaker="최종 합의",
+                fallback_content="[시스템 경고] 의견 통합 과정 지연으로 양측 분석가 의견의 산술 평균을 최종 비율로 적용합니다.",
+                fallback_data={"suggested_percent": (quant_percent + fundamental_percent) / 2},
+            )
+            meeting.add_message(consensus_msg)
+            if cons_ok:
+                await self._notify_meeting_update(meeting)
         final_percent = consensus_msg.data.get("suggested_percent", 0) if consensus_msg.data else 0
 
         if final_percent == 0:
@@ -380,23 +534,23 @@ AI 회의를 통해 투자 여부를 최종 결정합니다.
         )
 
         # SELL 시그널 보유 여부 확인
-        if action == "SELL":
+        if action == TradeAction.SELL:
             try:
                 holdings = await kiwoom_client.get_holdings()
                 held_symbols = [h.symbol for h in holdings]
                 if symbol not in held_symbols:
                     logger.info(f"SELL → HOLD 변경: {symbol} 미보유 종목")
-                    action = "HOLD"
+                    action = TradeAction.HOLD
             except Exception as e:
                 logger.warning(f"보유 확인 실패, SELL → HOLD: {symbol} - {e}")
-                action = "HOLD"
+                action = TradeAction.HOLD
 
         # 3중 게이트 (BUY 시그널만)
-        if action == "BUY":
+        if action == TradeAction.BUY:
             gate_result = await check_buy_gates(symbol, suggested_amount)
             if gate_result.blocked:
                 logger.info(f"🚫 게이트 차단: {symbol} — {gate_result.reason}")
-                action = "HOLD"
+                action = TradeAction.HOLD
                 gate_msg = CouncilMessage(
                     role=AnalystRole.MODERATOR,
                     speaker="리스크 관리자",
@@ -413,33 +567,33 @@ AI 회의를 통해 투자 여부를 최종 결정합니다.
         signal = InvestmentSignal(
             symbol=symbol,
             company_name=company_name,
-            action=action,
+            action=action.value,
             allocation_percent=abs(final_percent),
             suggested_amount=suggested_amount,
             suggested_quantity=suggested_quantity,
             target_price=clamp_target_price(target_price, current_price),
             stop_loss_price=clamp_stop_loss(stop_loss, current_price),
-            quant_summary=quant_msg.content[:100] + "..." if len(quant_msg.content) > 100 else quant_msg.content,
-            fundamental_summary=fundamental_msg.content[:100] + "..." if len(fundamental_msg.content) > 100 else fundamental_msg.content,
-            consensus_reason=consensus_msg.content[:200] + "..." if len(consensus_msg.content) > 200 else consensus_msg.content,
+            quant_summary=_trunc(quant_msg.content, 100),
+            fundamental_summary=_trunc(fundamental_msg.content, 100),
+            consensus_reason=_trunc(consensus_msg.content, 200),
             confidence=confidence,
             quant_score=quant_score,
             fundamental_score=fundamental_score,
         )
 
         # quantity=0이면 HOLD 전환
-        if action in ("BUY", "SELL") and signal.suggested_quantity <= 0:
+        if action in (TradeAction.BUY, TradeAction.SELL) and signal.suggested_quantity <= 0:
             logger.info(
                 f"HOLD 전환: {symbol} quantity=0 "
                 f"(투자금액 {suggested_amount:,}원 < 1주 가격 {current_price:,}원)"
             )
-            signal.action = "HOLD"
-            action = "HOLD"
+            signal.action = TradeAction.HOLD.value
+            action = TradeAction.HOLD
 
-        if action == "HOLD":
+        if action == TradeAction.HOLD:
             signal.status = SignalStatus.PENDING
         elif self.auto_execute and confidence >= self.min_confidence:
-            if action == "BUY":
+            if action == TradeAction.BUY:
                 try:
                     balance = await kiwoom_client.get_balance()
                     if balance.available_amount < signal.suggested_amount:
@@ -454,7 +608,7 @@ AI 회의를 통해 투자 여부를 최종 결정합니다.
 
             if can_trade or not self.respect_trading_hours:
                 try:
-                    side = OrderSide.BUY if action == "BUY" else OrderSide.SELL
+                    side = OrderSide.BUY if action == TradeAction.BUY else OrderSide.SELL
                     order_result = await kiwoom_client.place_order(
                         symbol=symbol,
                         side=side,
@@ -464,6 +618,7 @@ AI 회의를 통해 투자 여부를 최종 결정합니다.
                     )
 
                     if order_result.status == "submitted":
+                        invalidate_account_snapshot()
                         signal.status = SignalStatus.AUTO_EXECUTED
                         signal.executed_at = get_kst_now()
                         logger.info(
@@ -498,14 +653,14 @@ AI 회의를 통해 투자 여부를 최종 결정합니다.
 
         # 6. 최종 결론 메시지
         price_info = ""
-        if signal.action == "BUY" and entry_price:
+        if signal.action == TradeAction.BUY and entry_price:
             price_info = f"""
 📍 매매 전략:
 • 진입가: {entry_price:,}원
 • 손절가: {stop_loss:,}원
 • 목표가: {target_price:,}원"""
 
-        if signal.action == "BUY":
+        if signal.action == TradeAction.BUY:
             deadline_info = f"⏰ 보유 기한: {holding_deadline.strftime('%Y-%m-%d')} ({holding_days}일, 목표가 미달 시 자동 매도)"
         else:
             deadline_info = ""
@@ -543,7 +698,7 @@ AI 회의를 통해 투자 여부를 최종 결정합니다.
             signal,
             trigger_source=meeting.trigger_source,
             trigger_details=quant_triggers,
-            holding_deadline=holding_deadline if signal.action == "BUY" else None,
+            holding_deadline=holding_deadline if signal.action == TradeAction.BUY else None,
         )
 
         logger.info(f"AI 회의 완료: {company_name} - {signal.action} {signal.allocation_percent}%")
@@ -553,7 +708,11 @@ AI 회의를 통해 투자 여부를 최종 결정합니다.
     # ─── State Mutation Interface ───
 
     def add_meeting(self, meeting: CouncilMeeting) -> None:
+        if len(self._meetings) == self._meetings.maxlen:
+            evicted = self._meetings[0]
+            self._meetings_by_id.pop(evicted.id, None)
         self._meetings.append(meeting)
+        self._meetings_by_id[meeting.id] = meeting
 
     def add_pending_signal(self, signal: InvestmentSignal) -> None:
         self._pending_signals.append(signal)
@@ -562,7 +721,13 @@ AI 회의를 통해 투자 여부를 최종 결정합니다.
         self._queued_executions.append(signal)
 
     def set_queued_executions(self, signals: List[InvestmentSignal]) -> None:
-        self._queued_executions = signals
+        self._queued_executions = deque(signals)
+
+    def pop_queued_execution(self) -> InvestmentSignal:
+        return self._queued_executions.popleft()
+
+    def queued_execution_count(self) -> int:
+        return len(self._queued_executions)
 
     def iter_pending_signals(self) -> List[InvestmentSignal]:
         return list(self._pending_signals)
@@ -573,16 +738,16 @@ AI 회의를 통해 투자 여부를 최종 결정합니다.
         return [s for s in self._pending_signals if s.status == SignalStatus.PENDING]
 
     def get_meeting(self, meeting_id: str) -> Optional[CouncilMeeting]:
-        for meeting in self._meetings:
-            if meeting.id == meeting_id:
-                return meeting
-        return None
+        return self._meetings_by_id.get(meeting_id)
 
     def get_recent_meetings(self, limit: int = 10) -> List[CouncilMeeting]:
-        return self._meetings[-limit:]
+        # 뒤에서부터 limit개만 훑고 삽입 순서로 되돌린다
+        recent = list(islice(reversed(self._meetings), max(limit, 0)))
+        recent.reverse()
+        return recent
 
     def get_queued_executions(self) -> List[InvestmentSignal]:
-        return self._queued_executions.copy()
+        return list(self._queued_executions)
 
     def get_trading_status(self) -> dict:
         session = trading_hours.get_market_session()
@@ -607,42 +772,42 @@ AI 회의를 통해 투자 여부를 최종 결정합니다.
     # ─── Delegated to order_executor ───
 
     async def approve_signal(self, signal_id: str) -> Optional[InvestmentSignal]:
-        from .order_executor import approve_signal
-        return await approve_signal(self, signal_id)
+        return await order_executor.approve_signal(self, signal_id)
 
     async def reject_signal(self, signal_id: str) -> Optional[InvestmentSignal]:
-        from .order_executor import reject_signal
-        return await reject_signal(self, signal_id)
+        return await order_executor.reject_signal(self, signal_id)
 
     async def execute_signal(self, signal_id: str) -> Optional[InvestmentSignal]:
-        from .order_executor import execute_signal
-        return await execute_signal(self, signal_id)
+        return await order_executor.execute_signal(self, signal_id)
 
     async def process_queued_executions(self):
-        from .order_executor import process_queued_executions
-        return await process_queued_executions(self)
+        return await order_executor.process_queued_executions(self)
 
     async def _persist_signal_to_db(self, signal, **kwargs):
-        from .order_executor import persist_signal_to_db
-        return await persist_signal_to_db(self, signal, **kwargs)
+        return await order_executor.persist_signal_to_db(self, signal, **kwargs)
 
     async def restore_pending_signals(self):
-        from .order_executor import restore_pending_signals
-        return await restore_pending_signals(self)
+        return await order_executor.restore_pending_signals(self)
 
     async def _update_signal_status_in_db(self, signal, **kwargs):
-        from .order_executor import update_signal_status_in_db
-        return await update_signal_status_in_db(self, signal, **kwargs)
+        return await order_executor.update_signal_status_in_db(self, signal, **kwargs)
 
     # ─── Delegated to sell_meeting ───
 
     async def start_sell_meeting(self, **kwargs) -> CouncilMeeting:
-        from .sell_meeting import run_sell_meeting
-        return await run_sell_meeting(self, **kwargs)
+        return await sell_meeting.run_sell_meeting(self, **kwargs)
 
     async def start_rebalance_review(self, **kwargs) -> Optional[dict]:
-        from .sell_meeting import run_rebalance_review
-        return await run_rebalance_review(self, **kwargs)
+        return await sell_meeting.run_rebalance_review(self, **kwargs)
+
+    async def start_rebalance_reviews(self, holdings: list[dict]) -> dict[str, Optional[dict]]:
+        return await sell_meeting.run_rebalance_reviews(self, holdings)
+
+    async def submit_rebalance_batch(self, holdings: list[dict]) -> Optional[tuple[str, dict]]:
+        return await sell_meeting.submit_rebalance_batch(self, holdings)
+
+    async def collect_rebalance_batch(self, batch_id: str, contexts: dict) -> Optional[dict[str, Optional[dict]]]:
+        return await sell_meeting.collect_rebalance_batch(batch_id, contexts)
 
 
 # 싱글톤 인스턴스
@@ -10,8 +10,9 @@ from typing import Optional, List
 
 from app.core.audit import log_signal_event_async
 from app.services.kiwoom.rest_client import kiwoom_client, OrderSide, OrderType
-from .models import InvestmentSignal, SignalStatus
+from .models import InvestmentSignal, SignalStatus, TradeAction
 from .trading_hours import trading_hours, get_kst_now
+from .risk_gate import invalidate_account_snapshot
 from app.services.trading_service import trading_service
 
 logger = logging.getLogger(__name__)
@@ -25,12 +26,12 @@ async def approve_signal(orch, signal_id: str) -> Optional[InvestmentSignal]:
             logger.info(f"시그널 승인됨: {signal.symbol} {signal.action}")
             await update_signal_status_in_db(orch, signal)
 
-            if signal.action in ["BUY", "SELL"]:
+            if signal.action in (TradeAction.BUY, TradeAction.SELL):
                 can_trade, reason = trading_hours.can_execute_order()
 
                 if can_trade or not orch.respect_trading_hours:
                     try:
-                        side = OrderSide.BUY if signal.action == "BUY" else OrderSide.SELL
+                        side = OrderSide.BUY if signal.action == TradeAction.BUY else OrderSide.SELL
                         order_result = await kiwoom_client.place_order(
                             symbol=signal.symbol,
                             side=side,
@@ -40,6 +41,7 @@ async def approve_signal(orch, signal_id: str) -> Optional[InvestmentSignal]:
                         )
 
                         if order_result.status == "submitted":
+                            invalidate_account_snapshot()
                             signal.status = SignalStatus.EXECUTED
                             signal.executed_at = get_kst_now()
                             logger.info(
@@ -48,7 +50,7 @@ async def approve_signal(orch, signal_id: str) -> Optional[InvestmentSignal]:
                             )
                             await log_signal_event_async(
                                 "order_executed", signal.symbol, signal.action,
-                                signal_id=getattr(signal, "_db_id", None),
+                                signal_id=signal.db_id,
                                 details={"order_no": order_result.order_no},
                             )
                             await update_signal_status_in_db(orch, signal, executed=True)
@@ -98,7 +100,7 @@ async def execute_signal(orch, signal_id: str) -> Optional[InvestmentSignal]:
                 return signal
 
             try:
-                side = OrderSide.BUY if signal.action == "BUY" else OrderSide.SELL
+                side = OrderSide.BUY if signal.action == TradeAction.BUY else OrderSide.SELL
                 order_result = await kiwoom_client.place_order(
                     symbol=signal.symbol,
                     side=side,
@@ -108,6 +110,7 @@ async def execute_signal(orch, signal_id: str) -> Optional[InvestmentSignal]:
                 )
 
                 if order_result.status == "submitted":
+                    invalidate_account_snapshot()
                     signal.status = SignalStatus.EXECUTED
                     signal.executed_at = get_kst_now()
                     logger.info(
@@ -116,7 +119,7 @@ async def execute_signal(orch, signal_id: str) -> Optional[InvestmentSignal]:
                     )
                     await log_signal_event_async(
                         "order_executed", signal.symbol, signal.action,
-                        signal_id=getattr(signal, "_db_id", None),
+                        signal_id=signal.db_id,
                         details={"order_no": order_result.order_no},
                     )
                     await update_signal_status_in_db(orch, signal, executed=True)
@@ -141,7 +144,6 @@ async def process_queued_executions(orch) -> List[InvestmentSignal]:
         return []
 
     executed: List[InvestmentSignal] = []
-    remaining: List[InvestmentSignal] = []
 
     available_balance = None
     try:
@@ -150,55 +152,64 @@ async def process_queued_executions(orch) -> List[InvestmentSignal]:
     except Exception as e:
         logger.warning(f"잔고 조회 실패, 잔고 체크 없이 진행: {e}")
 
-    for signal in orch.get_queued_executions():
-        if signal.status in (SignalStatus.QUEUED, SignalStatus.PENDING, SignalStatus.APPROVED):
-            if signal.action == "BUY" and available_balance is not None:
-                if available_balance < signal.suggested_amount:
-                    logger.warning(
-                        f"잔고 부족 — 시그널 취소: {signal.symbol} "
-                        f"(필요 {signal.suggested_amount:,}원 > 가용 {available_balance:,}원)"
+    # 대기 큐 일괄 처리 동안 DB 세션(커넥션) 하나를 재사용
+    from app.core.database import async_session_maker
+
+    async with async_session_maker() as session:
+        # 이번 틱 시작 시점의 큐 항목만 한 번씩 처리. 실패 건은 뒤로 다시 넣고,
+        # 처리 중 새로 들어온 시그널은 그대로 다음 틱으로 남는다.
+        for _ in range(orch.queued_execution_count()):
+            signal = orch.pop_queued_execution()
+            if signal.status in (SignalStatus.QUEUED, SignalStatus.PENDING, SignalStatus.APPROVED):
+                if signal.action == TradeAction.BUY and available_balance is not None:
+                    if available_balance < signal.suggested_amount:
+                        logger.warning(
+                            f"잔고 부족 — 시그널 취소: {signal.symbol} "
+                            f"(필요 {signal.suggested_amount:,}원 > 가용 {available_balance:,}원)"
+                        )
+                        await update_signal_status_in_db(
+                            orch, signal, executed=False, cancelled=True, session=session,
+                        )
+                        continue
+
+                try:
+                    side = OrderSide.BUY if signal.action == TradeAction.BUY else OrderSide.SELL
+                    order_result = await kiwoom_client.place_order(
+                        symbol=signal.symbol,
+                        side=side,
+                        quantity=signal.suggested_quantity,
+                        price=0,
+                        order_type=OrderType.MARKET,
                     )
-                    await update_signal_status_in_db(orch, signal, executed=False, cancelled=True)
-                    continue
 
-            try:
-                side = OrderSide.BUY if signal.action == "BUY" else OrderSide.SELL
-                order_result = await kiwoom_client.place_order(
-                    symbol=signal.symbol,
-                    side=side,
-                    quantity=signal.suggested_quantity,
-                    price=0,
-                    order_type=OrderType.MARKET,
-                )
-
-                if order_result.status == "submitted":
-                    signal.status = SignalStatus.AUTO_EXECUTED
-                    signal.executed_at = get_kst_now()
-                    executed.append(signal)
-                    logger.info(
-                        f"✅ 대기 큐 체결: {signal.symbol} {signal.action} "
-                        f"{signal.suggested_quantity}주 (주문번호: {order_result.order_no})"
-                    )
-                    await log_signal_event_async(
-                        "order_executed", signal.symbol, signal.action,
-                        signal_id=getattr(signal, "_db_id", None),
-                        details={"order_no": order_result.order_no, "source": "queue"},
-                    )
-                    await orch._notify_signal(signal)
-                    await update_signal_status_in_db(orch, signal, executed=True)
-                else:
-                    logger.error(
-                        f"❌ 대기 큐 주문 실패: {signal.symbol} - {order_result.message}"
-                    )
-                    remaining.append(signal)
+                    if order_result.status == "submitted":
+                        invalidate_account_snapshot()
+                        signal.status = SignalStatus.AUTO_EXECUTED
+                        signal.executed_at = get_kst_now()
+                        executed.append(signal)
+                        logger.info(
+                            f"✅ 대기 큐 체결: {signal.symbol} {signal.action} "
+                            f"{signal.suggested_quantity}주 (주문번호: {order_result.order_no})"
+                        )
+                        await log_signal_event_async(
+                            "order_executed", signal.symbol, signal.action,
+                            signal_id=signal.db_id,
+                            details={"order_no": order_result.order_no, "source": "queue"},
+                        )
+                        await orch._notify_signal(signal)
+                        await update_signal_status_in_db(orch, signal, executed=True, session=session)
+                    else:
+                        logger.error(
+                            f"❌ 대기 큐 주문 실패: {signal.symbol} - {order_result.message}"
+                        )
+                        orch.queue_execution(signal)
 
-            except Exception as e:
-                logger.error(f"❌ 대기 큐 체결 실패: {signal.symbol} - {e}")
-                remaining.append(signal)
-        else:
-            remaining.append(signal)
+                except Exception as e:
+                    logger.error(f"❌ 대기 큐 체결 실패: {signal.symbol} - {e}")
+                    orch.queue_execution(signal)
+            else:
+                orch.queue_execution(signal)
 
-    orch.set_queued_executions(remaining)
     return executed
 
 
@@ -231,7 +242,7 @@ async def persist_signal_to_db(
             suggested_amount=signal.suggested_amount,
             is_executed=is_executed,
         )
-        signal._db_id = db_id
+        signal.db_id = db_id
         logger.info(f"Council signal → DB: {signal.symbol} {signal.action} (id={db_id})")
     except Exception as e:
         logger.error(f"Council signal DB 저장 실패: {signal.symbol} - {e}")
@@ -240,19 +251,17 @@ async def persist_signal_to_db(
 async def restore_pending_signals(orch) -> None:
     """서버 재시작 시 DB에서 미체결 시그널 복원."""
     try:
-        pending_db_signals = await trading_service.get_pending_signals(limit=50)
-
         restored_queued = 0
         restored_pending = 0
 
-        for s in pending_db_signals:
+        async for s in trading_service.iter_pending_signals(limit=50):
             quantity = s.get("quantity")
             if not quantity or quantity <= 0:
                 logger.debug(f"수량 없는 시그널 스킵: {s['symbol']} (id={s['id']})")
                 continue
 
             action = s["signal_type"].upper()
-            if action == "HOLD":
+            if action == TradeAction.HOLD:
                 continue
 
             confidence = s["strength"] / 100.0
@@ -275,8 +284,8 @@ async def restore_pending_signals(orch) -> None:
                 confidence=confidence,
                 quant_score=s.get("quant_score", 0),
                 fundamental_score=s.get("fundamental_score", 0),
+                db_id=s["id"],
             )
-            signal._db_id = s["id"]
 
             original_status = s.get("signal_status", "")
             if original_status == "queued":
@@ -314,26 +323,42 @@ async def update_signal_status_in_db(
     signal: InvestmentSignal,
     executed: bool = False,
     cancelled: bool = False,
+    session=None,
 ) -> None:
-    """DB 시그널 상태 업데이트."""
-    db_id = getattr(signal, "_db_id", None)
+    """DB 시그널 상태 업데이트.
+
+    session을 넘기면 해당 세션(커넥션)을 재사용한다. 체결 상태가
+    즉시 남도록 시그널마다 커밋한다.
+    """
+    db_id = signal.db_id
     if not db_id:
         return
     try:
         from app.core.database import async_session_maker
         from app.models import TradingSignal as TradingSignalModel
-        from sqlalchemy import select
-
-        async with async_session_maker() as session:
-            result = await session.execute(
-                select(TradingSignalModel).where(TradingSignalModel.id == db_id)
+        from sqlalchemy import update
+
+        # 단일 UPDATE (SELECT 왕복 없음). 일치하는 행이 없으면 no-op.
+        stmt = (
+            update(TradingSignalModel)
+            .where(TradingSignalModel.id == db_id)
+            .values(
+                is_executed=executed,
+                signal_status="cancelled" if cancelled else signal.status.value,
             )
-            db_signal = result.scalar_one_or_none()
-            if db_signal:
-                db_signal.is_executed = executed
-                db_signal.signal_status = (
-                    "cancelled" if cancelled else signal.status.value
-                )
+        )
+
+        if session is not None:
+            try:
+                await session.execute(stmt)
                 await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+            return
+
+        async with async_session_maker() as own_session:
+            await own_session.execute(stmt)
+            await own_session.commit()
     except Exception as e:
         logger.error(f"DB 시그널 상태 업데이트 실패 (id={db_id}): {e}")
@@ -7,17 +7,161 @@
 - 뉴스 기반 리스크 평가
 """
 
+import heapq
 import logging
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Tuple
 from dataclasses import dataclass, field
+from operator import attrgetter
+
+import numpy as np
 
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass
+# 매도 긴급도 코드 (SellSignalReason.urgency)
+URGENCY_LOW = 0
+URGENCY_MEDIUM = 1
+URGENCY_HIGH = 2
+URGENCY_CRITICAL = 3
+
+URGENCY_NAMES = ("low", "medium", "high", "critical")
+
+# 긴급도 코드별 점수 가중치
+_URGENCY_WEIGHT_TUPLE = (0.5, 1.0, 2.0, 3.0)
+_URGENCY_WEIGHTS = np.array(_URGENCY_WEIGHT_TUPLE, dtype=np.float64)
+
+# 이 개수 이하의 이유는 numpy 호출 오버헤드보다 루프가 빠름
+_SMALL_REASON_COUNT = 4
+
+# 매도 점수 상한
+MAX_SELL_SCORE = 10.0
+
+_BY_SCORE = attrgetter("total_score")
+
+
+# 일괄 점수 계산용 매도 이유 레코드 (포지션 순번, 긴급도 코드, 신뢰도)
+_REASON_DT = np.dtype([
+    ("owner", np.int32),
+    ("urgency", np.uint8),
+    ("confidence", np.float64),
+])
+
+
+def _pack_reasons(reasons_list: List[List["SellSignalReason"]]) -> np.ndarray:
+    """포지션별 매도 이유 목록을 _REASON_DT 레코드 배열로 변환"""
+    return np.fromiter(
+        (
+            (owner, r.urgency, r.confidence)
+            for owner, reasons in enumerate(reasons_list)
+            for r in reasons
+        ),
+        dtype=_REASON_DT,
+        count=sum(map(len, reasons_list)),
+    )
+
+
+def _technical_reason(
+    td: "TechnicalSnapshot",
+    *,
+    rsi_oversold: bool,
+    macd_dead: bool,
+    bb_break: bool,
+    ma_bear: bool,
+) -> Optional["SellSignalReason"]:
+    """기술적 지표 악화 조건 → SellSignalReason (조건이 하나도 없으면 None)"""
+    reasons = []
+    if rsi_oversold:
+        reasons.append(f"RSI 과매도 진입({td.rsi_14:.1f})")
+    if macd_dead:
+        reasons.append("MACD 데드크로스 (음의 영역)")
+    if bb_break:
+        reasons.append(f"볼린저밴드 하단 돌파 (하단: {td.bb_lower:,}원)")
+    if ma_bear:
+        reasons.append("20일선 < 60일선 (하락 추세)")
+
+    if not reasons:
+        return None
+    return SellSignalReason(
+        reason_type="technical",
+        description=", ".join(reasons),
+        urgency=URGENCY_MEDIUM,
+        confidence=0.65,
+    )
+
+
+def _action_for_score(total_score: float) -> str:
+    """매도 점수 → 행동"""
+    if total_score >= 8.0:
+        return "SELL"
+    if total_score >= 5.0:
+        return "PARTIAL_SELL"
+    if total_score >= 3.0:
+        return "WATCH"
+    return "HOLD"
+
+
+def _reason_points(reason: "SellSignalReason") -> float:
+    """이유 하나가 매도 점수에 더하는 값"""
+    return _URGENCY_WEIGHT_TUPLE[reason.urgency] * reason.confidence * 2
+
+
+def _stop_loss_reason(pl_rate: float) -> "SellSignalReason":
+    return SellSignalReason(
+        reason_type="stop_loss",
+        description=f"손절선 도달 (수익률: {pl_rate:.1f}%)",
+        urgency=URGENCY_CRITICAL,
+        confidence=0.95,
+    )
+
+
+def _take_profit_reason(pl_rate: float) -> "SellSignalReason":
+    return SellSignalReason(
+        reason_type="take_profit",
+        description=f"익절 목표 도달 (수익률: {pl_rate:.1f}%)",
+        urgency=URGENCY_MEDIUM,
+        confidence=0.85,
+    )
+
+
+def _trailing_stop_reason(drop_from_high: float, highest: int) -> "SellSignalReason":
+    return SellSignalReason(
+        reason_type="trailing_stop",
+        description=f"고점 대비 {drop_from_high:.1f}% 하락 (고점: {highest:,}원)",
+        urgency=URGENCY_HIGH,
+        confidence=0.80,
+    )
+
+
+def _holding_period_reason(holding_days: int) -> "SellSignalReason":
+    return SellSignalReason(
+        reason_type="holding_period",
+        description=f"장기 보유 ({holding_days}일) - 재검토 필요",
+        urgency=URGENCY_LOW,
+        confidence=0.50,
+    )
+
+
+def _overweight_reason(portfolio_weight: float) -> "SellSignalReason":
+    return SellSignalReason(
+        reason_type="overweight",
+        description=f"포트폴리오 비중 과다 ({portfolio_weight:.1f}%)",
+        urgency=URGENCY_MEDIUM,
+        confidence=0.70,
+    )
+
+
+def _news_reason(news_sentiment: float) -> "SellSignalReason":
+    return SellSignalReason(
+        reason_type="news",
+        description=f"부정적 뉴스 감성 (점수: {news_sentiment:.1%})",
+        urgency=URGENCY_MEDIUM,
+        confidence=0.60,
+    )
+
+
+@dataclass(slots=True)
 class PortfolioPosition:
     """보유 포지션"""
     symbol: str
@@ -32,16 +176,57 @@ class PortfolioPosition:
     portfolio_weight: float     # 포트폴리오 비중 (%)
 
 
-@dataclass
+@dataclass(slots=True)
+class TechnicalSnapshot:
+    """기술적 지표 악화 체크용 지표 값 (0 = 데이터 없음)"""
+    rsi_14: float = 0.0
+    macd: float = 0.0
+    macd_signal: float = 0.0
+    bb_lower: float = 0.0
+    ma_20: float = 0.0
+    ma_60: float = 0.0
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "TechnicalSnapshot":
+        """지표 dict에서 생성 (None/누락 키는 0)"""
+        return cls(
+            rsi_14=data.get("rsi_14") or 0.0,
+            macd=data.get("macd") or 0.0,
+            macd_signal=data.get("macd_signal") or 0.0,
+            bb_lower=data.get("bb_lower") or 0.0,
+            ma_20=data.get("ma_20") or 0.0,
+            ma_60=data.get("ma_60") or 0.0,
+        )
+
+
+@dataclass(slots=True)
 class SellSignalReason:
     """매도 시그널 이유"""
     reason_type: str           # stop_loss, take_profit, technical, fundamental, news
     description: str
-    urgency: str               # low, medium, high, critical
+    urgency: int               # URGENCY_LOW ~ URGENCY_CRITICAL
     confidence: float          # 0-1
 
+    # 추천 응답용 직렬화 결과 (생성 시 1회 계산)
+    _dict: dict = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._dict = {
+            "type": self.reason_type,
+            "description": self.description,
+            "urgency": self.urgency_str,
+        }
+
+    @property
+    def urgency_str(self) -> str:
+        """긴급도 이름 (low, medium, high, critical)"""
+        return URGENCY_NAMES[self.urgency]
 
-@dataclass
+    def to_dict(self) -> dict:
+        return self._dict
+
+
+@dataclass(slots=True)
 class PortfolioSellCandidate:
     """매도 후보 종목"""
     position: PortfolioPosition
@@ -49,130 +234,216 @@ class PortfolioSellCandidate:
     total_score: float         # 종합 점수 (높을수록 매도 권장)
     suggested_action: str      # SELL, PARTIAL_SELL, HOLD, WATCH
 
+    # to_recommendation() 결과 캐시
+    _recommendation: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+
+    def to_recommendation(self) -> dict:
+        """매도 추천 항목 (후보는 분석 후 변경되지 않으므로 1회만 생성)"""
+        if self._recommendation is None:
+            self._recommendation = {
+                "symbol": self.position.symbol,
+                "company_name": self.position.company_name,
+                "action": self.suggested_action,
+                "score": self.total_score,
+                "current_price": self.position.current_price,
+                "profit_loss_rate": self.position.profit_loss_rate,
+                "reasons": [r.to_dict() for r in self.reasons],
+            }
+        return self._recommendation
+
 
 class PortfolioAnalyzer:
     """포트폴리오 분석기"""
 
     MAX_HOLDING_DAYS = 90           # 최대 보유 기간 (일)
     MAX_PORTFOLIO_WEIGHT = 30.0     # 최대 포트폴리오 비중 (%)
+    NEGATIVE_NEWS_THRESHOLD = 0.3   # 이 값 미만의 뉴스 감성은 부정적
+    INITIAL_HIGHS_CAPACITY = 1024   # 최고가 배열 초기 크기
 
     def __init__(self):
-        self._highest_prices: Dict[str, int] = {}  # 종목별 최고가 기록
+        # 종목별 최고가 기록: 종목 → 인덱스, 인덱스 → 최고가 (0 = 기록 없음)
+        self._symbol_idx: Dict[str, int] = {}
+        self._highs_arr = np.zeros(self.INITIAL_HIGHS_CAPACITY, dtype=np.int64)
         # config 값 사용 (통일된 손절/익절 기준)
         self.stop_loss_threshold = -settings.stop_loss_percent
         self.take_profit_threshold = settings.take_profit_percent
         self.trailing_stop_rate = 0.7  # 트레일링 스탑 (고점 대비 30% 하락)
 
+    def _symbol_index(self, symbol: str) -> int:
+        """종목 인덱스 조회 (없으면 할당, 배열이 차면 두 배로 확장)"""
+        idx = self._symbol_idx.get(symbol)
+        if idx is None:
+            idx = len(self._symbol_idx)
+            if idx >= len(self._highs_arr):
+                grown = np.zeros(len(self._highs_arr) * 2, dtype=np.int64)
+                grown[:len(self._highs_arr)] = self._highs_arr
+                self._highs_arr = grown
+            self._symbol_idx[symbol] = idx
+        return idx
+
     def update_highest_price(self, symbol: str, price: int):
         """최고가 업데이트"""
-        current_highest = self._highest_prices.get(symbol, 0)
-        if price > current_highest:
-            self._highest_prices[symbol] = price
+        idx = self._symbol_index(symbol)
+        if price > self._highs_arr[idx]:
+            self._highs_arr[idx] = price
             logger.debug(f"[{symbol}] 최고가 갱신: {price:,}원")
 
+    def update_highest_prices(self, positions: List[PortfolioPosition]):
+        """포트폴리오 전체 최고가 일괄 업데이트"""
+        idx = np.fromiter(
+            (self._symbol_index(p.symbol) for p in positions), dtype=np.intp, count=len(positions),
+        )
+        prices = np.fromiter(
+            (p.current_price for p in positions), dtype=np.int64, count=len(positions),
+        )
+        np.maximum.at(self._highs_arr, idx, prices)
+
+    def get_highest_price(self, symbol: str, default: int) -> int:
+        """기록된 최고가 (기록 없으면 default)"""
+        idx = self._symbol_idx.get(symbol)
+        if idx is None or self._highs_arr[idx] <= 0:
+            return default
+        return int(self._highs_arr[idx])
+
+    def get_highs(self, positions: List[PortfolioPosition]) -> np.ndarray:
+        """포지션 순서대로 최고가 배열 (기록 없으면 평균 매입가)"""
+        n = len(positions)
+        idx = np.fromiter(
+            (self._symbol_idx.get(p.symbol, -1) for p in positions), dtype=np.intp, count=n,
+        )
+        avg = np.fromiter((p.avg_price for p in positions), dtype=np.int64, count=n)
+        highs = self._highs_arr[np.maximum(idx, 0)]
+        return np.where((idx >= 0) & (highs > 0), highs, avg)
+
+    # 조건 판정 (스칼라와 numpy 배열 모두 지원 — check_*, _checks_fused, _flag_positions 공용)
+
+    def _hits_stop_loss(self, pl_rate):
+        return pl_rate <= self.stop_loss_threshold
+
+    def _hits_take_profit(self, pl_rate):
+        return pl_rate >= self.take_profit_threshold
+
+    def _hits_trailing_stop(self, highest, avg_price, drop_from_high):
+        # 수익 구간(고점 > 평균 매입가)에서만
+        return (highest > avg_price) & (drop_from_high >= (1 - self.trailing_stop_rate) * 100)
+
+    def _hits_holding_period(self, holding_days):
+        return holding_days >= self.MAX_HOLDING_DAYS
+
+    def _hits_overweight(self, portfolio_weight):
+        return portfolio_weight >= self.MAX_PORTFOLIO_WEIGHT
+
+    def _hits_negative_news(self, news_sentiment):
+        return news_sentiment < self.NEGATIVE_NEWS_THRESHOLD
+
+    def _trailing_drop(self, position: PortfolioPosition) -> Tuple[int, float]:
+        """(기록된 최고가, 고점 대비 하락률 %)"""
+        highest = self.get_highest_price(position.symbol, position.avg_price)
+        if highest <= 0:
+            return highest, 0.0
+        return highest, (highest - position.current_price) / highest * 100
+
     def check_stop_loss(self, position: PortfolioPosition) -> Optional[SellSignalReason]:
         """손절 조건 체크"""
-        if position.profit_loss_rate <= self.stop_loss_threshold:
-            return SellSignalReason(
-                reason_type="stop_loss",
-                description=f"손절선 도달 (수익률: {position.profit_loss_rate:.1f}%)",
-                urgency="critical",
-                confidence=0.95,
-            )
+        if self._hits_stop_loss(position.profit_loss_rate):
+            return _stop_loss_reason(position.profit_loss_rate)
         return None
 
     def check_take_profit(self, position: PortfolioPosition) -> Optional[SellSignalReason]:
         """익절 조건 체크"""
-        if position.profit_loss_rate >= self.take_profit_threshold:
-            return SellSignalReason(
-                reason_type="take_profit",
-                description=f"익절 목표 도달 (수익률: {position.profit_loss_rate:.1f}%)",
-                urgency="medium",
-                confidence=0.85,
-            )
+        if self._hits_take_profit(position.profit_loss_rate):
+            return _take_profit_reason(position.profit_loss_rate)
         return None
 
     def check_trailing_stop(self, position: PortfolioPosition) -> Optional[SellSignalReason]:
         """트레일링 스탑 체크"""
-        highest = self._highest_prices.get(position.symbol, position.avg_price)
-
-        if highest > position.avg_price:  # 수익 구간에서만
-            drop_from_high = (highest - position.current_price) / highest * 100
-
-            if drop_from_high >= (1 - self.trailing_stop_rate) * 100:
-                return SellSignalReason(
-                    reason_type="trailing_stop",
-                    description=f"고점 대비 {drop_from_high:.1f}% 하락 (고점: {highest:,}원)",
-                    urgency="high",
-                    confidence=0.80,
-                )
+        highest, drop_from_high = self._trailing_drop(position)
+        if self._hits_trailing_stop(highest, position.avg_price, drop_from_high):
+            return _trailing_stop_reason(drop_from_high, highest)
         return None
 
     def check_holding_period(self, position: PortfolioPosition) -> Optional[SellSignalReason]:
         """보유 기간 체크"""
-        if position.holding_days >= self.MAX_HOLDING_DAYS:
-            return SellSignalReason(
-                reason_type="holding_period",
-                description=f"장기 보유 ({position.holding_days}일) - 재검토 필요",
-                urgency="low",
-                confidence=0.50,
-            )
+        if self._hits_holding_period(position.holding_days):
+            return _holding_period_reason(position.holding_days)
         return None
 
     def check_overweight(self, position: PortfolioPosition) -> Optional[SellSignalReason]:
         """과대 비중 체크"""
-        if position.portfolio_weight >= self.MAX_PORTFOLIO_WEIGHT:
-            return SellSignalReason(
-                reason_type="overweight",
-                description=f"포트폴리오 비중 과다 ({position.portfolio_weight:.1f}%)",
-                urgency="medium",
-                confidence=0.70,
-            )
+        if self._hits_overweight(position.portfolio_weight):
+            return _overweight_reason(position.portfolio_weight)
         return None
 
     async def check_technical_deterioration(
         self,
         position: PortfolioPosition,
-        technical_data: Optional[dict] = None
+        technical_data: Optional[TechnicalSnapshot] = None
     ) -> Optional[SellSignalReason]:
         """기술적 지표 악화 체크"""
-        if not technical_data:
+        return self._technical_deterioration(position, technical_data)
+
+    def _technical_deterioration(
+        self,
+        position: PortfolioPosition,
+        td: Optional[TechnicalSnapshot],
+    ) -> Optional[SellSignalReason]:
+        """check_technical_deterioration 본체 (동기 경로인 analyze_position과 공용)"""
+        if not td:
             return None
 
-        reasons = []
-
-        # RSI 과매수 이후 하락 전환
-        rsi = technical_data.get("rsi_14")
-        if rsi and rsi < 30 and position.profit_loss_rate < 0:
-            reasons.append(f"RSI 과매도 진입({rsi:.1f})")
-
-        # MACD 데드크로스
-        macd = technical_data.get("macd")
-        macd_signal = technical_data.get("macd_signal")
-        if macd and macd_signal and macd < macd_signal:
-            if macd < 0:  # 음의 영역에서 데드크로스
-                reasons.append("MACD 데드크로스 (음의 영역)")
-
-        # 볼린저밴드 하단 돌파
-        bb_lower = technical_data.get("bb_lower")
-        if bb_lower and position.current_price < bb_lower:
-            reasons.append(f"볼린저밴드 하단 돌파 (하단: {bb_lower:,}원)")
-
-        # 이동평균선 하향 이탈
-        ma_20 = technical_data.get("ma_20")
-        ma_60 = technical_data.get("ma_60")
-        if ma_20 and ma_60:
-            if position.current_price < ma_20 < ma_60:
-                reasons.append("20일선 < 60일선 (하락 추세)")
-
-        if reasons:
-            return SellSignalReason(
-                reason_type="technical",
-                description=", ".join(reasons),
-                urgency="medium",
-                confidence=0.65,
+        price = position.current_price
+        return _technical_reason(
+            td,
+            # RSI 과매수 이후 하락 전환
+            rsi_oversold=bool(td.rsi_14 and td.rsi_14 < 30 and position.profit_loss_rate < 0),
+            # MACD 데드크로스 (음의 영역)
+            macd_dead=bool(td.macd and td.macd_signal and td.macd < td.macd_signal and td.macd < 0),
+            # 볼린저밴드 하단 돌파
+            bb_break=bool(td.bb_lower and price < td.bb_lower),
+            # 이동평균선 하향 이탈
+            ma_bear=bool(td.ma_20 and td.ma_60 and price < td.ma_20 < td.ma_60),
+        )
+
+    def check_technical_deterioration_vectorized(
+        self,
+        positions: List[PortfolioPosition],
+        snapshots: List[Optional[TechnicalSnapshot]],
+    ) -> List[Optional[SellSignalReason]]:
+        """check_technical_deterioration의 포트폴리오 전체 벡터 버전
+
+        지표 값은 배열 마스크로 한 번에 평가하고, 조건에 걸린 행만
+        SellSignalReason을 만든다. snapshots[i]가 None이면 데이터 없음.
+        """
+        n = len(positions)
+        results: List[Optional[SellSignalReason]] = [None] * n
+        if n == 0:
+            return results
+
+        empty = TechnicalSnapshot()
+        rows = [s or empty for s in snapshots]
+
+        def column(name: str) -> np.ndarray:
+            return np.fromiter((getattr(r, name) for r in rows), dtype=np.float64, count=n)
+
+        rsi, macd, macd_sig = column("rsi_14"), column("macd"), column("macd_signal")
+        bb_lower, ma_20, ma_60 = column("bb_lower"), column("ma_20"), column("ma_60")
+        cur = np.fromiter((p.current_price for p in positions), dtype=np.float64, count=n)
+        pl = np.fromiter((p.profit_loss_rate for p in positions), dtype=np.float64, count=n)
+
+        # (N, 4) 조건 행렬 — 0 값은 데이터 없음으로 취급
+        flags = np.column_stack((
+            (rsi != 0) & (rsi < 30) & (pl < 0),
+            (macd != 0) & (macd_sig != 0) & (macd < macd_sig) & (macd < 0),
+            (bb_lower != 0) & (cur < bb_lower),
+            (ma_20 != 0) & (ma_60 != 0) & (cur < ma_20) & (ma_20 < ma_60),
+        ))
+
+        for i in np.flatnonzero(flags.any(axis=1)).tolist():
+            rsi_hit, macd_hit, bb_hit, ma_hit = flags[i].tolist()
+            results[i] = _technical_reason(
+                rows[i], rsi_oversold=rsi_hit, macd_dead=macd_hit, bb_break=bb_hit, ma_bear=ma_hit,
             )
-        return None
+        return results
 
     def analyze_position(
         self,
@@ -185,104 +456,215 @@ class PortfolioAnalyzer:
         # 최고가 업데이트
         self.update_highest_price(position.symbol, position.current_price)
 
-        reasons: List[SellSignalReason] = []
-
-        # 각종 체크
-        stop_loss = self.check_stop_loss(position)
-        if stop_loss:
-            reasons.append(stop_loss)
-
-        take_profit = self.check_take_profit(position)
-        if take_profit:
-            reasons.append(take_profit)
+        technical = None
+        if technical_data:
+            technical = self._technical_deterioration(
+                position, TechnicalSnapshot.from_dict(technical_data),
+            )
+        return self._build_candidate(position, news_sentiment, technical)
 
-        trailing_stop = self.check_trailing_stop(position)
-        if trailing_stop:
-            reasons.append(trailing_stop)
+    def _checks_fused(
+        self,
+        position: PortfolioPosition,
+        news_sentiment: Optional[float] = None,
+        technical: Optional[SellSignalReason] = None,
+    ) -> List[SellSignalReason]:
+        """check_* 조건을 한 번에 평가 (check_*와 같은 판정·이유 헬퍼를 같은 순서로 사용)
+
+        누적 점수가 상한(MAX_SELL_SCORE)에 도달하면 이후 조건은 점수와 행동을
+        바꿀 수 없으므로 평가를 중단한다.
+        """
+        reasons: List[SellSignalReason] = []
+        score = 0.0
+        pl_rate = position.profit_loss_rate
+
+        # 손절 / 익절
+        if self._hits_stop_loss(pl_rate):
+            reasons.append(_stop_loss_reason(pl_rate))
+            score += _reason_points(reasons[-1])
+        if self._hits_take_profit(pl_rate):
+            reasons.append(_take_profit_reason(pl_rate))
+            score += _reason_points(reasons[-1])
+
+        # 트레일링 스탑 (수익 구간에서만)
+        highest, drop_from_high = self._trailing_drop(position)
+        if self._hits_trailing_stop(highest, position.avg_price, drop_from_high):
+            reasons.append(_trailing_stop_reason(drop_from_high, highest))
+            score += _reason_points(reasons[-1])
+            if score >= MAX_SELL_SCORE:
+                return reasons
+
+        # 보유 기간
+        if self._hits_holding_period(position.holding_days):
+            reasons.append(_holding_period_reason(position.holding_days))
+            score += _reason_points(reasons[-1])
+            if score >= MAX_SELL_SCORE:
+                return reasons
+
+        # 과대 비중
+        if self._hits_overweight(position.portfolio_weight):
+            reasons.append(_overweight_reason(position.portfolio_weight))
+            score += _reason_points(reasons[-1])
+            if score >= MAX_SELL_SCORE:
+                return reasons
+
+        if technical:
+            reasons.append(technical)
+            score += _reason_points(technical)
+            if score >= MAX_SELL_SCORE:
+                return reasons
 
-        holding_period = self.check_holding_period(position)
-        if holding_period:
-            reasons.append(holding_period)
+        # 뉴스 감성 체크
+        if news_sentiment is not None and self._hits_negative_news(news_sentiment):
+            reasons.append(_news_reason(news_sentiment))
 
-        overweight = self.check_overweight(position)
-        if overweight:
-            reasons.append(overweight)
+        return reasons
 
-        # 뉴스 감성 체크
-        if news_sentiment is not None and news_sentiment < 0.3:  # 부정적
-            reasons.append(SellSignalReason(
-                reason_type="news",
-                description=f"부정적 뉴스 감성 (점수: {news_sentiment:.1%})",
-                urgency="medium",
-                confidence=0.60,
-            ))
+    def _build_candidate(
+        self,
+        position: PortfolioPosition,
+        news_sentiment: Optional[float] = None,
+        technical: Optional[SellSignalReason] = None,
+    ) -> PortfolioSellCandidate:
+        """체크 실행 후 매도 후보 생성 (최고가는 호출 전 갱신되어 있어야 함)"""
+        reasons = self._checks_fused(position, news_sentiment, technical)
 
         # 종합 점수 계산
         total_score = self._calculate_sell_score(reasons)
 
-        # 행동 결정
-        if total_score >= 8.0:
-            action = "SELL"
-        elif total_score >= 5.0:
-            action = "PARTIAL_SELL"
-        elif total_score >= 3.0:
-            action = "WATCH"
-        else:
-            action = "HOLD"
-
         return PortfolioSellCandidate(
             position=position,
             reasons=reasons,
             total_score=total_score,
-            suggested_action=action,
+            suggested_action=_action_for_score(total_score),
+        )
+
+    def _flag_positions(
+        self,
+        positions: List[PortfolioPosition],
+        news_sentiment_map: Dict[str, float],
+    ) -> np.ndarray:
+        """조건에 하나라도 걸리는 포지션 인덱스 (포트폴리오 전체 벡터 연산)
+
+        check_*와 같은 _hits_* 판정을 배열 마스크로 평가한다.
+        """
+        n = len(positions)
+        pl = np.fromiter((p.profit_loss_rate for p in positions), dtype=np.float64, count=n)
+        hd = np.fromiter((p.holding_days for p in positions), dtype=np.int64, count=n)
+        pw = np.fromiter((p.portfolio_weight for p in positions), dtype=np.float64, count=n)
+        cur = np.fromiter((p.current_price for p in positions), dtype=np.float64, count=n)
+        avg = np.fromiter((p.avg_price for p in positions), dtype=np.float64, count=n)
+        highest = self.get_highs(positions).astype(np.float64)
+
+        drop_from_high = np.divide(
+            highest - cur, highest, out=np.zeros(n), where=highest > 0,
+        ) * 100
+
+        mask = (
+            self._hits_stop_loss(pl)
+            | self._hits_take_profit(pl)
+            | self._hits_trailing_stop(highest, avg, drop_from_high)
+            | self._hits_holding_period(hd)
+            | self._hits_overweight(pw)
         )
 
+        if news_sentiment_map:
+            news = np.fromiter(
+                (news_sentiment_map.get(p.symbol, np.nan) for p in positions),
+                dtype=np.float64, count=n,
+            )
+            mask |= self._hits_negative_news(news)  # NaN(감성 없음)은 False
+
+        return np.flatnonzero(mask)
+
     def _calculate_sell_score(self, reasons: List[SellSignalReason]) -> float:
         """매도 점수 계산 (0-10)"""
         if not reasons:
             return 0.0
 
-        urgency_weights = {
-            "critical": 3.0,
-            "high": 2.0,
-            "medium": 1.0,
-            "low": 0.5,
-        }
+        if len(reasons) <= _SMALL_REASON_COUNT:
+            total_score = 0.0
+            for reason in reasons:
+                total_score += _URGENCY_WEIGHT_TUPLE[reason.urgency] * reason.confidence
+        else:
+            n = len(reasons)
+            codes = np.fromiter((r.urgency for r in reasons), dtype=np.int8, count=n)
+            confs = np.fromiter((r.confidence for r in reasons), dtype=np.float64, count=n)
+            total_score = float(np.vdot(_URGENCY_WEIGHTS[codes], confs))
+
+        return min(MAX_SELL_SCORE, total_score * 2)  # 스케일링
 
-        total_score = 0.0
-        for reason in reasons:
-            weight = urgency_weights.get(reason.urgency, 1.0)
-            total_score += weight * reason.confidence * 2  # 스케일링
+    def _calculate_sell_scores_bulk(self, buf: np.ndarray, n: int) -> np.ndarray:
+        """여러 포지션의 매도 점수 일괄 계산 (0-10)
 
-        return min(10.0, total_score)
+        Args:
+            buf: _REASON_DT 레코드 배열 (owner = 포지션 순번)
+            n: 포지션 수
+        """
+        points = _URGENCY_WEIGHTS[buf["urgency"]] * buf["confidence"]
+        totals = np.bincount(buf["owner"], weights=points, minlength=n)
+        return np.minimum(totals * 2, MAX_SELL_SCORE)  # 스케일링
 
     async def analyze_portfolio(
         self,
         positions: List[PortfolioPosition],
         technical_data_map: Optional[Dict[str, dict]] = None,
         news_sentiment_map: Optional[Dict[str, float]] = None,
+        top_k: Optional[int] = None,
     ) -> List[PortfolioSellCandidate]:
-        """전체 포트폴리오 분석"""
+        """전체 포트폴리오 분석
+
+        top_k를 지정하면 점수 상위 top_k개만 반환한다 (전체 정렬 생략).
+        """
         technical_data_map = technical_data_map or {}
         news_sentiment_map = news_sentiment_map or {}
 
-        candidates = []
-        for position in positions:
-            technical_data = technical_data_map.get(position.symbol)
-            news_sentiment = news_sentiment_map.get(position.symbol)
-
-            candidate = self.analyze_position(
-                position=position,
-                technical_data=technical_data,
-                news_sentiment=news_sentiment,
+        if not positions:
+            return []
+
+        self.update_highest_prices(positions)
+
+        # 조건에 걸린 포지션 + 기술적 데이터가 있는 포지션만 분석
+        targets = set(self._flag_positions(positions, news_sentiment_map).tolist())
+        if technical_data_map:
+            targets.update(
+                i for i, p in enumerate(positions) if p.symbol in technical_data_map
             )
 
-            # HOLD가 아닌 것만 추가
-            if candidate.suggested_action != "HOLD":
-                candidates.append(candidate)
+        target_positions = [positions[i] for i in sorted(targets)]
+        snapshots = {
+            symbol: TechnicalSnapshot.from_dict(data)
+            for symbol, data in technical_data_map.items() if data
+        }
+        technicals = self.check_technical_deterioration_vectorized(
+            target_positions, [snapshots.get(p.symbol) for p in target_positions],
+        )
+        reasons_list = [
+            self._checks_fused(p, news_sentiment_map.get(p.symbol), technical)
+            for p, technical in zip(target_positions, technicals)
+        ]
+
+        # 점수는 압축 레코드 배열로 일괄 계산
+        scores = self._calculate_sell_scores_bulk(
+            _pack_reasons(reasons_list), len(target_positions),
+        ).tolist()
+
+        # HOLD가 아닌 것만 추가
+        candidates = []
+        for position, reasons, score in zip(target_positions, reasons_list, scores):
+            action = _action_for_score(score)
+            if action != "HOLD":
+                candidates.append(PortfolioSellCandidate(
+                    position=position,
+                    reasons=reasons,
+                    total_score=score,
+                    suggested_action=action,
+                ))
 
         # 점수 순 정렬
-        candidates.sort(key=lambda x: x.total_score, reverse=True)
+        if top_k is not None:
+            return heapq.nlargest(top_k, candidates, key=_BY_SCORE)
+        candidates.sort(key=_BY_SCORE, reverse=True)
 
         return candidates
 
@@ -292,28 +674,11 @@ class PortfolioAnalyzer:
         max_recommendations: int = 5
     ) -> List[dict]:
         """매도 추천 목록 생성"""
-        recommendations = []
-
-        for candidate in candidates[:max_recommendations]:
-            if candidate.suggested_action in ["SELL", "PARTIAL_SELL"]:
-                recommendations.append({
-                    "symbol": candidate.position.symbol,
-                    "company_name": candidate.position.company_name,
-                    "action": candidate.suggested_action,
-                    "score": candidate.total_score,
-                    "current_price": candidate.position.current_price,
-                    "profit_loss_rate": candidate.position.profit_loss_rate,
-                    "reasons": [
-                        {
-                            "type": r.reason_type,
-                            "description": r.description,
-                            "urgency": r.urgency,
-                        }
-                        for r in candidate.reasons
-                    ],
-                })
-
-        return recommendations
+        return [
+            candidate.to_recommendation()
+            for candidate in candidates[:max_recommendations]
+            if candidate.suggested_action in ("SELL", "PARTIAL_SELL")
+        ]
 
 
 # 싱글톤 인스턴스
@@ -11,14 +11,24 @@ v2: 키움증권 실제 차트 데이터 연동
 v3: 독립 시그널 생성 기능 추가 (기술적 지표 기반 자동 매매 트리거)
 """
 
+import asyncio
 import logging
-from typing import Optional, Tuple
-import json
+import math
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
+import orjson
 from openai import AsyncOpenAI
 
 from app.config import settings
 from .models import CouncilMessage, AnalystRole
+from .llm_utils import (
+    build_conversation,
+    get_openai_client,
+    openai_call_slot,
+    parse_llm_json,
+    read_streamed_json,
+)
 from .technical_indicators import TechnicalAnalysisResult
 
 logger = logging.getLogger(__name__)
@@ -41,7 +51,62 @@ class QuantAnalyst:
 - 투자 비율은 총 자금 대비 %로 제안
 - 한국어로 간결하게 답변"""
 
-    ANALYSIS_PROMPT = """다음 종목에 대한 퀀트/기술적 분석을 수행해주세요.
+    # 응답 스키마는 모든 분석 요청에 공통이므로 시스템 메시지에 포함한다.
+    # 매 호출의 메시지 앞부분이 바이트 단위로 동일해야 OpenAI 프롬프트 캐시가 적용됨.
+    RESPONSE_FORMAT = """[응답 형식]
+다음 JSON 형식으로 응답해주세요:
+{
+    "analysis": "기술적 분석 내용 (2-3문장, 제공된 퀀트 트리거 결과와 실제 지표 데이터 기반)",
+    "score": 1-10 사이 점수,
+    "suggested_percent": 제안 투자 비율 (0-100),
+    "reasoning": "투자 비율 산정 근거 (트리거 신호 및 실제 지표값 인용)",
+    "risk_factors": ["리스크 요소 1", "리스크 요소 2"],
+    "entry_price": 권장 진입가 (정수),
+    "stop_loss": 손절가 (정수),
+    "target_price": 목표가 (정수),
+    "reply_to_other": "다른 분석가에게 하고 싶은 말 (선택)"
+}
+기술적 데이터가 제공되지 않은 경우 entry_price, stop_loss, target_price는 생략하세요."""
+
+    ANALYSIS_SYSTEM_PROMPT = SYSTEM_PROMPT + "\n\n" + RESPONSE_FORMAT
+
+    # 구조화 출력 스키마 — 모델이 코드 펜스·설명 없이 단일 JSON 객체만 반환하도록 강제.
+    # strict 모드는 모든 필드가 required여야 하므로 선택 필드는 null 허용으로 둔다.
+    RESPONSE_SCHEMA = {
+        "type": "json_schema",
+        "json_schema": {
+            "name": "quant_analysis",
+            "strict": True,
+            "schema": {
+                "type": "object",
+                "properties": {
+                    "analysis": {"type": "string"},
+                    "score": {"type": "number"},
+                    "suggested_percent": {"type": "number"},
+                    "reasoning": {"type": "string"},
+                    "risk_factors": {"type": "array", "items": {"type": "string"}},
+                    "entry_price": {"type": ["integer", "null"]},
+                    "stop_loss": {"type": ["integer", "null"]},
+                    "target_price": {"type": ["integer", "null"]},
+                    "reply_to_other": {"type": ["string", "null"]},
+                },
+                "required": [
+                    "analysis", "score", "suggested_percent", "reasoning", "risk_factors",
+                    "entry_price", "stop_loss", "target_price", "reply_to_other",
+                ],
+                "additionalProperties": False,
+            },
+        },
+    }
+
+    # 이하 사용자 메시지 — 종목별로 달라지는 내용만 포함.
+    # str.format 템플릿 대신 f-string 빌더로 두어 호출마다 템플릿을 다시 해석하지 않는다.
+    @staticmethod
+    def _analysis_prompt(
+        symbol: str, company_name: str, news_title: str,
+        technical_data: str, conversation: str, request: str,
+    ) -> str:
+        return f"""다음 종목에 대한 퀀트/기술적 분석을 수행해주세요.
 
 [종목 정보]
 종목코드: {symbol}
@@ -55,24 +120,15 @@ class QuantAnalyst:
 {conversation}
 
 [요청]
-{request}
-
-[응답 형식]
-다음 JSON 형식으로 응답해주세요:
-{{
-    "analysis": "기술적 분석 내용 (2-3문장, 위의 실제 지표 데이터 기반)",
-    "score": 1-10 사이 점수,
-    "suggested_percent": 제안 투자 비율 (0-100),
-    "reasoning": "투자 비율 산정 근거 (실제 지표값 인용)",
-    "risk_factors": ["리스크 요소 1", "리스크 요소 2"],
-    "entry_price": 권장 진입가 (정수),
-    "stop_loss": 손절가 (정수),
-    "target_price": 목표가 (정수),
-    "reply_to_other": "다른 분석가에게 하고 싶은 말 (선택)"
-}}"""
+{request}"""
 
     # 퀀트 룰 기반 트리거 결과를 포함한 분석 프롬프트
-    ANALYSIS_PROMPT_WITH_QUANT = """다음 종목에 대한 퀀트/기술적 분석을 수행해주세요.
+    @staticmethod
+    def _analysis_prompt_with_quant(
+        symbol: str, company_name: str, composite_score, bullish_count, bearish_count,
+        trigger_list: str, technical_data: str, conversation: str, request: str,
+    ) -> str:
+        return f"""다음 종목에 대한 퀀트/기술적 분석을 수행해주세요.
 
 [종목 정보]
 종목코드: {symbol}
@@ -92,24 +148,14 @@ class QuantAnalyst:
 {conversation}
 
 [요청]
-{request}
-
-[응답 형식]
-다음 JSON 형식으로 응답해주세요:
-{{
-    "analysis": "기술적 분석 내용 (2-3문장, 퀀트 트리거 결과와 실제 지표 데이터 기반)",
-    "score": 1-10 사이 점수,
-    "suggested_percent": 제안 투자 비율 (0-100),
-    "reasoning": "투자 비율 산정 근거 (트리거 신호 및 실제 지표값 인용)",
-    "risk_factors": ["리스크 요소 1", "리스크 요소 2"],
-    "entry_price": 권장 진입가 (정수),
-    "stop_loss": 손절가 (정수),
-    "target_price": 목표가 (정수),
-    "reply_to_other": "다른 분석가에게 하고 싶은 말 (선택)"
-}}"""
+{request}"""
 
     # 기술적 데이터 없이 뉴스만으로 분석할 때 사용
-    ANALYSIS_PROMPT_NO_DATA = """다음 종목에 대한 퀀트/기술적 분석을 수행해주세요.
+    @staticmethod
+    def _analysis_prompt_no_data(
+        symbol: str, company_name: str, news_title: str, conversation: str, request: str,
+    ) -> str:
+        return f"""다음 종목에 대한 퀀트/기술적 분석을 수행해주세요.
 
 [종목 정보]
 종목코드: {symbol}
@@ -123,66 +169,55 @@ class QuantAnalyst:
 {conversation}
 
 [요청]
-{request}
+{request}"""
 
-[응답 형식]
-다음 JSON 형식으로 응답해주세요:
-{{
-    "analysis": "기술적 분석 관점의 의견 (2-3문장)",
-    "score": 1-10 사이 점수,
-    "suggested_percent": 제안 투자 비율 (0-100),
-    "reasoning": "투자 비율 산정 근거",
-    "risk_factors": ["리스크 요소 1", "리스크 요소 2"],
-    "reply_to_other": "다른 분석가에게 하고 싶은 말 (선택)"
-}}"""
+    # 독립 시그널 GPT 검증 1회당 최대 종목 수
+    BATCH_MAX_SYMBOLS = 20
+
+    # 묶음 분석(analyze_batch) 1회당 최대 종목 수 — 종목당 응답이 길어 검증보다 작게 유지
+    ANALYSIS_BATCH_MAX_SYMBOLS = 8
+
+    # OpenAI Batch API 진행 중 상태 (이외는 종료 상태)
+    BATCH_PENDING_STATUSES = frozenset({"validating", "in_progress", "finalizing", "cancelling"})
 
     def __init__(self):
         self._client: Optional[AsyncOpenAI] = None
         self._initialized = False
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
 
     def _initialize(self):
-        """OpenAI 클라이언트 초기화"""
-        if self._initialized:
+        """OpenAI 클라이언트 초기화
+
+        Celery 태스크는 호출마다 새 이벤트 루프를 쓰므로 루프가 바뀌면 그 루프의 클라이언트로 교체한다.
+        """
+        loop = asyncio.get_running_loop()
+        if self._initialized and self._client_loop is loop:
             return
 
         if not settings.openai_api_key:
             raise ValueError("OPENAI_API_KEY가 설정되지 않았습니다")
 
-        self._client = AsyncOpenAI(
-            api_key=settings.openai_api_key,
-            base_url=settings.openai_base_url,
-        )
+        self._client = get_openai_client(settings.openai_api_key, settings.openai_base_url)
+        self._client_loop = loop
+        if not self._initialized:
+            logger.info(f"GPT 퀀트 분석가 초기화 (모델: {settings.openai_model})")
         self._initialized = True
-        logger.info(f"GPT 퀀트 분석가 초기화 (모델: {settings.openai_model})")
 
     def _build_conversation(self, messages: list[CouncilMessage]) -> str:
         """이전 대화 내용 구성"""
-        if not messages:
-            return "(첫 번째 발언입니다)"
+        return build_conversation(messages)
 
-        lines = []
-        for msg in messages[-6:]:  # 최근 6개 메시지만
-            speaker = msg.speaker
-            content = msg.content[:200]  # 길이 제한
-            lines.append(f"[{speaker}]: {content}")
-
-        return "\n".join(lines)
-
-    async def analyze(
+    def _build_analysis_prompt(
         self,
         symbol: str,
         company_name: str,
         news_title: str,
-        previous_messages: list[CouncilMessage],
-        technical_data: Optional[TechnicalAnalysisResult] = None,
-        quant_trigger_data: Optional[dict] = None,
-        request: str = "기술적 분석을 수행하고 투자 비율을 제안해주세요."
-    ) -> CouncilMessage:
-        """퀀트 분석 수행"""
-        self._initialize()
-
-        conversation = self._build_conversation(previous_messages)
-
+        conversation: str,
+        technical_data: Optional[TechnicalAnalysisResult],
+        quant_trigger_data: Optional[dict],
+        request: str,
+    ) -> str:
+        """분석 사용자 메시지 구성 (트리거 포함 / 차트 데이터 / 데이터 없음)"""
         # 퀀트 트리거 데이터가 있는 경우 우선 사용
         if quant_trigger_data and technical_data and technical_data.current_price > 0:
             trigger_lines = []
@@ -198,7 +233,7 @@ class QuantAnalyst:
                     + (f" ({details_str})" if details_str else "")
                 )
             trigger_list = "\n".join(trigger_lines) if trigger_lines else "  (없음)"
-            prompt = self.ANALYSIS_PROMPT_WITH_QUANT.format(
+            prompt = self._analysis_prompt_with_quant(
                 symbol=symbol,
                 company_name=company_name,
                 composite_score=quant_trigger_data.get("composite_score", 0),
@@ -215,7 +250,7 @@ class QuantAnalyst:
                 f"현재가: {technical_data.current_price:,}원)"
             )
         elif technical_data and technical_data.current_price > 0:
-            prompt = self.ANALYSIS_PROMPT.format(
+            prompt = self._analysis_prompt(
                 symbol=symbol,
                 company_name=company_name,
                 news_title=news_title,
@@ -225,7 +260,7 @@ class QuantAnalyst:
             )
             logger.info(f"[퀀트분석] {symbol} - 실제 차트 데이터 사용 (현재가: {technical_data.current_price:,}원)")
         else:
-            prompt = self.ANALYSIS_PROMPT_NO_DATA.format(
+            prompt = self._analysis_prompt_no_data(
                 symbol=symbol,
                 company_name=company_name,
                 news_title=news_title,
@@ -234,67 +269,56 @@ class QuantAnalyst:
             )
             logger.warning(f"[퀀트분석] {symbol} - 차트 데이터 없이 분석")
 
-        try:
-            response = await self._client.chat.completions.create(
-                model=settings.openai_model,
-                messages=[
-                    {"role": "system", "content": self.SYSTEM_PROMPT},
-                    {"role": "user", "content": prompt},
-                ],
-                temperature=0.7,
-                max_tokens=2048,
-            )
-
-            response_text = response.choices[0].message.content
-
-            # JSON 파싱 시도
-            try:
-                from .llm_utils import parse_llm_json
-                data, parse_err = parse_llm_json(response_text)
-                if parse_err:
-                    raise json.JSONDecodeError(parse_err, response_text, 0)
+        return prompt
 
-                # 기술적 데이터가 있는 경우 추가 정보 포함
-                content = f"""📊 **퀀트 분석 결과**
-
-{data.get('analysis', '')}
-
-• 기술적 점수: {data.get('score', 5)}/10
-• 제안 투자 비율: {data.get('suggested_percent', 0)}%
-• 근거: {data.get('reasoning', '')}"""
-
-                # 매매 가격 정보 (있는 경우)
-                if data.get('entry_price'):
-                    content += f"""
-
-💰 매매 전략:
-• 진입가: {data.get('entry_price'):,}원
-• 손절가: {data.get('stop_loss', 0):,}원
-• 목표가: {data.get('target_price', 0):,}원"""
-
-                content += f"""
-
-⚠️ 리스크 요소:
-{chr(10).join(f"- {r}" for r in data.get('risk_factors', []))}"""
+    async def analyze(
+        self,
+        symbol: str,
+        company_name: str,
+        news_title: str,
+        previous_messages: list[CouncilMessage],
+        technical_data: Optional[TechnicalAnalysisResult] = None,
+        quant_trigger_data: Optional[dict] = None,
+        request: str = "기술적 분석을 수행하고 투자 비율을 제안해주세요.",
+        conversation: Optional[str] = None,
+        stream: bool = False,
+    ) -> CouncilMessage:
+        """퀀트 분석 수행
 
-                if data.get('reply_to_other'):
-                    content += f"\n\n💬 {data.get('reply_to_other')}"
+        conversation: 미리 구성된 이전 대화 (CouncilMeeting.conversation_text()).
+            없으면 previous_messages로 구성한다.
+        stream: True면 JSON 객체가 닫히는 즉시 수신을 중단한다
+            (이후 설명 텍스트 대기 없음).
+        """
+        self._initialize()
 
-                # 실제 데이터 사용 여부 표시
-                if technical_data and technical_data.current_price > 0:
-                    content += f"\n\n📈 *키움증권 실시간 데이터 기반 분석*"
+        if conversation is None:
+            conversation = self._build_conversation(previous_messages)
+        prompt = self._build_analysis_prompt(
+            symbol, company_name, news_title, conversation,
+            technical_data, quant_trigger_data, request,
+        )
 
-            except json.JSONDecodeError:
-                # JSON 파싱 실패 시 원본 텍스트 사용
-                content = f"📊 **퀀트 분석**\n\n{response_text}"
-                data = {"score": 5, "suggested_percent": 0}
+        try:
+            async with openai_call_slot():
+                response = await self._client.chat.completions.create(
+                    model=settings.openai_model,
+                    messages=[
+                        {"role": "system", "content": self.ANALYSIS_SYSTEM_PROMPT},
+                        {"role": "user", "content": prompt},
+                    ],
+                    temperature=0.7,
+                    max_tokens=800,
+                    response_format=self.RESPONSE_SCHEMA,
+                    stream=stream,
+                )
+                if stream:
+                    response_text = await read_streamed_json(response)
+                else:
+                    _log_cached_prompt_tokens(symbol, response)
+                    response_text = response.choices[0].message.content
 
-            return CouncilMessage(
-                role=AnalystRole.GPT_QUANT,
-                speaker="GPT 퀀트 분석가",
-                content=content,
-                data=data,
-            )
+            return self._message_from_text(response_text, technical_data)
 
         except Exception as e:
             logger.error(f"GPT 퀀트 분석 오류: {e}")
@@ -305,6 +329,71 @@ class QuantAnalyst:
                 data={"error": str(e)},
             )
 
+    def _message_from_text(
+        self, response_text: Optional[str], technical_data: Optional[TechnicalAnalysisResult] = None
+    ) -> CouncilMessage:
+        """분석 응답 텍스트 → CouncilMessage"""
+        if response_text is None:
+            # 구조화 출력 거부(refusal) 시 content가 None
+            response_text, data, parse_err = "(응답 없음)", {}, "응답 본문 없음"
+        else:
+            # 구조화 출력이면 본문 전체가 JSON — 펜스 탐색 없이 바로 파싱.
+            # response_format을 무시하는 호환 엔드포인트는 parse_llm_json으로 처리.
+            try:
+                data, parse_err = orjson.loads(response_text), None
+            except orjson.JSONDecodeError:
+                data, parse_err = parse_llm_json(response_text)
+            if parse_err is None and not isinstance(data, dict):
+                parse_err = f"JSON 객체가 아님 ({type(data).__name__})"
+        if parse_err:
+            # JSON 파싱 실패·거부 시 원본 텍스트 사용
+            content = f"📊 **퀀트 분석**\n\n{response_text}"
+            data = {"score": 5, "suggested_percent": 0}
+        else:
+            content = self._format_analysis(data, technical_data)
+
+        return CouncilMessage(
+            role=AnalystRole.GPT_QUANT,
+            speaker="GPT 퀀트 분석가",
+            content=content,
+            data=data,
+        )
+
+    @staticmethod
+    def _format_analysis(
+        data: dict, technical_data: Optional[TechnicalAnalysisResult] = None
+    ) -> str:
+        """파싱된 분석 JSON을 회의 메시지 본문으로 변환"""
+        # 기술적 데이터가 있는 경우 추가 정보 포함
+        parts = [
+            "📊 **퀀트 분석 결과**\n\n",
+            f"{data.get('analysis', '')}\n\n",
+            f"• 기술적 점수: {data.get('score', 5)}/10\n",
+            f"• 제안 투자 비율: {data.get('suggested_percent', 0)}%\n",
+            f"• 근거: {data.get('reasoning', '')}",
+        ]
+
+        # 매매 가격 정보 (있는 경우)
+        if data.get('entry_price'):
+            parts.append(
+                "\n\n💰 매매 전략:\n"
+                f"• 진입가: {data.get('entry_price'):,}원\n"
+                f"• 손절가: {data.get('stop_loss') or 0:,}원\n"
+                f"• 목표가: {data.get('target_price') or 0:,}원"
+            )
+
+        parts.append("\n\n⚠️ 리스크 요소:\n")
+        parts.append("\n".join(f"- {r}" for r in data.get('risk_factors') or []))
+
+        if data.get('reply_to_other'):
+            parts.append(f"\n\n💬 {data.get('reply_to_other')}")
+
+        # 실제 데이터 사용 여부 표시
+        if technical_data and technical_data.current_price > 0:
+            parts.append("\n\n📈 *키움증권 실시간 데이터 기반 분석*")
+
+        return "".join(parts)
+
     async def respond_to(
         self,
         symbol: str,
@@ -333,12 +422,225 @@ class QuantAnalyst:
             request=request,
         )
 
+    async def analyze_batch(
+        self,
+        items: List[Tuple[str, str, str, Optional[TechnicalAnalysisResult], str]],
+    ) -> Dict[str, CouncilMessage]:
+        """
+        여러 종목의 퀀트 분석을 묶어서 수행 (이전 대화 없는 단독 분석용)
+
+        ANALYSIS_BATCH_MAX_SYMBOLS개씩 GPT 호출 1회로 분석한다.
+        응답에서 누락된 종목은 analyze()로 개별 재분석한다.
+
+        Args:
+            items: [(symbol, company_name, news_title, technical_data, request)]
+
+        Returns:
+            {symbol: CouncilMessage}
+        """
+        if not items:
+            return {}
+
+        self._initialize()
+
+        chunks = [
+            items[i:i + self.ANALYSIS_BATCH_MAX_SYMBOLS]
+            for i in range(0, len(items), self.ANALYSIS_BATCH_MAX_SYMBOLS)
+        ]
+        results: Dict[str, CouncilMessage] = {}
+        for chunk_results in await asyncio.gather(*(self._analyze_chunk(c) for c in chunks)):
+            results.update(chunk_results)
+        return results
+
+    async def _analyze_chunk(
+        self,
+        items: List[Tuple[str, str, str, Optional[TechnicalAnalysisResult], str]],
+    ) -> Dict[str, CouncilMessage]:
+        """analyze_batch의 GPT 호출 1회 단위 (응답 토큰은 종목당 800)"""
+        blocks = []
+        for symbol, company_name, news_title, technical_data, request in items:
+            if technical_data and technical_data.current_price > 0:
+                technical_text = technical_data.to_prompt_text()
+            else:
+                technical_text = "⚠️ 실시간 차트 데이터를 조회할 수 없습니다."
+            blocks.append(f"""[종목 정보]
+종목코드: {symbol}
+종목명: {company_name}
+뉴스: {news_title}
+
+[실제 기술적 지표 데이터]
+{technical_text}
+
+[요청]
+{request}""")
+
+        prompt = f"""다음 {len(items)}개 종목에 대한 퀀트/기술적 분석을 종목별로 수행해주세요.
+
+{chr(10).join(blocks)}
+
+[묶음 응답 형식 - JSON, results의 키는 종목코드]
+{{"results": {{"종목코드": 위 응답 형식의 분석 객체}}}}"""
+
+        symbols = [item[0] for item in items]
+        try:
+            async with openai_call_slot():
+                response = await self._client.chat.completions.create(
+                    model=settings.openai_model,
+                    messages=[
+                        {"role": "system", "content": self.ANALYSIS_SYSTEM_PROMPT},
+                        {"role": "user", "content": prompt},
+                    ],
+                    temperature=0.7,
+                    max_tokens=800 * len(items),
+                    response_format={"type": "json_object"},
+                )
+                _log_cached_prompt_tokens(",".join(symbols), response)
+            response_text = response.choices[0].message.content
+        except Exception as e:
+            logger.error(f"[퀀트묶음] {', '.join(symbols)} - GPT 호출 오류: {e}")
+            return {
+                s: CouncilMessage(
+                    role=AnalystRole.GPT_QUANT,
+                    speaker="GPT 퀀트 분석가",
+                    content=f"⚠️ 분석 중 오류 발생: {str(e)}",
+                    data={"error": str(e)},
+                )
+                for s in symbols
+            }
+
+        data, parse_err = parse_llm_json(response_text)
+        analyses = data.get("results") if not parse_err else None
+        if not isinstance(analyses, dict):
+            logger.warning(f"[퀀트묶음] {', '.join(symbols)} - JSON 파싱 실패, 개별 분석으로 전환")
+            analyses = {}
+
+        results: Dict[str, CouncilMessage] = {}
+        missing = []
+        for item in items:
+            symbol, technical_data = item[0], item[3]
+            item_data = analyses.get(symbol)
+            if not isinstance(item_data, dict):
+                missing.append(item)
+                continue
+            results[symbol] = CouncilMessage(
+                role=AnalystRole.GPT_QUANT,
+                speaker="GPT 퀀트 분석가",
+                content=self._format_analysis(item_data, technical_data),
+                data=item_data,
+            )
+
+        if missing:
+            messages = await asyncio.gather(*(
+                self.analyze(
+                    symbol=symbol,
+                    company_name=company_name,
+                    news_title=news_title,
+                    previous_messages=[],
+                    technical_data=technical_data,
+                    request=request,
+                )
+                for symbol, company_name, news_title, technical_data, request in missing
+            ))
+            results.update(zip((item[0] for item in missing), messages))
+
+        return results
+
+    async def submit_analysis_batch(
+        self,
+        items: List[Tuple[str, str, str, Optional[TechnicalAnalysisResult], str]],
+    ) -> str:
+        """
+        여러 종목 분석을 OpenAI Batch API로 제출 (24시간 내 처리, 비용 50%)
+
+        종목당 analyze()와 같은 요청 1건씩 JSONL로 업로드한다.
+        결과는 collect_analysis_batch()로 수집한다.
+
+        Args:
+            items: analyze_batch와 같은 형식
+
+        Returns:
+            batch_id
+        """
+        self._initialize()
+
+        lines = []
+        for symbol, company_name, news_title, technical_data, request in items:
+            prompt = self._build_analysis_prompt(
+                symbol, company_name, news_title, self._build_conversation([]),
+                technical_data, None, request,
+            )
+            lines.append(orjson.dumps({
+                "custom_id": symbol,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": settings.openai_model,
+                    "messages": [
+                        {"role": "system", "content": self.ANALYSIS_SYSTEM_PROMPT},
+                        {"role": "user", "content": prompt},
+                    ],
+                    "temperature": 0.7,
+                    "max_tokens": 800,
+                    "response_format": self.RESPONSE_SCHEMA,
+                },
+            }))
+
+        input_file = await self._client.files.create(
+            file=("quant_analysis.jsonl", b"\n".join(lines)),
+            purpose="batch",
+        )
+        batch = await self._client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        logger.info("[퀀트배치] %d종목 제출 (batch_id: %s)", len(items), batch.id)
+        return batch.id
+
+    async def collect_analysis_batch(self, batch_id: str) -> Optional[Dict[str, CouncilMessage]]:
+        """
+        Batch API 결과 수집
+
+        Returns:
+            처리 중이면 None, 종료되면 {symbol: CouncilMessage}
+            (실패·만료된 요청은 제외)
+        """
+        self._initialize()
+
+        batch = await self._client.batches.retrieve(batch_id)
+        if batch.status in self.BATCH_PENDING_STATUSES:
+            return None
+        if not batch.output_file_id:
+            logger.warning("[퀀트배치] %s 결과 없음 (상태: %s)", batch_id, batch.status)
+            return {}
+
+        output = await self._client.files.content(batch.output_file_id)
+        results: Dict[str, CouncilMessage] = {}
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            # 손상된 결과 한 줄 때문에 나머지 종목 결과를 버리지 않도록 줄 단위로 건너뜀
+            try:
+                record = orjson.loads(line)
+                symbol = record.get("custom_id")
+                response = record.get("response") or {}
+                choices = (response.get("body") or {}).get("choices") or []
+                if response.get("status_code") != 200 or not choices:
+                    logger.warning("[퀀트배치] %s 요청 실패: %s", symbol, record.get("error"))
+                    continue
+                results[symbol] = self._message_from_text(choices[0]["message"]["content"])
+            except Exception as e:
+                logger.warning("[퀀트배치] %s 결과 줄 처리 실패: %s", batch_id, e)
+
+        logger.info("[퀀트배치] %s 수집 완료: %d종목 (상태: %s)", batch_id, len(results), batch.status)
+        return results
 
     async def generate_independent_signal(
         self,
         symbol: str,
         company_name: str,
         technical_data: TechnicalAnalysisResult,
+        stream: bool = False,
     ) -> Tuple[bool, str, dict]:
         """
         기술적 지표만으로 독립적인 매매 시그널 생성
@@ -349,22 +651,67 @@ class QuantAnalyst:
             - action: "BUY", "SELL", "HOLD"
             - signal_data: 상세 데이터
         """
-        if not technical_data or technical_data.current_price <= 0:
-            return False, "HOLD", {"reason": "기술적 데이터 없음"}
+        results = await self.generate_independent_signals_batch(
+            [(symbol, company_name, technical_data)], stream=stream,
+        )
+        return results[symbol]
 
-        # 1. 규칙 기반 1차 필터링 (API 비용 절감)
-        rule_signal, rule_action, rule_data = self._rule_based_signal(technical_data)
+    async def generate_independent_signals_batch(
+        self,
+        items: List[Tuple[str, str, TechnicalAnalysisResult]],
+        stream: bool = False,
+    ) -> Dict[str, Tuple[bool, str, dict]]:
+        """
+        여러 종목의 독립 시그널을 한 번에 생성
 
-        if not rule_signal:
-            logger.debug(f"[퀀트독립] {symbol} - 규칙 기반 필터링 통과 안됨")
-            return False, "HOLD", rule_data
+        규칙 기반 필터를 통과한 종목만 BATCH_MAX_SYMBOLS개씩 묶어
+        GPT 호출 1회로 검증한다. stream=True면 JSON 객체가 닫히는 즉시
+        응답 수신을 중단한다.
 
-        # 2. GPT를 통한 2차 검증 (규칙 기반에서 신호가 감지된 경우만)
+        Returns:
+            {symbol: (should_signal, action, signal_data)}
+        """
+        results: Dict[str, Tuple[bool, str, dict]] = {}
+        candidates: List[Tuple[str, str, TechnicalAnalysisResult, str, dict]] = []
+
+        for symbol, company_name, technical_data in items:
+            if not technical_data or technical_data.current_price <= 0:
+                results[symbol] = (False, "HOLD", {"reason": "기술적 데이터 없음"})
+                continue
+
+            # 1. 규칙 기반 1차 필터링 (API 비용 절감)
+            rule_signal, rule_action, rule_data = self._rule_based_signal(technical_data)
+            if not rule_signal:
+                logger.debug(f"[퀀트독립] {symbol} - 규칙 기반 필터링 통과 안됨")
+                results[symbol] = (False, "HOLD", rule_data)
+                continue
+
+            candidates.append((symbol, company_name, technical_data, rule_action, rule_data))
+
+        if not candidates:
+            return results
+
+        # 2. GPT를 통한 2차 검증 (규칙 기반에서 신호가 감지된 종목만, 묶어서 호출)
         self._initialize()
 
-        prompt = f"""기술적 지표 기반으로 매매 신호를 판단해주세요.
+        chunks = [
+            candidates[i:i + self.BATCH_MAX_SYMBOLS]
+            for i in range(0, len(candidates), self.BATCH_MAX_SYMBOLS)
+        ]
+        for chunk_results in await asyncio.gather(*(self._verify_batch(c, stream) for c in chunks)):
+            results.update(chunk_results)
 
-[종목 정보]
+        return results
+
+    async def _verify_batch(
+        self,
+        candidates: List[Tuple[str, str, TechnicalAnalysisResult, str, dict]],
+        stream: bool = False,
+    ) -> Dict[str, Tuple[bool, str, dict]]:
+        """규칙 기반 통과 종목들을 GPT 1회 호출로 검증 (응답 토큰은 종목당 256)"""
+        blocks = []
+        for symbol, company_name, technical_data, rule_action, rule_data in candidates:
+            blocks.append(f"""[종목 정보]
 종목코드: {symbol}
 종목명: {company_name}
 
@@ -373,70 +720,84 @@ class QuantAnalyst:
 
 [규칙 기반 분석 결과]
 1차 신호: {rule_action}
-근거: {rule_data.get('reason', '')}
+근거: {rule_data.get('reason', '')}""")
+
+        prompt = f"""기술적 지표 기반으로 다음 {len(candidates)}개 종목의 매매 신호를 판단해주세요.
+
+{chr(10).join(blocks)}
 
 [요청]
-위 기술적 지표를 검토하고 매매 신호의 유효성을 평가해주세요.
+위 기술적 지표를 종목별로 검토하고 매매 신호의 유효성을 평가해주세요.
 
-[응답 형식 - JSON]
+[응답 형식 - JSON, signals의 키는 종목코드]
 {{
-    "confirm_signal": true/false,
-    "action": "BUY" 또는 "SELL" 또는 "HOLD",
-    "confidence": 0.0-1.0 사이 신뢰도,
-    "score": 1-10 점수,
-    "reason": "판단 근거 (1-2문장)",
-    "entry_price": 진입가,
-    "stop_loss": 손절가,
-    "target_price": 목표가
+    "signals": {{
+        "종목코드": {{
+            "confirm_signal": true/false,
+            "action": "BUY" 또는 "SELL" 또는 "HOLD",
+            "confidence": 0.0-1.0 사이 신뢰도,
+            "score": 1-10 점수,
+            "reason": "판단 근거 (1-2문장)",
+            "entry_price": 진입가,
+            "stop_loss": 손절가,
+            "target_price": 목표가
+        }}
+    }}
 }}"""
 
+        symbols = [c[0] for c in candidates]
         try:
-            response = await self._client.chat.completions.create(
-                model=settings.openai_model,
-                messages=[
-                    {"role": "system", "content": "당신은 퀀트 분석 전문가입니다. 기술적 지표를 분석하여 매매 신호를 검증합니다."},
-                    {"role": "user", "content": prompt},
-                ],
-                temperature=0.3,
-                max_tokens=2048,
-            )
-
-            response_text = response.choices[0].message.content
-
-            # JSON 파싱
-            try:
-                from .llm_utils import parse_llm_json
-                data, parse_err = parse_llm_json(response_text)
-                if parse_err:
-                    raise json.JSONDecodeError(parse_err, response_text, 0)
-
-                if data.get("confirm_signal", False):
-                    action = data.get("action", "HOLD")
-                    logger.info(
-                        f"[퀀트독립] {symbol} - GPT 검증 통과: {action} "
-                        f"(신뢰도: {data.get('confidence', 0):.0%})"
-                    )
-                    return True, action, {
-                        "source": "quant_independent",
-                        "confidence": data.get("confidence", 0.7),
-                        "score": data.get("score", 5),
-                        "reason": data.get("reason", ""),
-                        "entry_price": data.get("entry_price"),
-                        "stop_loss": data.get("stop_loss"),
-                        "target_price": data.get("target_price"),
-                        "rule_based_signal": rule_action,
-                    }
+            async with openai_call_slot():
+                response = await self._client.chat.completions.create(
+                    model=settings.openai_model,
+                    messages=[
+                        {"role": "system", "content": "당신은 퀀트 분석 전문가입니다. 기술적 지표를 분석하여 매매 신호를 검증합니다."},
+                        {"role": "user", "content": prompt},
+                    ],
+                    temperature=0.3,
+                    max_tokens=min(2048, 256 + 256 * len(candidates)),
+                    response_format={"type": "json_object"},
+                    stream=stream,
+                )
+                if stream:
+                    response_text = await read_streamed_json(response)
                 else:
-                    logger.debug(f"[퀀트독립] {symbol} - GPT 검증 미통과")
-                    return False, "HOLD", {"reason": "GPT 검증 미통과"}
-
-            except json.JSONDecodeError:
-                logger.warning(f"[퀀트독립] {symbol} - JSON 파싱 실패")
-                return False, "HOLD", {"reason": "응답 파싱 실패"}
-
+                    response_text = response.choices[0].message.content
         except Exception as e:
-            logger.error(f"[퀀트독립] {symbol} - GPT 호출 오류: {e}")
-            return False, "HOLD", {"reason": f"오류: {str(e)}"}
+            logger.error(f"[퀀트독립] {', '.join(symbols)} - GPT 호출 오류: {e}")
+            return {s: (False, "HOLD", {"reason": f"오류: {str(e)}"}) for s in symbols}
+
+        # JSON 파싱
+        data, parse_err = parse_llm_json(response_text)
+        signals = data.get("signals") if not parse_err else None
+        if not isinstance(signals, dict):
+            logger.warning(f"[퀀트독립] {', '.join(symbols)} - JSON 파싱 실패")
+            return {s: (False, "HOLD", {"reason": "응답 파싱 실패"}) for s in symbols}
+
+        results = {}
+        for symbol, _, _, rule_action, _ in candidates:
+            item = signals.get(symbol)
+            if not isinstance(item, dict) or not item.get("confirm_signal", False):
+                logger.debug(f"[퀀트독립] {symbol} - GPT 검증 미통과")
+                results[symbol] = (False, "HOLD", {"reason": "GPT 검증 미통과"})
+                continue
+
+            action = item.get("action", "HOLD")
+            logger.info(
+                f"[퀀트독립] {symbol} - GPT 검증 통과: {action} "
+                f"(신뢰도: {item.get('confidence', 0):.0%})"
+            )
+            results[symbol] = (True, action, {
+                "source": "quant_independent",
+                "confidence": item.get("confidence", 0.7),
+                "score": item.get("score", 5),
+                "reason": item.get("reason", ""),
+                "entry_price": item.get("entry_price"),
+                "stop_loss": item.get("stop_loss"),
+                "target_price": item.get("target_price"),
+                "rule_based_signal": rule_action,
+            })
+        return results
 
     def _rule_based_signal(
         self,
@@ -445,108 +806,43 @@ class QuantAnalyst:
         """
         규칙 기반 매매 신호 1차 필터링 (API 호출 없이 빠르게 판단)
 
+        점수 계산은 _rule_signal_kernel이 수치 인자만으로 처리하고,
+        신호 설명 문자열은 실제 BUY/SELL 신호가 나온 경우에만 만든다.
+
         Returns:
             (should_continue, suggested_action, reason_data)
         """
-        signals = []
-        buy_signals = 0
-        sell_signals = 0
-
-        # 1. RSI 신호
-        rsi = technical_data.rsi_14
-        if rsi > 0:
-            if rsi <= 30:
-                buy_signals += 2  # 강한 매수 신호
-                signals.append(f"RSI 과매도({rsi:.1f})")
-            elif rsi <= 40:
-                buy_signals += 1
-                signals.append(f"RSI 매수권({rsi:.1f})")
-            elif rsi >= 70:
-                sell_signals += 2  # 강한 매도 신호
-                signals.append(f"RSI 과매수({rsi:.1f})")
-            elif rsi >= 60:
-                sell_signals += 1
-                signals.append(f"RSI 매도권({rsi:.1f})")
-
-        # 2. MACD 신호
-        macd = technical_data.macd
-        macd_signal = technical_data.macd_signal
-        if macd != 0 and macd_signal != 0:
-            if macd > macd_signal and macd > 0:
-                buy_signals += 1
-                signals.append("MACD 골든크로스")
-            elif macd < macd_signal and macd < 0:
-                sell_signals += 1
-                signals.append("MACD 데드크로스")
-
-        # 3. 볼린저밴드 신호
-        current_price = technical_data.current_price
-        bb_lower = technical_data.bb_lower
-        bb_upper = technical_data.bb_upper
-        if bb_lower > 0 and bb_upper > 0 and current_price > 0:
-            bb_position = (current_price - bb_lower) / (bb_upper - bb_lower) if (bb_upper - bb_lower) > 0 else 0.5
-            if bb_position <= 0.1:  # 하단 10% 이내
-                buy_signals += 2
-                signals.append(f"볼린저밴드 하단 돌파({bb_position:.0%})")
-            elif bb_position <= 0.2:
-                buy_signals += 1
-                signals.append(f"볼린저밴드 하단 근접({bb_position:.0%})")
-            elif bb_position >= 0.9:  # 상단 10% 이내
-                sell_signals += 2
-                signals.append(f"볼린저밴드 상단 돌파({bb_position:.0%})")
-            elif bb_position >= 0.8:
-                sell_signals += 1
-                signals.append(f"볼린저밴드 상단 근접({bb_position:.0%})")
-
-        # 4. 이동평균선 배열
-        ma5 = technical_data.ma_5
-        ma20 = technical_data.ma_20
-        ma60 = technical_data.ma_60
-        if ma5 > 0 and ma20 > 0 and current_price > 0:
-            if current_price > ma5 > ma20:
-                buy_signals += 1
-                signals.append("정배열 (가격>MA5>MA20)")
-            elif current_price < ma5 < ma20:
-                sell_signals += 1
-                signals.append("역배열 (가격<MA5<MA20)")
-
-            # 골든크로스/데드크로스
-            if ma60 > 0:
-                if ma5 > ma20 > ma60:
-                    buy_signals += 1
-                    signals.append("이동평균선 정배열")
-                elif ma5 < ma20 < ma60:
-                    sell_signals += 1
-                    signals.append("이동평균선 역배열")
-
-        # 5. 거래량 확인 (급등 시 신뢰도 증가)
-        volume_ratio = technical_data.volume_ratio
-        if volume_ratio >= 2.0:
-            if buy_signals > sell_signals:
-                buy_signals += 1
-                signals.append(f"거래량 급등({volume_ratio:.1f}배)")
-            elif sell_signals > buy_signals:
-                sell_signals += 1
-                signals.append(f"거래량 급등({volume_ratio:.1f}배)")
-
-        # 최종 판단
-        # 매수: 최소 3개 이상의 매수 신호, 매도 신호보다 2개 이상 많아야 함
-        # 매도: 최소 3개 이상의 매도 신호, 매수 신호보다 2개 이상 많아야 함
+        td = technical_data
+
+        # 지표가 하나도 없으면 어떤 규칙도 발동할 수 없음 (넓은 스윕에서 흔한 경우)
+        if not (td.rsi_14 or td.macd or td.bb_lower or td.ma_5):
+            return False, "HOLD", _EMPTY_RULE_REASON
+
+        buy_signals, sell_signals, action, fired = _rule_signal_kernel(
+            td.rsi_14, td.macd, td.macd_signal, td.current_price,
+            td.bb_percent, td.ma_5, td.ma_20, td.ma_alignment, td.volume_ratio,
+        )
+
+        if action == ACTION_HOLD:
+            return False, "HOLD", {
+                "buy_signals": buy_signals,
+                "sell_signals": sell_signals,
+                "signals": [],
+                "reason": f"신호 불충분 (매수:{buy_signals}, 매도:{sell_signals})",
+            }
+
+        signals = _describe_rule_signals(fired, td)
         reason_data = {
             "buy_signals": buy_signals,
             "sell_signals": sell_signals,
             "signals": signals,
         }
 
-        if buy_signals >= 3 and buy_signals - sell_signals >= 2:
+        if action == ACTION_BUY:
             reason_data["reason"] = f"매수 신호 우세 ({buy_signals} vs {sell_signals}): " + ", ".join(signals)
             return True, "BUY", reason_data
-        elif sell_signals >= 3 and sell_signals - buy_signals >= 2:
-            reason_data["reason"] = f"매도 신호 우세 ({sell_signals} vs {buy_signals}): " + ", ".join(signals)
-            return True, "SELL", reason_data
-        else:
-            reason_data["reason"] = f"신호 불충분 (매수:{buy_signals}, 매도:{sell_signals})"
-            return False, "HOLD", reason_data
+        reason_data["reason"] = f"매도 신호 우세 ({sell_signals} vs {buy_signals}): " + ", ".join(signals)
+        return True, "SELL", reason_data
 
     def quick_technical_score(self, technical_data: TechnicalAnalysisResult) -> int:
         """
@@ -556,43 +852,276 @@ class QuantAnalyst:
         if not technical_data or technical_data.current_price <= 0:
             return 5  # 중립
 
-        score = 5  # 기본 점수
-
-        # RSI 기반
-        rsi = technical_data.rsi_14
-        if 0 < rsi <= 30:
-            score += 2
-        elif 30 < rsi <= 40:
-            score += 1
-        elif 60 <= rsi < 70:
-            score -= 1
-        elif rsi >= 70:
-            score -= 2
-
-        # MACD 기반
-        if technical_data.macd > technical_data.macd_signal:
-            score += 1
-        elif technical_data.macd < technical_data.macd_signal:
-            score -= 1
-
-        # 이동평균선 기반
-        current = technical_data.current_price
-        if current > technical_data.ma_20 > 0:
-            score += 1
-        elif current < technical_data.ma_20 and technical_data.ma_20 > 0:
-            score -= 1
-
-        # 볼린저밴드 기반
-        if technical_data.bb_lower > 0 and technical_data.bb_upper > 0:
-            bb_range = technical_data.bb_upper - technical_data.bb_lower
-            if bb_range > 0:
-                bb_pos = (current - technical_data.bb_lower) / bb_range
-                if bb_pos <= 0.2:
-                    score += 1
-                elif bb_pos >= 0.8:
-                    score -= 1
-
-        return max(1, min(10, score))
+        # 양자화한 지표로 캐시 조회 (RSI 0.1, MACD 1e-4, 가격 1원, %B 0.001 단위)
+        td = technical_data
+        bb = td.bb_percent
+        return _quick_score_cached(
+            round((td.rsi_14 or 0) * 10),
+            round((td.macd or 0) * 10_000),
+            round((td.macd_signal or 0) * 10_000),
+            round(td.current_price),
+            round(td.ma_20 or 0),
+            None if math.isnan(bb) else round(bb * 1000),
+        )
+
+
+def _log_cached_prompt_tokens(symbol: str, response) -> None:
+    """프롬프트 캐시 적중 토큰 수 기록 (SDK/모델이 제공하는 경우에만)"""
+    usage = getattr(response, "usage", None)
+    details = getattr(usage, "prompt_tokens_details", None)
+    cached = getattr(details, "cached_tokens", None)
+    if isinstance(cached, int):
+        logger.debug(f"[퀀트분석] {symbol} - 프롬프트 캐시 {cached}/{usage.prompt_tokens} 토큰")
+
+
+# ─── 규칙 기반 점수 커널 ───
+
+# 판정 임계값
+RSI_OVERSOLD = 30
+RSI_BUY_ZONE = 40
+RSI_SELL_ZONE = 60
+RSI_OVERBOUGHT = 70
+BB_BREAK_LOW = 0.1       # 하단 10% 이내
+BB_NEAR_LOW = 0.2
+BB_NEAR_HIGH = 0.8
+BB_BREAK_HIGH = 0.9      # 상단 10% 이내
+VOLUME_SURGE_RATIO = 2.0
+MIN_SIGNAL_COUNT = 3     # 최소 신호 개수
+MIN_SIGNAL_MARGIN = 2    # 반대 신호 대비 최소 우위
+
+ACTION_HOLD = 0
+ACTION_BUY = 1
+ACTION_SELL = -1
+
+# 지표 데이터가 전혀 없을 때의 판정 (읽기 전용 공유 객체)
+_EMPTY_RULE_REASON = {
+    "buy_signals": 0,
+    "sell_signals": 0,
+    "signals": [],
+    "reason": "신호 불충분 (매수:0, 매도:0)",
+}
+
+# 발생한 규칙 비트 플래그 (설명 문자열 생성용)
+_F_RSI_OVERSOLD = 1 << 0
+_F_RSI_BUY_ZONE = 1 << 1
+_F_RSI_OVERBOUGHT = 1 << 2
+_F_RSI_SELL_ZONE = 1 << 3
+_F_MACD_GOLDEN = 1 << 4
+_F_MACD_DEAD = 1 << 5
+_F_BB_BREAK_LOW = 1 << 6
+_F_BB_NEAR_LOW = 1 << 7
+_F_BB_BREAK_HIGH = 1 << 8
+_F_BB_NEAR_HIGH = 1 << 9
+_F_PRICE_BULL = 1 << 10
+_F_PRICE_BEAR = 1 << 11
+_F_MA_BULL = 1 << 12
+_F_MA_BEAR = 1 << 13
+_F_VOLUME_SURGE = 1 << 14
+
+
+def _rule_signal_kernel(
+    rsi: float,
+    macd: float,
+    macd_signal: float,
+    price: float,
+    bb_position: float,
+    ma5: float,
+    ma20: float,
+    ma_alignment: int,
+    volume_ratio: float,
+) -> Tuple[int, int, int, int]:
+    """수치 지표만으로 매수/매도 신호 개수와 판정 계산.
+
+    bb_position은 TechnicalAnalysisResult.bb_percent (밴드 정보 없으면 NaN),
+    ma_alignment는 TechnicalAnalysisResult.ma_alignment 값.
+
+    Returns:
+        (buy_signals, sell_signals, action_code, fired_flags)
+    """
+    buy = 0
+    sell = 0
+    fired = 0
+
+    # 1. RSI 신호
+    if rsi > 0:
+        if rsi <= RSI_OVERSOLD:
+            buy += 2  # 강한 매수 신호
+            fired |= _F_RSI_OVERSOLD
+        elif rsi <= RSI_BUY_ZONE:
+            buy += 1
+            fired |= _F_RSI_BUY_ZONE
+        elif rsi >= RSI_OVERBOUGHT:
+            sell += 2  # 강한 매도 신호
+            fired |= _F_RSI_OVERBOUGHT
+        elif rsi >= RSI_SELL_ZONE:
+            sell += 1
+            fired |= _F_RSI_SELL_ZONE
+
+    # 2. MACD 신호
+    if macd != 0 and macd_signal != 0:
+        if macd > macd_signal and macd > 0:
+            buy += 1
+            fired |= _F_MACD_GOLDEN
+        elif macd < macd_signal and macd < 0:
+            sell += 1
+            fired |= _F_MACD_DEAD
+
+    # 3. 볼린저밴드 신호 (NaN이면 모든 비교가 False)
+    if bb_position <= BB_BREAK_LOW:
+        buy += 2
+        fired |= _F_BB_BREAK_LOW
+    elif bb_position <= BB_NEAR_LOW:
+        buy += 1
+        fired |= _F_BB_NEAR_LOW
+    elif bb_position >= BB_BREAK_HIGH:
+        sell += 2
+        fired |= _F_BB_BREAK_HIGH
+    elif bb_position >= BB_NEAR_HIGH:
+        sell += 1
+        fired |= _F_BB_NEAR_HIGH
+
+    # 4. 이동평균선 배열
+    if ma5 > 0 and ma20 > 0 and price > 0:
+        if price > ma5 > ma20:
+            buy += 1
+            fired |= _F_PRICE_BULL
+        elif price < ma5 < ma20:
+            sell += 1
+            fired |= _F_PRICE_BEAR
+
+        # 골든크로스/데드크로스
+        if ma_alignment > 0:
+            buy += 1
+            fired |= _F_MA_BULL
+        elif ma_alignment < 0:
+            sell += 1
+            fired |= _F_MA_BEAR
+
+    # 5. 거래량 확인 (급등 시 신뢰도 증가)
+    if volume_ratio >= VOLUME_SURGE_RATIO:
+        if buy > sell:
+            buy += 1
+            fired |= _F_VOLUME_SURGE
+        elif sell > buy:
+            sell += 1
+            fired |= _F_VOLUME_SURGE
+
+    # 최종 판단: 최소 신호 개수 + 반대 신호 대비 우위
+    if buy >= MIN_SIGNAL_COUNT and buy - sell >= MIN_SIGNAL_MARGIN:
+        action = ACTION_BUY
+    elif sell >= MIN_SIGNAL_COUNT and sell - buy >= MIN_SIGNAL_MARGIN:
+        action = ACTION_SELL
+    else:
+        action = ACTION_HOLD
+
+    return buy, sell, action, fired
+
+
+def _quick_score_kernel(
+    rsi: float,
+    macd: float,
+    macd_signal: float,
+    price: float,
+    ma20: float,
+    bb_position: float,
+) -> int:
+    """수치 지표만으로 빠른 기술적 점수 계산 (1-10, 기본 5)"""
+    score = 5
+
+    # RSI 기반
+    if 0 < rsi <= RSI_OVERSOLD:
+        score += 2
+    elif RSI_OVERSOLD < rsi <= RSI_BUY_ZONE:
+        score += 1
+    elif RSI_SELL_ZONE <= rsi < RSI_OVERBOUGHT:
+        score -= 1
+    elif rsi >= RSI_OVERBOUGHT:
+        score -= 2
+
+    # MACD 기반
+    if macd > macd_signal:
+        score += 1
+    elif macd < macd_signal:
+        score -= 1
+
+    # 이동평균선 기반
+    if price > ma20 > 0:
+        score += 1
+    elif price < ma20 and ma20 > 0:
+        score -= 1
+
+    # 볼린저밴드 기반 (NaN이면 비교가 모두 False)
+    if bb_position <= BB_NEAR_LOW:
+        score += 1
+    elif bb_position >= BB_NEAR_HIGH:
+        score -= 1
+
+    return max(1, min(10, score))
+
+
+@lru_cache(maxsize=4096)
+def _quick_score_cached(
+    rsi_q: int,
+    macd_q: int,
+    macd_signal_q: int,
+    price: int,
+    ma20: int,
+    bb_q: Optional[int],
+) -> int:
+    """양자화된 지표에 대한 _quick_score_kernel 결과 캐시 (bb_q None = 밴드 정보 없음)"""
+    return _quick_score_kernel(
+        rsi_q / 10,
+        macd_q / 10_000,
+        macd_signal_q / 10_000,
+        price,
+        ma20,
+        math.nan if bb_q is None else bb_q / 1000,
+    )
+
+
+def _describe_rule_signals(fired: int, td: TechnicalAnalysisResult) -> List[str]:
+    """발생한 규칙 플래그를 설명 문자열 목록으로 변환 (신호 발생 시에만 호출)"""
+    signals = []
+    rsi = td.rsi_14
+    if fired & _F_RSI_OVERSOLD:
+        signals.append(f"RSI 과매도({rsi:.1f})")
+    elif fired & _F_RSI_BUY_ZONE:
+        signals.append(f"RSI 매수권({rsi:.1f})")
+    elif fired & _F_RSI_OVERBOUGHT:
+        signals.append(f"RSI 과매수({rsi:.1f})")
+    elif fired & _F_RSI_SELL_ZONE:
+        signals.append(f"RSI 매도권({rsi:.1f})")
+
+    if fired & _F_MACD_GOLDEN:
+        signals.append("MACD 골든크로스")
+    elif fired & _F_MACD_DEAD:
+        signals.append("MACD 데드크로스")
+
+    if fired & (_F_BB_BREAK_LOW | _F_BB_NEAR_LOW | _F_BB_BREAK_HIGH | _F_BB_NEAR_HIGH):
+        bb_position = td.bb_percent
+        if fired & _F_BB_BREAK_LOW:
+            signals.append(f"볼린저밴드 하단 돌파({bb_position:.0%})")
+        elif fired & _F_BB_NEAR_LOW:
+            signals.append(f"볼린저밴드 하단 근접({bb_position:.0%})")
+        elif fired & _F_BB_BREAK_HIGH:
+            signals.append(f"볼린저밴드 상단 돌파({bb_position:.0%})")
+        else:
+            signals.append(f"볼린저밴드 상단 근접({bb_position:.0%})")
+
+    if fired & _F_PRICE_BULL:
+        signals.append("정배열 (가격>MA5>MA20)")
+    elif fired & _F_PRICE_BEAR:
+        signals.append("역배열 (가격<MA5<MA20)")
+
+    if fired & _F_MA_BULL:
+        signals.append("이동평균선 정배열")
+    elif fired & _F_MA_BEAR:
+        signals.append("이동평균선 역배열")
+
+    if fired & _F_VOLUME_SURGE:
+        signals.append(f"거래량 급등({td.volume_ratio:.1f}배)")
+
+    return signals
 
 
 # 싱글톤 인스턴스
@@ -4,15 +4,56 @@ orchestrator.py에서 추출. 모든 함수는 순수 함수이거나
 kiwoom_client / settings만 참조 (orchestrator 의존 없음).
 """
 
+import asyncio
 import logging
+import time as _time
 from dataclasses import dataclass
 from typing import Optional
 
 from app.config import settings
-from app.core.audit import log_signal_event_async
+from app.core.audit import log_in_background, log_signal_event_async
+from .models import TradeAction
 
 logger = logging.getLogger(__name__)
 
+# determine_action 임계값
+SELL_NEWS_SCORE = 3         # 뉴스 트리거: 뉴스 점수 이하 → SELL
+SELL_AVG_SCORE = 4          # 평균 분석 점수 이하 → SELL
+MIN_BUY_CONFIDENCE = 0.73   # BUY 진입 최소 신뢰도
+# (최소 비율, 최소 평균 점수) — 하나라도 충족하면 BUY
+QUANT_BUY_RULES = ((10, 5.5), (15, 5))
+NEWS_BUY_PERCENT, NEWS_BUY_AVG_SCORE = 10, 6
+STRONG_NEWS_SCORE, STRONG_NEWS_AVG_SCORE = 8, 5
+
+
+# 잔고+보유종목 스냅샷 재사용 시간 (같은 회의 사이클의 연속 게이트 검증용)
+ACCOUNT_SNAPSHOT_TTL = 1.5
+
+_account_snapshot: Optional[tuple] = None  # (monotonic 시각, balance, holdings)
+
+
+async def _get_account_snapshot() -> tuple:
+    """잔고·보유종목 동시 조회 (ACCOUNT_SNAPSHOT_TTL초 캐시)."""
+    global _account_snapshot
+    from app.services.kiwoom.rest_client import kiwoom_client
+
+    cached = _account_snapshot
+    if cached is not None and _time.monotonic() - cached[0] < ACCOUNT_SNAPSHOT_TTL:
+        return cached[1], cached[2]
+
+    balance, holdings = await asyncio.gather(
+        kiwoom_client.get_balance(),
+        kiwoom_client.get_holdings(),
+    )
+    _account_snapshot = (_time.monotonic(), balance, holdings)
+    return balance, holdings
+
+
+def invalidate_account_snapshot() -> None:
+    """주문 체결 후 호출 — 다음 게이트 검증은 잔고를 새로 조회."""
+    global _account_snapshot
+    _account_snapshot = None
+
 
 @dataclass
 class GateResult:
@@ -21,6 +62,97 @@ class GateResult:
     gate_name: str
 
 
+def _evaluate_buy_gates(
+    symbol: str,
+    suggested_amount: int,
+    balance,
+    held_count: int,
+    is_additional_buy: bool,
+) -> list[tuple[str, str, str]]:
+    """Gate A/B/C를 모두 평가해 실패한 게이트 목록 반환.
+
+    Returns:
+        [(gate_name, audit event_type, reason), ...] — 통과 시 빈 리스트
+    """
+    total_assets = balance.total_deposit + balance.total_evaluation
+    if total_assets <= 0:
+        total_assets = suggested_amount  # fallback
+
+    failures = []
+
+    # Gate A: 최소 포지션 금액
+    min_position_amount = int(total_assets * settings.min_position_pct / 100)
+    if suggested_amount < min_position_amount:
+        failures.append(("A", "gate_block_min_position", (
+            f"Gate A 최소 포지션 미달: "
+            f"제안 {suggested_amount:,}원 < "
+            f"최소 {min_position_amount:,}원 "
+            f"(총자산 {total_assets:,}원 x {settings.min_position_pct}%)"
+        )))
+
+    # Gate B: 현금 보유 비율
+    cash_after_buy = balance.available_amount - suggested_amount
+    min_cash = int(total_assets * settings.min_cash_reserve_pct / 100)
+    if cash_after_buy < min_cash:
+        failures.append(("B", "gate_block_cash_reserve", (
+            f"Gate B 현금 보유 부족: "
+            f"매수 후 예상 현금 {cash_after_buy:,}원 < "
+            f"최소 {min_cash:,}원 "
+            f"(총자산 {total_assets:,}원 x {settings.min_cash_reserve_pct}%)"
+        )))
+
+    # Gate C: 최대 보유 종목 수 (보유 종목 추가 매수는 예외)
+    if held_count >= settings.max_positions and not is_additional_buy:
+        failures.append(("C", "gate_block_max_positions", (
+            f"Gate C 최대 종목 수 초과: "
+            f"현재 {held_count}종목 >= "
+            f"최대 {settings.max_positions}종목"
+        )))
+
+    return failures
+
+
+def _gate_result(
+    symbol: str,
+    failures: list[tuple[str, str, str]],
+    signal_id: Optional[int] = None,
+) -> GateResult:
+    """실패 게이트 목록 → GateResult (게이트별 감사 이벤트 기록)"""
+    if not failures:
+        return GateResult(blocked=False, reason="", gate_name="")
+
+    for _, event_type, reason in failures:
+        log_in_background(log_signal_event_async(
+            event_type, symbol, "BUY",
+            signal_id=signal_id, details={"reason": reason},
+        ))
+    return GateResult(
+        blocked=True,
+        reason="; ".join(f[2] for f in failures),
+        gate_name=",".join(f[0] for f in failures),
+    )
+
+
+def _gate_error(symbol: str, e: Exception, signal_id: Optional[int] = None) -> GateResult:
+    logger.warning("게이트 검증 실패, 안전하게 차단: %s - %s", symbol, e)
+    log_in_background(log_signal_event_async(
+        "gate_block_error", symbol, "BUY",
+        signal_id=signal_id, details={"error": str(e)},
+    ))
+    return GateResult(blocked=True, reason=f"게이트 검증 오류: {e}", gate_name="error")
+
+
+def _holding_stats(holdings, symbol: str) -> tuple[int, bool]:
+    """보유 종목 수와 symbol 추가 매수 여부를 한 번의 순회로 계산"""
+    count, is_additional = 0, False
+    for h in holdings:
+        if h.quantity > 0:
+            count += 1
+            if h.symbol == symbol:
+                is_additional = True
+    return count, is_additional
+
+
 async def check_buy_gates(
     symbol: str,
     suggested_amount: int,
@@ -31,75 +163,39 @@ async def check_buy_gates(
     Gate A: 최소 포지션 금액
     Gate B: 현금 보유 비율
     Gate C: 최대 보유 종목 수
-    """
-    from app.services.kiwoom.rest_client import kiwoom_client
 
+    세 게이트를 모두 평가하며, 여러 개가 실패하면 reason은 "; ",
+    gate_name은 ","로 이어 붙인다 (예: "A,B").
+    """
     try:
-        balance = await kiwoom_client.get_balance()
-        holdings = await kiwoom_client.get_holdings()
-        total_assets = balance.total_deposit + balance.total_evaluation
-
-        if total_assets <= 0:
-            total_assets = suggested_amount  # fallback
-
-        # Gate A: 최소 포지션 금액
-        min_position_amount = int(total_assets * settings.min_position_pct / 100)
-        if suggested_amount < min_position_amount:
-            reason = (
-                f"Gate A 최소 포지션 미달: "
-                f"제안 {suggested_amount:,}원 < "
-                f"최소 {min_position_amount:,}원 "
-                f"(총자산 {total_assets:,}원 x {settings.min_position_pct}%)"
-            )
-            await log_signal_event_async(
-                "gate_block_min_position", symbol, "BUY",
-                signal_id=signal_id, details={"reason": reason},
-            )
-            return GateResult(blocked=True, reason=reason, gate_name="A")
-
-        # Gate B: 현금 보유 비율
-        cash_after_buy = balance.available_amount - suggested_amount
-        min_cash = int(total_assets * settings.min_cash_reserve_pct / 100)
-        if cash_after_buy < min_cash:
-            reason = (
-                f"Gate B 현금 보유 부족: "
-                f"매수 후 예상 현금 {cash_after_buy:,}원 < "
-                f"최소 {min_cash:,}원 "
-                f"(총자산 {total_assets:,}원 x {settings.min_cash_reserve_pct}%)"
-            )
-            await log_signal_event_async(
-                "gate_block_cash_reserve", symbol, "BUY",
-                signal_id=signal_id, details={"reason": reason},
-            )
-            return GateResult(blocked=True, reason=reason, gate_name="B")
-
-        # Gate C: 최대 보유 종목 수
-        current_holding_count = len([h for h in holdings if h.quantity > 0])
-        is_additional_buy = any(
-            h.symbol == symbol for h in holdings if h.quantity > 0
+        balance, holdings = await _get_account_snapshot()
+        failures = _evaluate_buy_gates(
+            symbol, suggested_amount, balance, *_holding_stats(holdings, symbol),
         )
-        if current_holding_count >= settings.max_positions and not is_additional_buy:
-            reason = (
-                f"Gate C 최대 종목 수 초과: "
-                f"현재 {current_holding_count}종목 >= "
-                f"최대 {settings.max_positions}종목"
-            )
-            await log_signal_event_async(
-                "gate_block_max_positions", symbol, "BUY",
-                signal_id=signal_id, details={"reason": reason},
-            )
-            return GateResult(blocked=True, reason=reason, gate_name="C")
+    except Exception as e:
+        return _gate_error(symbol, e, signal_id)
+
+    return _gate_result(symbol, failures, signal_id)
 
+
+async def check_buy_gates_batch(requests: list[tuple[str, int]]) -> dict[str, GateResult]:
+    """여러 종목의 게이트를 계좌 스냅샷 1회로 검증.
+
+    Args:
+        requests: [(symbol, suggested_amount), ...]
+    """
+    try:
+        balance, holdings = await _get_account_snapshot()
+        held = [h.symbol for h in holdings if h.quantity > 0]
+        held_set = frozenset(held)
+        failures = {
+            symbol: _evaluate_buy_gates(symbol, amount, balance, len(held), symbol in held_set)
+            for symbol, amount in requests
+        }
     except Exception as e:
-        reason = f"게이트 검증 오류: {e}"
-        logger.warning(f"게이트 검증 실패, 안전하게 차단: {symbol} - {e}")
-        await log_signal_event_async(
-            "gate_block_error", symbol, "BUY",
-            signal_id=signal_id, details={"error": str(e)},
-        )
-        return GateResult(blocked=True, reason=reason, gate_name="error")
+        return {symbol: _gate_error(symbol, e) for symbol, _ in requests}
 
-    return GateResult(blocked=False, reason="", gate_name="")
+    return {symbol: _gate_result(symbol, f) for symbol, f in failures.items()}
 
 
 def check_data_quality_gate(
@@ -124,53 +220,89 @@ def determine_action(
     news_score: int,
     trigger_source: str = "news",
     confidence: float = 0.0,
-) -> str:
+) -> TradeAction:
     """투자 액션 결정 (BUY/SELL/HOLD)."""
     avg_score = (quant_score + fundamental_score) / 2
-    min_confidence = 0.73  # 최소 신뢰도 73%
 
     # SELL 조건
-    if trigger_source == "news" and news_score <= 3:
-        logger.info(f"SELL 결정: 부정적 뉴스 (점수: {news_score})")
-        return "SELL"
+    if trigger_source == "news" and news_score <= SELL_NEWS_SCORE:
+        logger.info("SELL 결정: 부정적 뉴스 (점수: %s)", news_score)
+        return TradeAction.SELL
 
-    if avg_score <= 4:
-        logger.info(f"SELL 결정: 낮은 분석 점수 (평균: {avg_score:.1f})")
-        return "SELL"
+    if avg_score <= SELL_AVG_SCORE:
+        logger.info("SELL 결정: 낮은 분석 점수 (평균: %.1f)", avg_score)
+        return TradeAction.SELL
 
     if final_percent < 0:
-        logger.info(f"SELL 결정: AI 매도 권장 (비율: {final_percent}%)")
-        return "SELL"
+        logger.info("SELL 결정: AI 매도 권장 (비율: %s%%)", final_percent)
+        return TradeAction.SELL
 
     # 신뢰도 게이트 — BUY 진입 전 필수
-    if confidence < min_confidence:
+    if confidence < MIN_BUY_CONFIDENCE:
         logger.info(
-            f"HOLD 결정: 신뢰도 부족 ({confidence:.0%} < {min_confidence:.0%}), "
-            f"비율: {final_percent}%, 평균: {avg_score:.1f}"
+            "HOLD 결정: 신뢰도 부족 (%.0f%% < %.0f%%), 비율: %s%%, 평균: %.1f",
+            confidence * 100, MIN_BUY_CONFIDENCE * 100, final_percent, avg_score,
         )
-        return "HOLD"
+        return TradeAction.HOLD
 
     # 퀀트 트리거 BUY 조건 (뉴스 점수 무시)
     if trigger_source == "quant":
-        if final_percent >= 10 and avg_score >= 5.5:
-            logger.info(f"BUY 결정 [퀀트]: 분석 긍정 (비율: {final_percent}%, 평균: {avg_score:.1f}, 신뢰도: {confidence:.0%})")
-            return "BUY"
-        if final_percent >= 15 and avg_score >= 5:
-            logger.info(f"BUY 결정 [퀀트]: 높은 비율 (비율: {final_percent}%, 평균: {avg_score:.1f}, 신뢰도: {confidence:.0%})")
-            return "BUY"
+        for min_percent, min_avg in QUANT_BUY_RULES:
+            if final_percent >= min_percent and avg_score >= min_avg:
+                logger.info(
+                    "BUY 결정 [퀀트]: 비율 %s%%+/평균 %s+ 충족 (비율: %s%%, 평균: %.1f, 신뢰도: %.0f%%)",
+                    min_percent, min_avg, final_percent, avg_score, confidence * 100,
+                )
+                return TradeAction.BUY
 
     # 뉴스 트리거 BUY 조건
-    if final_percent >= 10 and avg_score >= 6:
-        logger.info(f"BUY 결정: 긍정적 분석 (비율: {final_percent}%, 평균: {avg_score:.1f}, 신뢰도: {confidence:.0%})")
-        return "BUY"
+    if final_percent >= NEWS_BUY_PERCENT and avg_score >= NEWS_BUY_AVG_SCORE:
+        logger.info(
+            "BUY 결정: 긍정적 분석 (비율: %s%%, 평균: %.1f, 신뢰도: %.0f%%)",
+            final_percent, avg_score, confidence * 100,
+        )
+        return TradeAction.BUY
 
-    if news_score >= 8 and avg_score >= 5:
-        logger.info(f"BUY 결정: 강한 뉴스 신호 (뉴스: {news_score}, 평균: {avg_score:.1f}, 신뢰도: {confidence:.0%})")
-        return "BUY"
+    if news_score >= STRONG_NEWS_SCORE and avg_score >= STRONG_NEWS_AVG_SCORE:
+        logger.info(
+            "BUY 결정: 강한 뉴스 신호 (뉴스: %s, 평균: %.1f, 신뢰도: %.0f%%)",
+            news_score, avg_score, confidence * 100,
+        )
+        return TradeAction.BUY
 
     # HOLD
-    logger.info(f"HOLD 결정: 조건 미충족 (비율: {final_percent}%, 평균: {avg_score:.1f}, 신뢰도: {confidence:.0%}, 트리거: {trigger_source})")
-    return "HOLD"
+    logger.info(
+        "HOLD 결정: 조건 미충족 (비율: %s%%, 평균: %.1f, 신뢰도: %.0f%%, 트리거: %s)",
+        final_percent, avg_score, confidence * 100, trigger_source,
+    )
+    return TradeAction.HOLD
+
+
+# clamp 계수 캐시 — (settings 객체, 손절 (하한, 상한, 기본), 목표가 (하한, 상한, 기본))
+# settings 객체가 교체되면(테스트 패치 등) 다시 계산한다.
+_clamp_factors_cache: Optional[tuple] = None
+
+
+def _clamp_factors() -> tuple:
+    """현재가 대비 손절/목표가 배율 (settings 퍼센트 → 곱셈 계수)."""
+    global _clamp_factors_cache
+    cached = _clamp_factors_cache
+    if cached is None or cached[0] is not settings:
+        cached = (
+            settings,
+            (
+                1 - settings.max_stop_loss_percent / 100,
+                1 - settings.min_stop_loss_percent / 100,
+                1 - settings.stop_loss_percent / 100,
+            ),
+            (
+                1 + settings.min_take_profit_percent / 100,
+                1 + settings.max_take_profit_percent / 100,
+                1 + settings.take_profit_percent / 100,
+            ),
+        )
+        _clamp_factors_cache = cached
+    return cached
 
 
 def clamp_stop_loss(gpt_stop_loss: Optional[int], current_price: int) -> Optional[int]:
@@ -178,13 +310,11 @@ def clamp_stop_loss(gpt_stop_loss: Optional[int], current_price: int) -> Optiona
     if not current_price:
         return None
 
-    min_price = int(current_price * (1 - settings.max_stop_loss_percent / 100))
-    max_price = int(current_price * (1 - settings.min_stop_loss_percent / 100))
-
+    lo, hi, default = _clamp_factors()[1]
     if gpt_stop_loss:
-        return max(min_price, min(max_price, gpt_stop_loss))
+        return max(int(current_price * lo), min(int(current_price * hi), gpt_stop_loss))
 
-    return int(current_price * (1 - settings.stop_loss_percent / 100))
+    return int(current_price * default)
 
 
 def clamp_target_price(gpt_target: Optional[int], current_price: int) -> Optional[int]:
@@ -192,10 +322,8 @@ def clamp_target_price(gpt_target: Optional[int], current_price: int) -> Optiona
     if not current_price:
         return None
 
-    min_price = int(current_price * (1 + settings.min_take_profit_percent / 100))
-    max_price = int(current_price * (1 + settings.max_take_profit_percent / 100))
-
+    lo, hi, default = _clamp_factors()[2]
     if gpt_target:
-        return max(min_price, min(max_price, gpt_target))
+        return max(int(current_price * lo), min(int(current_price * hi), gpt_target))
 
-    return int(current_price * (1 + settings.take_profit_percent / 100))
+    return int(current_price * default)
@@ -6,6 +6,7 @@ mutable state 접근 (circular import 회피).
 
 import asyncio
 import logging
+import time
 from datetime import datetime
 from typing import Optional
 
@@ -13,14 +14,22 @@ from app.config import settings
 from app.services.kiwoom.rest_client import kiwoom_client, OrderSide, OrderType
 from .models import (
     CouncilMeeting, CouncilMessage, InvestmentSignal,
-    SignalStatus, AnalystRole,
+    SignalStatus, AnalystRole, TradeAction,
 )
 from .quant_analyst import quant_analyst
+from .llm_utils import analyst_response_cache
 from .trading_hours import trading_hours, get_kst_now
 from .cost_manager import cost_manager, AnalysisDepth
+from .risk_gate import invalidate_account_snapshot
 
 logger = logging.getLogger(__name__)
 
+# 리밸런싱 차트 조회 제한 — 키움 요청은 0.2초 간격(초당 5회 이내)으로 시작해 429 방지
+KIWOOM_REQUEST_INTERVAL = 0.2
+REBALANCE_FETCH_CONCURRENCY = 4
+# 묶음 분석 GPT 호출(최대 ANALYSIS_BATCH_MAX_SYMBOLS종목) 1회당 타임아웃
+REBALANCE_BATCH_TIMEOUT = 120.0
+
 
 async def run_sell_meeting(
     orch,
@@ -72,59 +81,63 @@ async def run_sell_meeting(
         },
     )
     meeting.add_message(opening_msg)
-    await orch._notify_meeting_update(meeting)
 
-    # 기술적 데이터 조회
-    technical_data = await orch._fetch_technical_data(symbol)
+    # 소집 알림 전송과 기술적 데이터 조회를 동시에 진행
+    # (퀀트 분석은 기술적 데이터가 필요하므로 그 뒤에 실행)
+    _, technical_data = await asyncio.gather(
+        orch._notify_meeting_update(meeting),
+        orch._fetch_technical_data(symbol),
+    )
 
     # 2. GPT 퀀트 매도 분석
     meeting.current_round = 1
-    try:
-        quant_msg = await asyncio.wait_for(
-            quant_analyst.analyze(
-                symbol=symbol,
-                company_name=company_name,
-                news_title=f"매도 검토: {sell_reason}",
-                previous_messages=meeting.messages,
-                technical_data=technical_data,
-                request=(
-                    f"현재 보유 중인 종목의 매도 타이밍을 분석해주세요. "
-                    f"수익률 {profit_loss:+.1f}%, 사유: {sell_reason}"
-                ),
-            ),
-            timeout=60.0,
-        )
-        meeting.add_message(quant_msg)
-        await orch._notify_meeting_update(meeting)
-    except (asyncio.TimeoutError, Exception) as e:
-        logger.error(f"매도 검토 중 퀀트 분석가 API 호출 실패 또는 타임아웃: {e}")
-        quant_msg = CouncilMessage(
-            role=AnalystRole.GPT_QUANT,
-            speaker="시스템",
-            content=(
-                f"[시스템 경고] 분석 지연 발생. "
-                f"수익률 {profit_loss:+.1f}% 기반 기계적 매도를 우선 고려합니다."
-            ),
-            data={
-                "suggested_percent": 30 if profit_loss >= 0 else 100,
-                "score": 5,
-            },
-        )
-        meeting.add_message(quant_msg)
-        await orch._notify_meeting_update(meeting)
+    news_title = f"매도 검토: {sell_reason}"
+    request = (
+        f"현재 보유 중인 종목의 매도 타이밍을 분석해주세요. "
+        f"수익률 {profit_loss:+.1f}%, 사유: {sell_reason}"
+    )
+    # 재시도·중복 매도 트리거 시 동일 입력이면 직전 응답 재사용
+    quant_msg, _ = await orch._call_analyst_cached(
+        analyst_response_cache.make_key(
+            AnalystRole.GPT_QUANT.value, symbol, news_title, meeting.messages,
+            technical_data.to_prompt_text() if technical_data else "", request,
+        ),
+        lambda: quant_analyst.analyze(
+            symbol=symbol,
+            company_name=company_name,
+            news_title=news_title,
+            previous_messages=meeting.messages,
+            technical_data=technical_data,
+            request=request,
+            conversation=meeting.conversation_text(),
+            stream=True,
+        ),
+        fallback_role=AnalystRole.GPT_QUANT,
+        fallback_speaker="매도 검토 퀀트 분석가",
+        fallback_content=(
+            f"[시스템 경고] 분석 지연 발생. "
+            f"수익률 {profit_loss:+.1f}% 기반 기계적 매도를 우선 고려합니다."
+        ),
+        fallback_data={
+            "suggested_percent": 30 if profit_loss >= 0 else 100,
+            "score": 5,
+        },
+    )
+    meeting.add_message(quant_msg)
+    await orch._notify_meeting_update(meeting)
 
     # 3. SELL 시그널 생성
     quant_score = quant_msg.data.get("score", 5) if quant_msg.data else 5
 
     if profit_loss < -settings.stop_loss_percent:
         sell_percent = 100
-        action = "SELL"
+        action = TradeAction.SELL
     elif profit_loss > settings.take_profit_percent:
         sell_percent = 50
-        action = "PARTIAL_SELL"
+        action = TradeAction.PARTIAL_SELL
     else:
         sell_percent = quant_msg.data.get("suggested_percent", 30) if quant_msg.data else 30
-        action = "SELL" if sell_percent >= 50 else "PARTIAL_SELL"
+        action = TradeAction.SELL if sell_percent >= 50 else TradeAction.PARTIAL_SELL
 
     sell_quantity = int(current_holdings * sell_percent / 100)
     sell_amount = sell_quantity * current_price
@@ -132,7 +145,7 @@ async def run_sell_meeting(
     signal = InvestmentSignal(
         symbol=symbol,
         company_name=company_name,
-        action=action,
+        action=action.value,
         allocation_percent=sell_percent,
         suggested_amount=sell_amount,
         suggested_quantity=sell_quantity,
@@ -157,26 +170,27 @@ async def run_sell_meeting(
                     order_type=OrderType.MARKET,
                 )
                 if order_result.status == "submitted":
+                    invalidate_account_snapshot()
                     signal.status = SignalStatus.AUTO_EXECUTED
                     signal.executed_at = get_kst_now()
                     logger.info(
-                        f"✅ 자동 매도 성공: {symbol} {sell_quantity}주 "
-                        f"(주문번호: {order_result.order_no})"
+                        "✅ 자동 매도 성공: %s %s주 (주문번호: %s)",
+                        symbol, sell_quantity, order_result.order_no,
                     )
                 else:
                     signal.status = SignalStatus.QUEUED
                     orch.queue_execution(signal)
                     logger.warning(
-                        f"⚠️ 자동 매도 실패, 대기 큐 추가: {symbol} - {order_result.message}"
+                        "⚠️ 자동 매도 실패, 대기 큐 추가: %s - %s", symbol, order_result.message,
                     )
             except Exception as e:
                 signal.status = SignalStatus.QUEUED
                 orch.queue_execution(signal)
-                logger.error(f"❌ 자동 매도 오류, 대기 큐 추가: {symbol} - {e}")
+                logger.error("❌ 자동 매도 오류, 대기 큐 추가: %s - %s", symbol, e)
         else:
             signal.status = SignalStatus.QUEUED
             orch.queue_execution(signal)
-            logger.info(f"⏳ 매도 거래 시간 대기: {symbol} - {trade_reason}")
+            logger.info("⏳ 매도 거래 시간 대기: %s - %s", symbol, trade_reason)
     else:
         signal.status = SignalStatus.PENDING
 
@@ -206,14 +220,103 @@ async def run_sell_meeting(
     if signal.status == SignalStatus.PENDING:
         orch.add_pending_signal(signal)
 
-    await orch._notify_signal(signal)
-    await orch._persist_signal_to_db(signal, trigger_source=meeting.trigger_source)
+    await asyncio.gather(
+        orch._notify_signal(signal),
+        orch._persist_signal_to_db(signal, trigger_source=meeting.trigger_source),
+    )
 
     cost_manager.record_analysis(symbol, AnalysisDepth.LIGHT)
 
     return meeting
 
 
+def _rebalance_prompt(
+    symbol: str,
+    company_name: str,
+    technical_data,
+    current_holdings: int,
+    avg_buy_price: int,
+    current_price: int,
+    prev_target_price: Optional[int],
+    prev_stop_loss: Optional[int],
+) -> tuple:
+    """재평가 분석 요청 구성.
+
+    Returns:
+        ((symbol, company_name, news_title, technical_data, request), current_price, profit_rate)
+    """
+    if technical_data.current_price > 0:
+        current_price = technical_data.current_price
+
+    profit_rate = (
+        (current_price - avg_buy_price) / avg_buy_price * 100
+        if avg_buy_price > 0 else 0
+    )
+
+    prev_target_str = f"{prev_target_price:,}원" if prev_target_price else "미설정"
+    prev_stop_str = f"{prev_stop_loss:,}원" if prev_stop_loss else "미설정"
+
+    request_prompt = (
+        f"보유종목 일일 재평가. "
+        f"보유수량 {current_holdings:,}주, 평균매입가 {avg_buy_price:,}원, "
+        f"현재가 {current_price:,}원, 수익률 {profit_rate:+.1f}%. "
+        f"이전 목표가 {prev_target_str}, 이전 손절가 {prev_stop_str}. "
+        f"최신 차트 기반으로 목표가와 손절가를 재설정해주세요."
+    )
+    item = (
+        symbol,
+        company_name,
+        f"일일 리밸런싱 재평가 (수익률 {profit_rate:+.1f}%)",
+        technical_data,
+        request_prompt,
+    )
+    return item, current_price, profit_rate
+
+
+def _rebalance_result(
+    symbol: str,
+    company_name: str,
+    quant_msg: CouncilMessage,
+    current_price: int,
+    profit_rate: float,
+    prev_target_price: Optional[int],
+    prev_stop_loss: Optional[int],
+) -> dict:
+    """분석 응답에서 목표가/손절가 추출 → clamp 적용 후 결과 구성"""
+    from .risk_gate import clamp_target_price, clamp_stop_loss
+
+    new_target = quant_msg.data.get("target_price") if quant_msg.data else None
+    new_stop = quant_msg.data.get("stop_loss") if quant_msg.data else None
+    score = quant_msg.data.get("score", 5) if quant_msg.data else 5
+
+    new_target = clamp_target_price(new_target, current_price)
+    new_stop = clamp_stop_loss(new_stop, current_price)
+
+    # 비용 기록
+    cost_manager.record_analysis(symbol, AnalysisDepth.LIGHT)
+
+    result = {
+        "symbol": symbol,
+        "company_name": company_name,
+        "current_price": current_price,
+        "profit_rate": profit_rate,
+        "new_target_price": new_target,
+        "new_stop_loss": new_stop,
+        "prev_target_price": prev_target_price,
+        "prev_stop_loss": prev_stop_loss,
+        "score": score,
+        "analysis": quant_msg.content[:500],
+        "recommend_sell": score <= 3,
+    }
+
+    logger.info(
+        "[리밸런싱] %s (%s) score=%s, target=%s, stop=%s, recommend_sell=%s",
+        symbol, company_name, score, new_target, new_stop, result["recommend_sell"],
+    )
+
+    return result
+
+
 async def run_rebalance_review(
     orch,
     symbol: str,
@@ -225,40 +328,24 @@ async def run_rebalance_review(
     prev_stop_loss: Optional[int] = None,
 ) -> Optional[dict]:
     """보유종목 일일 리밸런싱 재평가 (GPT LIGHT 단독)."""
-    from .risk_gate import clamp_target_price, clamp_stop_loss
-
     try:
         # 1. 최신 차트 데이터 조회
         technical_data = await orch._fetch_technical_data(symbol)
         if not technical_data:
-            logger.warning(f"[리밸런싱] {symbol} 차트 데이터 없음 → 스킵")
+            logger.warning("[리밸런싱] %s 차트 데이터 없음 → 스킵", symbol)
             return None
 
-        if technical_data.current_price > 0:
-            current_price = technical_data.current_price
-
-        profit_rate = (
-            (current_price - avg_buy_price) / avg_buy_price * 100
-            if avg_buy_price > 0 else 0
-        )
-
         # 2. GPT 퀀트 분석
-        prev_target_str = f"{prev_target_price:,}원" if prev_target_price else "미설정"
-        prev_stop_str = f"{prev_stop_loss:,}원" if prev_stop_loss else "미설정"
-
-        request_prompt = (
-            f"보유종목 일일 재평가. "
-            f"보유수량 {current_holdings:,}주, 평균매입가 {avg_buy_price:,}원, "
-            f"현재가 {current_price:,}원, 수익률 {profit_rate:+.1f}%. "
-            f"이전 목표가 {prev_target_str}, 이전 손절가 {prev_stop_str}. "
-            f"최신 차트 기반으로 목표가와 손절가를 재설정해주세요."
+        item, current_price, profit_rate = _rebalance_prompt(
+            symbol, company_name, technical_data, current_holdings,
+            avg_buy_price, current_price, prev_target_price, prev_stop_loss,
         )
-
+        _, _, news_title, _, request_prompt = item
         quant_msg = await asyncio.wait_for(
             quant_analyst.analyze(
                 symbol=symbol,
                 company_name=company_name,
-                news_title=f"일일 리밸런싱 재평가 (수익률 {profit_rate:+.1f}%)",
+                news_title=news_title,
                 previous_messages=[],
                 technical_data=technical_data,
                 request=request_prompt,
@@ -267,41 +354,163 @@ async def run_rebalance_review(
         )
 
         # 3. 응답에서 값 추출 → clamp 적용
-        new_target = quant_msg.data.get("target_price") if quant_msg.data else None
-        new_stop = quant_msg.data.get("stop_loss") if quant_msg.data else None
-        score = quant_msg.data.get("score", 5) if quant_msg.data else 5
+        return _rebalance_result(
+            symbol, company_name, quant_msg, current_price, profit_rate,
+            prev_target_price, prev_stop_loss,
+        )
+
+    except asyncio.TimeoutError:
+        logger.error("[리밸런싱] %s GPT 타임아웃", symbol)
+        return None
+    except Exception as e:
+        logger.error("[리밸런싱] %s 오류: %s", symbol, e)
+        return None
 
-        new_target = clamp_target_price(new_target, current_price)
-        new_stop = clamp_stop_loss(new_stop, current_price)
 
-        # 4. 비용 기록
-        cost_manager.record_analysis(symbol, AnalysisDepth.LIGHT)
+async def _prepare_rebalance_items(orch, holdings: list[dict]) -> tuple[list, dict]:
+    """차트 데이터를 조회해 묶음 분석 요청 구성.
 
-        result = {
-            "symbol": symbol,
-            "company_name": company_name,
-            "current_price": current_price,
-            "profit_rate": profit_rate,
-            "new_target_price": new_target,
-            "new_stop_loss": new_stop,
-            "prev_target_price": prev_target_price,
-            "prev_stop_loss": prev_stop_loss,
-            "score": score,
-            "analysis": quant_msg.content[:500],
-            "recommend_sell": score <= 3,
-        }
-
-        logger.info(
-            f"[리밸런싱] {symbol} ({company_name}) "
-            f"score={score}, target={new_target}, stop={new_stop}, "
-            f"recommend_sell={result['recommend_sell']}"
+    조회는 REBALANCE_FETCH_CONCURRENCY건까지 겹쳐 진행하되, 키움 요청 시작은
+    KIWOOM_REQUEST_INTERVAL 간격을 지킨다.
+
+    Returns:
+        (analyze_batch 요청 목록, {symbol: 보유 정보 + 차트 기준 current_price/profit_rate})
+    """
+    semaphore = asyncio.Semaphore(REBALANCE_FETCH_CONCURRENCY)
+    pace_lock = asyncio.Lock()
+    next_start = 0.0
+
+    async def fetch(symbol: str):
+        nonlocal next_start
+        async with semaphore:
+            async with pace_lock:
+                delay = next_start - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                next_start = time.monotonic() + KIWOOM_REQUEST_INTERVAL
+            return await orch._fetch_technical_data(symbol)
+
+    fetched = await asyncio.gather(
+        *(fetch(h["symbol"]) for h in holdings),
+        return_exceptions=True,
+    )
+
+    items = []
+    contexts = {}
+    for h, technical_data in zip(holdings, fetched):
+        symbol = h["symbol"]
+        if isinstance(technical_data, Exception):
+            logger.error("[리밸런싱] %s 오류: %s", symbol, technical_data)
+            continue
+        if not technical_data:
+            logger.warning("[리밸런싱] %s 차트 데이터 없음 → 스킵", symbol)
+            continue
+        item, current_price, profit_rate = _rebalance_prompt(
+            symbol, h["company_name"], technical_data, h["current_holdings"],
+            h["avg_buy_price"], h["current_price"],
+            h.get("prev_target_price"), h.get("prev_stop_loss"),
         )
+        items.append(item)
+        contexts[symbol] = dict(h, current_price=current_price, profit_rate=profit_rate)
+
+    return items, contexts
+
+
+def _rebalance_results(
+    contexts: dict[str, dict],
+    messages: dict[str, CouncilMessage],
+) -> dict[str, Optional[dict]]:
+    """종목별 분석 응답 → run_rebalance_review와 같은 결과 dict (응답 없으면 None)"""
+    results: dict[str, Optional[dict]] = {}
+    for symbol, ctx in contexts.items():
+        quant_msg = messages.get(symbol)
+        if quant_msg is None:
+            results[symbol] = None
+            continue
+        try:
+            results[symbol] = _rebalance_result(
+                symbol, ctx["company_name"], quant_msg, ctx["current_price"],
+                ctx["profit_rate"], ctx.get("prev_target_price"), ctx.get("prev_stop_loss"),
+            )
+        except Exception as e:
+            logger.error("[리밸런싱] %s 오류: %s", symbol, e)
+            results[symbol] = None
+    return results
+
+
+async def run_rebalance_reviews(orch, holdings: list[dict]) -> dict[str, Optional[dict]]:
+    """여러 보유종목 리밸런싱 재평가를 묶음 GPT 호출로 수행.
+
+    차트 데이터는 키움 요청 간격을 지키며 조회하고, 분석은 quant_analyst.analyze_batch로
+    최대 ANALYSIS_BATCH_MAX_SYMBOLS개씩 한 번에 요청한다. 타임아웃은 묶음마다 따로 적용해
+    한 묶음이 늦어도 나머지 묶음 결과는 유지한다.
 
-        return result
+    Args:
+        holdings: run_rebalance_review 키워드 인자 dict 목록
 
-    except asyncio.TimeoutError:
-        logger.error(f"[리밸런싱] {symbol} GPT 타임아웃")
+    Returns:
+        {symbol: run_rebalance_review와 같은 결과 dict 또는 None}
+    """
+    results: dict[str, Optional[dict]] = {h["symbol"]: None for h in holdings}
+    if not holdings:
+        return results
+
+    # 1. 최신 차트 데이터 동시 조회
+    items, contexts = await _prepare_rebalance_items(orch, holdings)
+    if not items:
+        return results
+
+    # 2. GPT 퀀트 묶음 분석 — 묶음별 타임아웃 (느리거나 실패한 묶음의 종목만 결과 없음)
+    size = quant_analyst.ANALYSIS_BATCH_MAX_SYMBOLS
+    chunks = [items[i:i + size] for i in range(0, len(items), size)]
+    outcomes = await asyncio.gather(
+        *(asyncio.wait_for(quant_analyst.analyze_batch(chunk), timeout=REBALANCE_BATCH_TIMEOUT)
+          for chunk in chunks),
+        return_exceptions=True,
+    )
+    messages: dict[str, CouncilMessage] = {}
+    for chunk, outcome in zip(chunks, outcomes):
+        if isinstance(outcome, asyncio.TimeoutError):
+            logger.error("[리밸런싱] 묶음 분석 GPT 타임아웃 (%d종목)", len(chunk))
+        elif isinstance(outcome, Exception):
+            logger.error("[리밸런싱] 묶음 분석 오류: %s", outcome)
+        else:
+            messages.update(outcome)
+
+    # 3. 종목별 결과 구성
+    results.update(_rebalance_results(contexts, messages))
+    return results
+
+
+async def submit_rebalance_batch(orch, holdings: list[dict]) -> Optional[tuple[str, dict]]:
+    """리밸런싱 재평가를 OpenAI Batch API로 제출 (지연 허용, 비용 50%).
+
+    Returns:
+        (batch_id, contexts) — contexts는 collect_rebalance_batch에 그대로 전달.
+        제출할 종목이 없거나 제출 실패 시 None.
+    """
+    if not holdings:
+        return None
+
+    items, contexts = await _prepare_rebalance_items(orch, holdings)
+    if not items:
         return None
+
+    try:
+        batch_id = await quant_analyst.submit_analysis_batch(items)
     except Exception as e:
-        logger.error(f"[리밸런싱] {symbol} 오류: {e}")
+        logger.error("[리밸런싱] Batch API 제출 오류: %s", e)
+        return None
+    return batch_id, contexts
+
+
+async def collect_rebalance_batch(batch_id: str, contexts: dict[str, dict]) -> Optional[dict[str, Optional[dict]]]:
+    """제출한 리밸런싱 배치 결과 수집.
+
+    Returns:
+        처리 중이면 None, 종료되면 {symbol: 결과 dict 또는 None}
+    """
+    messages = await quant_analyst.collect_analysis_batch(batch_id)
+    if messages is None:
         return None
+    return _rebalance_results(contexts, messages)
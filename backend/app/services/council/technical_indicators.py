@@ -6,6 +6,8 @@ TechnicalAnalysisResult로 매핑한다. 계산 로직은 signals 모듈에 단
 """
 
 import logging
+import math
+from functools import cached_property
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 
@@ -49,8 +51,37 @@ class TechnicalAnalysisResult:
     # 종합 점수 (1-10)
     technical_score: Optional[int] = None
 
+    # 아래 파생 값은 첫 접근 시 계산되어 캐시됨 — 지표 매핑이 끝난 뒤에만 사용
+
+    @cached_property
+    def bb_percent(self) -> float:
+        """볼린저밴드 내 위치 (0=하단, 1=상단, 밴드 정보 없으면 NaN)"""
+        lower = self.bb_lower or 0
+        upper = self.bb_upper or 0
+        if lower <= 0 or upper <= 0 or self.current_price <= 0:
+            return math.nan
+        bb_range = upper - lower
+        return (self.current_price - lower) / bb_range if bb_range > 0 else 0.5
+
+    @cached_property
+    def ma_alignment(self) -> int:
+        """이동평균선 배열 (+1 정배열 MA5>MA20>MA60, -1 역배열, 0 그 외/데이터 부족)"""
+        ma5, ma20, ma60 = self.ma_5 or 0, self.ma_20 or 0, self.ma_60 or 0
+        if ma5 <= 0 or ma20 <= 0 or ma60 <= 0:
+            return 0
+        if ma5 > ma20 > ma60:
+            return 1
+        if ma5 < ma20 < ma60:
+            return -1
+        return 0
+
     def to_prompt_text(self) -> str:
-        """GPT 프롬프트용 텍스트 생성"""
+        """GPT 프롬프트용 텍스트 (첫 호출 시 렌더링 후 재사용)"""
+        return self._prompt_text
+
+    @cached_property
+    def _prompt_text(self) -> str:
+        """to_prompt_text() 렌더링 — 한 회의에서 분석가마다 같은 결과를 요청함"""
         lines = [
             f"현재가: {self.current_price:,}원",
             "",
@@ -80,7 +111,7 @@ class TechnicalAnalysisResult:
             f"- 20일 평균: {self.volume_avg_20:,}주" if self.volume_avg_20 else "- 거래량: 데이터 부족",
             f"- 거래량 비율: {self.volume_ratio:.1f}배" if self.volume_ratio else "",
         ]
-        return "\n".join(line for line in lines if line or line == "")
+        return "\n".join(lines)
 
 
 class TechnicalIndicatorCalculator:
@@ -98,55 +129,61 @@ class TechnicalIndicatorCalculator:
         result = TechnicalAnalysisResult(symbol=symbol, current_price=current_price)
 
         # RSI 매핑
-        if ind.rsi_14 is not None:
-            result.rsi_14 = ind.rsi_14
-            if ind.rsi_14 >= 70:
+        rsi = ind.rsi_14
+        if rsi is not None:
+            result.rsi_14 = rsi
+            if rsi >= 70:
                 result.rsi_signal = "과매수 (매도 신호)"
-            elif ind.rsi_14 <= 30:
+            elif rsi <= 30:
                 result.rsi_signal = "과매도 (매수 신호)"
             else:
                 result.rsi_signal = "중립"
 
         # MACD 매핑
         if ind.macd_line is not None:
+            histogram = ind.macd_histogram
             result.macd = ind.macd_line
             result.macd_signal = ind.macd_signal
-            result.macd_histogram = ind.macd_histogram
-            if ind.macd_histogram and ind.macd_histogram > 0:
+            result.macd_histogram = histogram
+            if histogram and histogram > 0:
                 result.macd_trend = "상승 추세"
-            elif ind.macd_histogram and ind.macd_histogram < 0:
+            elif histogram and histogram < 0:
                 result.macd_trend = "하락 추세"
             else:
                 result.macd_trend = "추세 전환 중"
 
         # 볼린저 밴드 매핑
         if ind.bb_middle > 0:
-            result.bb_upper = ind.bb_upper
+            bb_upper, bb_lower = ind.bb_upper, ind.bb_lower
+            result.bb_upper = bb_upper
             result.bb_middle = ind.bb_middle
-            result.bb_lower = ind.bb_lower
-            if current_price >= ind.bb_upper:
+            result.bb_lower = bb_lower
+            if current_price >= bb_upper:
                 result.bb_position = "상단 돌파 (과매수 주의)"
-            elif current_price <= ind.bb_lower:
+            elif current_price <= bb_lower:
                 result.bb_position = "하단 근접 (반등 가능)"
             else:
                 result.bb_position = "밴드 내 움직임"
 
         # 이동평균 매핑
-        result.ma_5 = ind.ma_5 or None
-        result.ma_20 = ind.ma_20 or None
-        result.ma_60 = ind.ma_60 or None
-        if ind.ma_5 and ind.ma_20 and ind.ma_60:
-            if ind.ma_5 > ind.ma_20 > ind.ma_60:
+        ma5, ma20, ma60 = ind.ma_5, ind.ma_20, ind.ma_60
+        result.ma_5 = ma5 or None
+        result.ma_20 = ma20 or None
+        result.ma_60 = ma60 or None
+        if ma5 and ma20 and ma60:
+            if ma5 > ma20 > ma60:
                 result.ma_trend = "정배열 (상승 추세)"
-            elif ind.ma_5 < ind.ma_20 < ind.ma_60:
+            elif ma5 < ma20 < ma60:
                 result.ma_trend = "역배열 (하락 추세)"
             else:
                 result.ma_trend = "혼조세"
 
         # 거래량 매핑
-        if ind.v20 > 0:
-            result.volume_avg_20 = int(ind.v20)
-            result.volume_ratio = round(ind.volume_shock, 2) if ind.volume_shock else None
+        v20 = ind.v20
+        if v20 > 0:
+            volume_shock = ind.volume_shock
+            result.volume_avg_20 = int(v20)
+            result.volume_ratio = round(volume_shock, 2) if volume_shock else None
 
         # 종합 점수
         result.technical_score = self._calculate_score(result)
@@ -157,35 +194,39 @@ class TechnicalIndicatorCalculator:
         """종합 기술적 점수 계산 (1-10)"""
         score = 5
 
-        if result.rsi_14:
-            if result.rsi_14 <= 30:
+        rsi = result.rsi_14
+        if rsi:
+            if rsi <= 30:
                 score += 2
-            elif result.rsi_14 >= 70:
+            elif rsi >= 70:
                 score -= 2
-            elif 40 <= result.rsi_14 <= 60:
+            elif 40 <= rsi <= 60:
                 score += 1
 
-        if result.macd_histogram:
-            if result.macd_histogram > 0:
+        histogram = result.macd_histogram
+        if histogram:
+            if histogram > 0:
                 score += 1
             else:
                 score -= 1
 
-        if result.bb_position:
-            if "하단" in result.bb_position:
+        bb_position = result.bb_position
+        if bb_position:
+            if "하단" in bb_position:
                 score += 1
-            elif "상단" in result.bb_position:
+            elif "상단" in bb_position:
                 score -= 1
 
-        if result.ma_trend:
-            if "정배열" in result.ma_trend:
+        ma_trend = result.ma_trend
+        if ma_trend:
+            if "정배열" in ma_trend:
                 score += 1
-            elif "역배열" in result.ma_trend:
+            elif "역배열" in ma_trend:
                 score -= 1
 
-        if result.volume_ratio:
-            if result.volume_ratio >= 2.0:
-                score += 1
+        volume_ratio = result.volume_ratio
+        if volume_ratio and volume_ratio >= 2.0:
+            score += 1
 
         return max(1, min(10, score))
 
@@ -9,11 +9,18 @@
 주의: 모든 시간 계산은 한국 시간(KST, UTC+9) 기준입니다.
 """
 
+import functools
 import logging
 from datetime import datetime, time, date, timedelta, timezone
-from typing import Tuple, Optional
+from pathlib import Path
+from typing import FrozenSet, Tuple, Optional
 from enum import Enum
 import asyncio
+import time as _time
+
+import orjson
+
+from app.config import settings
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +33,55 @@ def get_kst_now() -> datetime:
     return datetime.now(KST)
 
 
+# get_kst_now_cached() 재사용 허용 구간 (초, 이벤트 루프 시계 기준)
+_KST_NOW_MAX_AGE = 0.5
+_kst_now_cache: Optional[Tuple[datetime, float]] = None
+
+
+def get_kst_now_cached() -> datetime:
+    """한국 시간 현재 시각 (이벤트 루프 시계 기준 0.5초 캐시)
+
+    대기 큐 일괄 처리처럼 같은 틱에서 반복 호출되는 경로용.
+    감사 로그 등 정확한 시각이 필요한 곳은 get_kst_now()를 사용할 것.
+    """
+    global _kst_now_cache
+    try:
+        loop_time = asyncio.get_running_loop().time()
+    except RuntimeError:
+        return get_kst_now()
+
+    cached = _kst_now_cache
+    if cached is not None and loop_time - cached[1] <= _KST_NOW_MAX_AGE:
+        return cached[0]
+
+    now = get_kst_now()
+    _kst_now_cache = (now, loop_time)
+    return now
+
+
+def _read_holiday_cache(path: Path) -> set:
+    """KRX 휴장일 캐시 파일 읽기 (없거나 손상되면 빈 집합)"""
+    try:
+        raw = path.read_bytes()
+    except FileNotFoundError:
+        return set()
+    except OSError as e:
+        logger.warning(f"KRX 휴장일 캐시 읽기 실패 ({path}): {e}")
+        return set()
+
+    try:
+        return {date.fromisoformat(d) for d in orjson.loads(raw)}
+    except (orjson.JSONDecodeError, TypeError, ValueError) as e:
+        logger.warning(f"KRX 휴장일 캐시 형식 오류 ({path}): {e}")
+        return set()
+
+
+# 날짜 테이블 값 (_day_table)
+_DAY_TRADING = 0
+_DAY_WEEKEND = 1
+_DAY_HOLIDAY = 2
+
+
 class MarketSession(str, Enum):
     """시장 세션"""
     CLOSED = "closed"                    # 장 마감
@@ -52,7 +108,10 @@ class TradingHoursChecker:
     POST_MARKET_2_OPEN = time(18, 0)
     POST_MARKET_2_CLOSE = time(18, 30)
 
-    # 2025-2026 한국 공휴일 (매년 업데이트 필요)
+    # can_execute_order() 결과 캐시 유효 시간 (초)
+    ORDER_CHECK_TTL = 1.0
+
+    # 2025-2026 한국 공휴일 (오프라인 폴백 — 이후 연도는 KRX 휴장일 캐시 파일로 확장)
     HOLIDAYS_2025 = {
         date(2025, 1, 1),   # 신정
         date(2025, 1, 28),  # 설날 연휴
@@ -88,23 +147,56 @@ class TradingHoursChecker:
     }
 
     def __init__(self):
-        self._holidays = self.HOLIDAYS_2025 | self.HOLIDAYS_2026
-        self._last_covered_year = 2026
+        # date 객체 해싱 대신 정수 서수(toordinal) 비교 (프로세스당 1회 로드)
+        self._holiday_ordinals, first_year, self._last_covered_year = self._load_holidays()
+        # 휴일 데이터가 있는 기간의 날짜별 판정 테이블 (서수 - 기준 서수 → 0/1/2)
+        self._base_ordinal = date(first_year, 1, 1).toordinal()
+        self._day_table = self._build_day_table(
+            self._base_ordinal, date(self._last_covered_year, 12, 31).toordinal()
+        )
+        self._order_check_cache: Optional[Tuple[Tuple[bool, str], float]] = None
+        # 공휴일 집합은 인스턴스 생성 후 바뀌지 않으므로 다음 거래일은 날짜만으로 결정됨
+        self._next_trading_ordinal = functools.lru_cache(maxsize=1024)(
+            self._scan_next_trading_ordinal
+        )
         current_year = get_kst_now().year
         if current_year > self._last_covered_year:
             logger.warning(
                 "⚠️ TRADING CALENDAR OUT OF DATE: %d년 휴일 데이터 없음. "
-                "trading_hours.py에 HOLIDAYS_%d를 추가하세요.",
-                current_year, current_year,
+                "KRX 휴장일 캐시(%s)를 갱신하세요.",
+                current_year, settings.krx_holiday_cache_path,
             )
 
+    @classmethod
+    @functools.lru_cache(maxsize=1)
+    def _load_holidays(cls) -> Tuple[FrozenSet[int], int, int]:
+        """휴장일 서수 집합과 데이터 연도 범위 (하드코딩 + KRX 휴장일 캐시 파일)"""
+        holidays = cls.HOLIDAYS_2025 | cls.HOLIDAYS_2026
+        holidays |= _read_holiday_cache(Path(settings.krx_holiday_cache_path).expanduser())
+        years = [d.year for d in holidays]
+        return frozenset(d.toordinal() for d in holidays), min(years), max(years)
+
+    def _build_day_table(self, first_ordinal: int, last_ordinal: int) -> bytes:
+        """날짜별 거래일/주말/공휴일 테이블 (주말과 겹친 공휴일은 공휴일로 표기)"""
+        table = bytearray(last_ordinal - first_ordinal + 1)
+        for offset in range(len(table)):
+            ordinal = first_ordinal + offset
+            if ordinal in self._holiday_ordinals:
+                table[offset] = _DAY_HOLIDAY
+            elif date.fromordinal(ordinal).weekday() >= 5:
+                table[offset] = _DAY_WEEKEND
+        return bytes(table)
+
     def is_holiday(self, dt: Optional[datetime] = None) -> bool:
         """공휴일 여부 확인"""
         if dt is None:
             dt = get_kst_now()
+        index = dt.toordinal() - self._base_ordinal
+        if 0 <= index < len(self._day_table):
+            return self._day_table[index] == _DAY_HOLIDAY
         if dt.year > self._last_covered_year:
             return False  # 데이터 없으면 거래일로 간주 (경고는 __init__에서)
-        return dt.date() in self._holidays
+        return dt.toordinal() in self._holiday_ordinals
 
     def is_weekend(self, dt: Optional[datetime] = None) -> bool:
         """주말 여부 확인"""
@@ -116,8 +208,20 @@ class TradingHoursChecker:
         """거래일 여부 확인"""
         if dt is None:
             dt = get_kst_now()
+        index = dt.toordinal() - self._base_ordinal
+        if 0 <= index < len(self._day_table):
+            return self._day_table[index] == _DAY_TRADING
         return not self.is_weekend(dt) and not self.is_holiday(dt)
 
+    def _is_trading_date(self, d: date) -> bool:
+        """날짜 단위 거래일 판정 (테이블 조회, 범위 밖이면 주말/공휴일 규칙)"""
+        index = d.toordinal() - self._base_ordinal
+        if 0 <= index < len(self._day_table):
+            return self._day_table[index] == _DAY_TRADING
+        if d.weekday() >= 5:
+            return False
+        return d.year > self._last_covered_year or d.toordinal() not in self._holiday_ordinals
+
     def get_market_session(self, dt: Optional[datetime] = None) -> MarketSession:
         """현재 시장 세션 확인"""
         if dt is None:
@@ -148,10 +252,25 @@ class TradingHoursChecker:
         return MarketSession.CLOSED
 
     def can_execute_order(self, dt: Optional[datetime] = None) -> Tuple[bool, str]:
-        """주문 실행 가능 여부 확인"""
-        if dt is None:
-            dt = get_kst_now()
+        """주문 실행 가능 여부 확인
+
+        dt 미지정(현재 시각) 호출은 ORDER_CHECK_TTL 동안 결과를 재사용한다.
+        승인/체결 요청이 몰려도 시각·휴일 판정을 매번 반복하지 않도록.
+        """
+        if dt is not None:
+            return self._evaluate_order_window(dt)
+
+        now = _time.monotonic()
+        cached = self._order_check_cache
+        if cached is not None and now - cached[1] < self.ORDER_CHECK_TTL:
+            return cached[0]
+
+        result = self._evaluate_order_window(get_kst_now())
+        self._order_check_cache = (result, now)
+        return result
 
+    def _evaluate_order_window(self, dt: datetime) -> Tuple[bool, str]:
+        """주어진 시각의 주문 가능 여부 판정"""
         session = self.get_market_session(dt)
 
         if session == MarketSession.REGULAR:
@@ -207,14 +326,19 @@ class TradingHoursChecker:
                     return combine_kst(current_date, self.POST_MARKET_2_OPEN), MarketSession.POST_MARKET
                 return dt, MarketSession.POST_MARKET
 
-        # 다음 거래일 찾기
+        # 다음 거래일 찾기 (날짜별 결과 캐시)
+        next_date = date.fromordinal(self._next_trading_ordinal(current_date.toordinal()))
+        return combine_kst(next_date, self.PRE_MARKET_OPEN), MarketSession.PRE_MARKET
+
+    def _scan_next_trading_ordinal(self, ordinal: int) -> int:
+        """ordinal 다음 거래일의 서수 (최대 30일 탐색)"""
+        current_date = date.fromordinal(ordinal)
         next_date = current_date + timedelta(days=1)
-        while not self.is_trading_day(combine_kst(next_date, time(12, 0))):
+        while not self._is_trading_date(next_date):
             next_date += timedelta(days=1)
             if (next_date - current_date).days > 30:  # 안전장치
                 break
-
-        return combine_kst(next_date, self.PRE_MARKET_OPEN), MarketSession.PRE_MARKET
+        return next_date.toordinal()
 
     def time_until_market_open(self, dt: Optional[datetime] = None) -> Optional[int]:
         """시장 오픈까지 남은 시간(초) 반환, 이미 열려있으면 None"""
@@ -275,14 +399,26 @@ class TradingHoursChecker:
 trading_hours = TradingHoursChecker()
 
 
+# 시장 대기 중 최대 연속 수면 시간 (벽시계 보정·로그 주기)
+MARKET_WAIT_MAX_SLEEP = 3600
+
+
 async def wait_for_market_open():
-    """시장 오픈까지 대기 (비동기)"""
+    """시장 오픈까지 대기 (비동기)
+
+    다음 세션 시작 시각까지 곧바로 잠들고(최대 1시간), 깨어날 때만 다시 판정한다.
+    """
     while True:
-        can_trade, reason = trading_hours.can_execute_order()
+        now = get_kst_now()
+        can_trade, reason = trading_hours.can_execute_order(now)
         if can_trade:
             return
 
-        # 다음 체크까지 대기 (1분 또는 남은 시간)
-        wait_seconds = min(60, trading_hours.time_until_market_open() or 60)
-        logger.info(f"시장 대기 중: {reason} - {wait_seconds}초 후 재확인")
+        next_session, _ = trading_hours.get_next_trading_session(now)
+        remaining = (next_session - now).total_seconds()
+        wait_seconds = max(1, min(MARKET_WAIT_MAX_SLEEP, int(remaining)))
+        logger.info(
+            f"시장 대기 중: {reason} - 다음 거래 {next_session.strftime('%m/%d %H:%M')}, "
+            f"{wait_seconds}초 후 재확인"
+        )
         await asyncio.sleep(wait_seconds)
@@ -10,16 +10,21 @@ API 문서: https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS001
 """
 
 import asyncio
+import functools
 import logging
-from typing import Optional, Dict, Any, List
-from dataclasses import dataclass
+import os
+import tempfile
+import time
+from typing import Optional, Dict, Any, List, Tuple
+from dataclasses import asdict, dataclass
 from datetime import datetime
+from pathlib import Path
 import zipfile
 import io
-import xml.etree.ElementTree as ET
-import json
 
 import httpx
+import orjson
+from lxml import etree
 
 from app.config import settings
 from app.core.redis import get_redis
@@ -27,7 +32,32 @@ from app.core.redis import get_redis
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+# 금액 표기 단위
+_TRILLION = 1_000_000_000_000  # 조
+_HUNDRED_MILLION = 100_000_000  # 억
+
+
+def _fmt_won(val: Optional[int]) -> str:
+    """금액 → "1.2조원" / "350억원" / "1,234원" (없으면 N/A)"""
+    if val is None:
+        return "N/A"
+    magnitude = abs(val)
+    if magnitude >= _TRILLION:
+        return f"{val / _TRILLION:.1f}조원"
+    if magnitude >= _HUNDRED_MILLION:
+        return f"{val / _HUNDRED_MILLION:.0f}억원"
+    return f"{val:,}원"
+
+
+def _fmt_pct(val: Optional[float]) -> str:
+    return "N/A" if val is None else f"{val:.1f}%"
+
+
+def _fmt_ratio(val: Optional[float]) -> str:
+    return "N/A" if val is None else f"{val:.2f}"
+
+
+@dataclass(slots=True)
 class CompanyInfo:
     """기업 기본 정보"""
     corp_code: str          # DART 고유번호
@@ -41,7 +71,7 @@ class CompanyInfo:
     employees: int          # 직원수
 
 
-@dataclass
+@dataclass(slots=True)
 class FinancialData:
     """재무제표 데이터"""
     corp_code: str
@@ -72,51 +102,182 @@ class FinancialData:
 
     def to_prompt_text(self) -> str:
         """Claude 프롬프트용 텍스트 생성"""
-        def fmt_num(val: Optional[int]) -> str:
-            if val is None:
-                return "N/A"
-            if abs(val) >= 1_000_000_000_000:  # 조
-                return f"{val / 1_000_000_000_000:.1f}조원"
-            elif abs(val) >= 100_000_000:  # 억
-                return f"{val / 100_000_000:.0f}억원"
-            else:
-                return f"{val:,}원"
-
-        def fmt_pct(val: Optional[float]) -> str:
-            if val is None:
-                return "N/A"
-            return f"{val:.1f}%"
-
-        def fmt_ratio(val: Optional[float]) -> str:
-            if val is None:
-                return "N/A"
-            return f"{val:.2f}"
-
-        lines = [
-            f"📊 {self.corp_name} ({self.stock_code}) - {self.fiscal_year} 재무제표",
-            "",
-            "【손익계산서】",
-            f"- 매출액: {fmt_num(self.revenue)}",
-            f"- 영업이익: {fmt_num(self.operating_income)}",
-            f"- 당기순이익: {fmt_num(self.net_income)}",
-            "",
-            "【재무상태표】",
-            f"- 자산총계: {fmt_num(self.total_assets)}",
-            f"- 부채총계: {fmt_num(self.total_liabilities)}",
-            f"- 자본총계: {fmt_num(self.total_equity)}",
-            "",
-            "【주요 재무비율】",
-            f"- PER: {fmt_ratio(self.per)}배",
-            f"- PBR: {fmt_ratio(self.pbr)}배",
-            f"- ROE: {fmt_pct(self.roe)}",
-            f"- 부채비율: {fmt_pct(self.debt_ratio)}",
-            f"- 영업이익률: {fmt_pct(self.operating_margin)}",
-            "",
-            "【성장성】",
-            f"- 매출 성장률: {fmt_pct(self.revenue_growth)}",
-            f"- 순이익 성장률: {fmt_pct(self.income_growth)}",
-        ]
-        return "\n".join(lines)
+        return (
+            f"📊 {self.corp_name} ({self.stock_code}) - {self.fiscal_year} 재무제표\n"
+            "\n"
+            "【손익계산서】\n"
+            f"- 매출액: {_fmt_won(self.revenue)}\n"
+            f"- 영업이익: {_fmt_won(self.operating_income)}\n"
+            f"- 당기순이익: {_fmt_won(self.net_income)}\n"
+            "\n"
+            "【재무상태표】\n"
+            f"- 자산총계: {_fmt_won(self.total_assets)}\n"
+            f"- 부채총계: {_fmt_won(self.total_liabilities)}\n"
+            f"- 자본총계: {_fmt_won(self.total_equity)}\n"
+            "\n"
+            "【주요 재무비율】\n"
+            f"- PER: {_fmt_ratio(self.per)}배\n"
+            f"- PBR: {_fmt_ratio(self.pbr)}배\n"
+            f"- ROE: {_fmt_pct(self.roe)}\n"
+            f"- 부채비율: {_fmt_pct(self.debt_ratio)}\n"
+            f"- 영업이익률: {_fmt_pct(self.operating_margin)}\n"
+            "\n"
+            "【성장성】\n"
+            f"- 매출 성장률: {_fmt_pct(self.revenue_growth)}\n"
+            f"- 순이익 성장률: {_fmt_pct(self.income_growth)}"
+        )
+
+
+# 성장률을 함께 계산하는 계정 → 성장률 필드
+_GROWTH_FIELDS = {"revenue": "revenue_growth", "net_income": "income_growth"}
+
+# fnlttSinglAcnt(단일회사 주요계정)가 돌려주는 표준 계정과목명 → FinancialData 필드
+# (None = 매핑 대상 아님). 표준명은 첫 호출부터 dict 조회 한 번으로 끝난다.
+_ACCOUNT_FIELDS: Dict[str, Optional[str]] = {
+    "매출액": "revenue",
+    "수익(매출액)": "revenue",
+    "영업이익": "operating_income",
+    "당기순이익": "net_income",
+    "당기순이익(손실)": "net_income",
+    "당기순손익": "net_income",
+    "자산총계": "total_assets",
+    "부채총계": "total_liabilities",
+    "자본총계": "total_equity",
+    "유동자산": None,
+    "비유동자산": None,
+    "유동부채": None,
+    "비유동부채": None,
+    "자본금": None,
+    "이익잉여금": None,
+    "법인세차감전 순이익": None,
+}
+
+# 계정과목명 → 필드 캐시 (표준명으로 시작, 그 외 이름은 부분 문자열 매칭 결과 메모이즈)
+_ACCOUNT_FIELD_CACHE: Dict[str, Optional[str]] = dict(_ACCOUNT_FIELDS)
+_ACCOUNT_FIELD_CACHE_MAX = 4096
+
+
+def _scan_account_field(account_nm: str) -> Optional[str]:
+    """부분 문자열 매칭으로 계정과목명 → 필드명 (표준명 외 변형 이름용)"""
+    if "매출액" in account_nm or "수익(매출액)" in account_nm:
+        return "revenue"
+    if "영업이익" in account_nm:
+        return "operating_income"
+    if "당기순이익" in account_nm or "당기순손익" in account_nm:
+        return "net_income"
+    if "자산총계" in account_nm:
+        return "total_assets"
+    if "부채총계" in account_nm:
+        return "total_liabilities"
+    if "자본총계" in account_nm:
+        return "total_equity"
+    return None
+
+
+def _account_field(account_nm: str) -> Optional[str]:
+    """계정과목명을 FinancialData 필드명으로 매핑 (해당 없으면 None)"""
+    try:
+        return _ACCOUNT_FIELD_CACHE[account_nm]
+    except KeyError:
+        pass
+
+    field = _scan_account_field(account_nm)
+    if len(_ACCOUNT_FIELD_CACHE) < _ACCOUNT_FIELD_CACHE_MAX:
+        _ACCOUNT_FIELD_CACHE[account_nm] = field
+    return field
+
+
+@functools.lru_cache(maxsize=16)
+def _report_attempts(current_year: int, current_month: int) -> Tuple[Tuple[str, str], ...]:
+    """조회 시점(연/월)별 보고서 시도 순서 (가장 최신 데이터부터)
+
+    1월: 전년도 3분기 → 반기 → 전전년도 사업보고서
+    4월 이후: 올해 1분기 → 전년도 사업보고서 등
+    """
+    if current_month <= 3:
+        # 1~3월: 전년도 3분기 → 반기 → 1분기 → 전전년도 사업보고서
+        return (
+            (str(current_year - 1), "11014"),  # 전년도 3분기
+            (str(current_year - 1), "11012"),  # 전년도 반기
+            (str(current_year - 1), "11013"),  # 전년도 1분기
+            (str(current_year - 2), "11011"),  # 전전년도 사업보고서
+        )
+    elif current_month <= 5:
+        # 4~5월: 전년도 사업보고서 → 전년도 3분기
+        return (
+            (str(current_year - 1), "11011"),  # 전년도 사업보고서
+            (str(current_year - 1), "11014"),  # 전년도 3분기
+            (str(current_year - 1), "11012"),  # 전년도 반기
+        )
+    elif current_month <= 8:
+        # 6~8월: 올해 1분기 → 전년도 사업보고서
+        return (
+            (str(current_year), "11013"),      # 올해 1분기
+            (str(current_year - 1), "11011"),  # 전년도 사업보고서
+            (str(current_year - 1), "11014"),  # 전년도 3분기
+        )
+    elif current_month <= 11:
+        # 9~11월: 올해 반기 → 1분기 → 전년도 사업보고서
+        return (
+            (str(current_year), "11012"),      # 올해 반기
+            (str(current_year), "11013"),      # 올해 1분기
+            (str(current_year - 1), "11011"),  # 전년도 사업보고서
+        )
+    else:
+        # 12월: 올해 3분기 → 반기 → 전년도 사업보고서
+        return (
+            (str(current_year), "11014"),      # 올해 3분기
+            (str(current_year), "11012"),      # 올해 반기
+            (str(current_year - 1), "11011"),  # 전년도 사업보고서
+        )
+
+
+def _strip_commas(value: str) -> str:
+    """천 단위 구분자 제거 (쉼표가 없으면 새 문자열을 만들지 않는다)"""
+    return value.replace(",", "") if "," in value else value
+
+
+def _parse_amount(value: Optional[str]) -> Optional[int]:
+    """DART 금액 문자열("1,234" / "-" / "") → int"""
+    if not value or value == "-":
+        return None
+    return int(_strip_commas(value))
+
+
+def _read_corp_code_file(path: Path, max_age: float) -> Optional[Dict[str, str]]:
+    """고유번호 로컬 캐시 파일 읽기 (없거나 오래됐거나 손상되면 None)"""
+    try:
+        if time.time() - path.stat().st_mtime > max_age:
+            return None
+        raw = path.read_bytes()
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        logger.warning(f"DART 고유번호 캐시 파일 읽기 실패 ({path}): {e}")
+        return None
+
+    try:
+        corp_codes = orjson.loads(raw)
+    except orjson.JSONDecodeError as e:
+        logger.warning(f"DART 고유번호 캐시 파일 형식 오류 ({path}): {e}")
+        return None
+    return corp_codes if isinstance(corp_codes, dict) and corp_codes else None
+
+
+def _write_corp_code_file(path: Path, corp_codes: Dict[str, str]) -> None:
+    """고유번호 로컬 캐시 파일 쓰기 (임시 파일 후 교체 — 동시 실행 워커가 반쯤 쓴 파일을 읽지 않도록)"""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(orjson.dumps(corp_codes))
+            os.replace(tmp_name, path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    except OSError as e:
+        logger.warning(f"DART 고유번호 캐시 파일 저장 실패 ({path}): {e}")
 
 
 class DartClient:
@@ -124,9 +285,70 @@ class DartClient:
 
     BASE_URL = "https://opendart.fss.or.kr/api"
 
+    # 조회 결과 Redis 캐시 유효 시간 (공시는 분기 단위로 갱신)
+    RESPONSE_CACHE_TTL = 86400
+
+    # 고유번호 목록 캐시 유효 시간 (Redis/로컬 파일 공통 — 상장기업 목록은 자주 변하지 않음)
+    CORP_CODE_CACHE_TTL = 604800
+
+    # 재무제표 보고서 후보 동시 조회 수 (DART 호출 한도를 고려해 2건씩만 앞당겨 요청)
+    REPORT_FANOUT = 2
+
+    # 공용 연결 풀 (keep-alive로 TCP/TLS 연결 재사용)
+    # 한 회의의 DART 조회는 수십 초 간격으로 몰려오므로 유휴 연결을 기본(5초)보다 오래 유지
+    HTTP_LIMITS = httpx.Limits(
+        max_connections=20, max_keepalive_connections=20, keepalive_expiry=30.0,
+    )
+
     def __init__(self):
         self._api_key = settings.dart_api_key
         self._corp_code_cache: Dict[str, str] = {}  # 종목코드 -> DART 고유번호 캐시
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._corp_code_lock: Optional[asyncio.Lock] = None
+        self._corp_code_lock_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._preload_task: Optional[asyncio.Task] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """공용 AsyncClient (이벤트 루프별 1개 — Celery는 태스크마다 새 루프를 만든다)"""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(timeout=30.0, limits=self.HTTP_LIMITS)
+            self._client_loop = loop
+        return self._client
+
+    def _get_corp_code_lock(self) -> asyncio.Lock:
+        """고유번호 목록 로드 직렬화용 Lock (이벤트 루프별 1개)"""
+        loop = asyncio.get_running_loop()
+        if self._corp_code_lock is None or self._corp_code_lock_loop is not loop:
+            self._corp_code_lock = asyncio.Lock()
+            self._corp_code_lock_loop = loop
+        return self._corp_code_lock
+
+    def start_corp_code_preload(self) -> asyncio.Task:
+        """고유번호 목록 백그라운드 로드 시작 (앱 시작을 ZIP 다운로드/파싱에 묶어두지 않음)
+
+        로드 중 들어온 get_corp_code는 같은 Lock을 기다렸다가 결과를 재사용한다.
+        """
+        if self._preload_task is None or self._preload_task.done():
+            self._preload_task = asyncio.create_task(self._preload_corp_codes())
+        return self._preload_task
+
+    async def _preload_corp_codes(self) -> None:
+        async with self._get_corp_code_lock():
+            if not self._corp_code_cache:
+                await self._load_corp_codes()
+
+    async def close(self) -> None:
+        """연결 풀 종료 (앱 종료 시)"""
+        if self._preload_task is not None and not self._preload_task.done():
+            self._preload_task.cancel()
+            await asyncio.gather(self._preload_task, return_exceptions=True)
+        self._preload_task = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._client_loop = None
 
     async def _request(
         self,
@@ -142,104 +364,151 @@ class DartClient:
         if params:
             request_params.update(params)
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(url, params=request_params)
-            response.raise_for_status()
+        response = await self._get_client().get(url, params=request_params)
+        response.raise_for_status()
+
+        # JSON 응답
+        if "json" in response.headers.get("content-type", ""):
+            data = orjson.loads(response.content)
+            if data.get("status") != "000":
+                logger.warning(f"DART API 오류: {data.get('message')}")
+            return data
 
-            # JSON 응답
-            if "json" in response.headers.get("content-type", ""):
-                data = response.json()
-                if data.get("status") != "000":
-                    logger.warning(f"DART API 오류: {data.get('message')}")
-                return data
+        # XML 응답 (고유번호 조회 등)
+        return {"content": response.content}
+
+    async def _cache_get(self, key: str) -> Optional[Dict[str, Any]]:
+        """조회 결과 캐시 읽기 (Redis 장애 시 캐시 미스로 처리)"""
+        try:
+            redis = await get_redis()
+            cached = await redis.get(key)
+            return orjson.loads(cached) if cached else None
+        except Exception as e:
+            logger.debug(f"DART 캐시 조회 실패 ({key}): {e}")
+            return None
 
-            # XML 응답 (고유번호 조회 등)
-            return {"content": response.content}
+    async def _cache_set(self, key: str, value: Dict[str, Any]) -> None:
+        """조회 결과 캐시 저장 (실패해도 조회 결과에는 영향 없음)"""
+        try:
+            redis = await get_redis()
+            await redis.set(key, orjson.dumps(value), ex=self.RESPONSE_CACHE_TTL)
+        except Exception as e:
+            logger.debug(f"DART 캐시 저장 실패 ({key}): {e}")
 
     async def _load_corp_codes(self) -> bool:
         """DART 기업 고유번호 전체 목록 로드 (ZIP 파일)"""
-        try:
-            # API 키 확인
-            if not self._api_key:
-                logger.error("DART_API_KEY가 설정되지 않았습니다")
-                return False
+        cache_path = Path(settings.dart_corp_code_cache_path).expanduser()
+
+        # 로컬 파일 캐시 확인 (프로세스 재시작 시 Redis 왕복 없이 로드)
+        cached_codes = await asyncio.to_thread(
+            _read_corp_code_file, cache_path, self.CORP_CODE_CACHE_TTL
+        )
+        if cached_codes:
+            self._corp_code_cache = cached_codes
+            logger.info(f"DART 고유번호 파일 캐시 로드: {len(self._corp_code_cache)}개 기업")
+            return True
 
-            # Redis 캐시 확인
+        try:
+            # Redis 캐시 확인 (캐시가 있으면 다운로드 불필요 — API 키 없이도 사용 가능)
             redis = await get_redis()
             cache_key = "dart:corp_codes"
             cached = await redis.get(cache_key)
 
             if cached:
-                self._corp_code_cache = json.loads(cached)
+                self._corp_code_cache = orjson.loads(cached)
                 logger.info(f"DART 고유번호 캐시 로드: {len(self._corp_code_cache)}개 기업")
+                await asyncio.to_thread(_write_corp_code_file, cache_path, self._corp_code_cache)
                 return True
 
+            # API 키 확인
+            if not self._api_key:
+                logger.error("DART_API_KEY가 설정되지 않았습니다")
+                return False
+
             # DART API에서 ZIP 파일 다운로드
             url = f"{self.BASE_URL}/corpCode.xml"
             params = {"crtfc_key": self._api_key}
 
             logger.info(f"DART 고유번호 목록 다운로드 시작...")
 
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.get(url, params=params)
-                response.raise_for_status()
-
-                # 응답이 JSON 에러인지 확인 (DART는 에러시 JSON 반환)
-                content_type = response.headers.get("content-type", "")
-                if "json" in content_type or response.content[:1] == b'{':
-                    try:
-                        error_data = response.json()
-                        logger.error(f"DART API 에러: {error_data.get('message', error_data)}")
-                        return False
-                    except json.JSONDecodeError:
-                        pass
-
-                # XML 에러 응답 확인 (시스템 점검 등)
-                if response.content[:5] == b'<?xml':
-                    try:
-                        error_root = ET.fromstring(response.content)
-                        status = error_root.findtext('status', '')
-                        message = error_root.findtext('message', '')
-                        logger.error(f"DART API XML 에러 (status={status}): {message}")
-                    except ET.ParseError:
-                        logger.error(f"DART 응답 XML 파싱 실패: {response.content[:200]}")
-                    return False
+            response = await self._get_client().get(url, params=params, timeout=60.0)
+            response.raise_for_status()
 
-                # ZIP 파일인지 확인 (ZIP 매직 넘버: PK)
-                if response.content[:2] != b'PK':
-                    logger.error(f"DART 응답이 ZIP 파일이 아닙니다. 처음 100바이트: {response.content[:100]}")
+            # 응답이 JSON 에러인지 확인 (DART는 에러시 JSON 반환)
+            content_type = response.headers.get("content-type", "")
+            if "json" in content_type or response.content[:1] == b'{':
+                try:
+                    error_data = orjson.loads(response.content)
+                    logger.error(f"DART API 에러: {error_data.get('message', error_data)}")
                     return False
+                except orjson.JSONDecodeError:
+                    pass
+
+            # XML 에러 응답 확인 (시스템 점검 등)
+            if response.content[:5] == b'<?xml':
+                try:
+                    error_root = etree.fromstring(response.content)
+                    status = error_root.findtext('status', '')
+                    message = error_root.findtext('message', '')
+                    logger.error(f"DART API XML 에러 (status={status}): {message}")
+                except etree.XMLSyntaxError:
+                    logger.error(f"DART 응답 XML 파싱 실패: {response.content[:200]}")
+                return False
 
-                # ZIP 파일 처리
-                zip_buffer = io.BytesIO(response.content)
-                with zipfile.ZipFile(zip_buffer, 'r') as zip_file:
-                    # CORPCODE.xml 파일 읽기
-                    xml_content = zip_file.read('CORPCODE.xml')
-
-                    # XML 파싱
-                    root = ET.fromstring(xml_content)
-                    for corp in root.findall('.//list'):
-                        corp_code = corp.findtext('corp_code', '')
-                        stock_code = corp.findtext('stock_code', '')
+            # ZIP 파일인지 확인 (ZIP 매직 넘버: PK)
+            if response.content[:2] != b'PK':
+                logger.error(f"DART 응답이 ZIP 파일이 아닙니다. 처음 100바이트: {response.content[:100]}")
+                return False
 
-                        # 상장기업만 (종목코드가 있는 경우)
-                        if stock_code and stock_code.strip():
-                            self._corp_code_cache[stock_code.strip()] = corp_code
+            # ZIP 파일 처리 — 10MB 가량의 XML을 스트리밍 파싱 (이벤트 루프 차단 방지용 스레드)
+            self._corp_code_cache = await asyncio.to_thread(
+                self._parse_corp_codes, response.content
+            )
 
-                logger.info(f"DART 고유번호 로드 완료: {len(self._corp_code_cache)}개 상장기업")
+            logger.info(f"DART 고유번호 로드 완료: {len(self._corp_code_cache)}개 상장기업")
 
-                # Redis 캐시 저장 (7일 — 상장기업 목록은 자주 변하지 않음)
-                await redis.set(cache_key, json.dumps(self._corp_code_cache), ex=604800)
+            # 로컬 파일 + Redis 캐시 저장 (7일)
+            await asyncio.to_thread(_write_corp_code_file, cache_path, self._corp_code_cache)
+            await redis.set(cache_key, orjson.dumps(self._corp_code_cache), ex=self.CORP_CODE_CACHE_TTL)
 
-                return True
+            return True
 
         except zipfile.BadZipFile as e:
             logger.error(f"DART ZIP 파일 파싱 실패: {e}")
             return False
+        except etree.XMLSyntaxError as e:
+            logger.error(f"DART 고유번호 XML 파싱 실패: {e}")
+            return False
         except Exception as e:
             logger.error(f"DART 고유번호 목록 로드 실패: {e}")
             return False
 
+    @staticmethod
+    def _parse_corp_codes(zip_bytes: bytes) -> Dict[str, str]:
+        """corpCode ZIP → {종목코드: DART 고유번호} (상장기업만).
+
+        전체 DOM을 만들지 않고 lxml iterparse로 <list> 단위 처리 후 즉시 해제한다.
+        처리한 <list>는 루트에서도 떼어내 빈 요소 10만여 개가 쌓이지 않게 한다.
+        (lxml findtext는 호출당 비용이 커서 자식 요소를 직접 순회)
+        """
+        corp_codes: Dict[str, str] = {}
+        with zipfile.ZipFile(io.BytesIO(zip_bytes), 'r') as zip_file:
+            with zip_file.open('CORPCODE.xml') as xml_stream:
+                for _, elem in etree.iterparse(xml_stream, events=('end',), tag='list'):
+                    corp_code = stock_code = None
+                    for child in elem:
+                        if child.tag == 'stock_code':
+                            stock_code = child.text
+                        elif child.tag == 'corp_code':
+                            corp_code = child.text
+                    # 상장기업만 (종목코드가 있는 경우)
+                    if stock_code and not stock_code.isspace():
+                        corp_codes[stock_code.strip()] = corp_code or ''
+                    elem.clear(keep_tail=True)
+                    while elem.getprevious() is not None:
+                        del elem.getparent()[0]
+        return corp_codes
+
     async def get_corp_code(self, stock_code: str) -> Optional[str]:
         """종목코드로 DART 고유번호 조회"""
         # 캐시 확인
@@ -247,26 +516,34 @@ class DartClient:
             return self._corp_code_cache[stock_code]
 
         # 캐시가 비어있으면 전체 목록 로드 (최대 2회 시도)
+        # 동시 조회가 몰려도 ZIP 다운로드/파싱은 한 번만 — 나머지는 Lock 대기 후 결과 재사용
         if not self._corp_code_cache:
-            for attempt in range(2):
-                success = await self._load_corp_codes()
-                if success:
-                    break
-                if attempt == 0:
-                    logger.info("DART 기업코드 로드 재시도 (3초 후)...")
-                    await asyncio.sleep(3)
+            async with self._get_corp_code_lock():
+                if not self._corp_code_cache:
+                    for attempt in range(2):
+                        success = await self._load_corp_codes()
+                        if success:
+                            break
+                        if attempt == 0:
+                            logger.info("DART 기업코드 로드 재시도 (3초 후)...")
+                            await asyncio.sleep(3)
 
         return self._corp_code_cache.get(stock_code)
 
     async def get_company_info(self, corp_code: str) -> Optional[CompanyInfo]:
-        """기업 개황 조회"""
+        """기업 개황 조회 (Redis 24시간 캐시)"""
+        cache_key = f"dart:company:{corp_code}"
+        cached = await self._cache_get(cache_key)
+        if cached:
+            return CompanyInfo(**cached)
+
         try:
             data = await self._request("company.json", {"corp_code": corp_code})
 
             if data.get("status") != "000":
                 return None
 
-            return CompanyInfo(
+            info = CompanyInfo(
                 corp_code=corp_code,
                 corp_name=data.get("corp_name", ""),
                 stock_code=data.get("stock_code", ""),
@@ -282,6 +559,48 @@ class DartClient:
             logger.error(f"기업 개황 조회 실패: {e}")
             return None
 
+        await self._cache_set(cache_key, asdict(info))
+        return info
+
+    async def _fetch_first_report(
+        self,
+        corp_code: str,
+        report_attempts: List[Tuple[str, str]],
+    ) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """보고서 후보를 REPORT_FANOUT건씩 동시 요청해 우선순위가 가장 높은 성공 응답 반환
+
+        응답은 후보 순서대로 확인하므로 늦게 도착한 최신 보고서가 오래된 보고서에 밀리지 않는다.
+        성공 응답을 찾으면 아직 대기/진행 중인 나머지 요청은 취소한다.
+        """
+        semaphore = asyncio.Semaphore(self.REPORT_FANOUT)
+
+        async def attempt(try_year: str, try_report_code: str) -> Dict[str, Any]:
+            async with semaphore:
+                # 단일회사 주요계정 조회 API
+                return await self._request("fnlttSinglAcnt.json", {
+                    "corp_code": corp_code,
+                    "bsns_year": try_year,
+                    "reprt_code": try_report_code,
+                })
+
+        tasks = [asyncio.create_task(attempt(y, rc)) for y, rc in report_attempts]
+        try:
+            for (try_year, try_report_code), task in zip(report_attempts, tasks):
+                try:
+                    data = await task
+                except Exception as e:
+                    logger.debug(f"DART 재무제표 시도 실패 ({try_year}, {try_report_code}): {e}")
+                    continue
+
+                if data.get("status") == "000" and data.get("list"):
+                    logger.info(f"DART 재무제표 조회 성공: {try_year}년 보고서({try_report_code})")
+                    return try_year, data
+            return None
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
     async def get_financial_statements(
         self,
         corp_code: str,
@@ -295,75 +614,27 @@ class DartClient:
         - 11012: 반기보고서
         - 11013: 1분기보고서
         - 11014: 3분기보고서
+
+        결과는 (고유번호, 지정 연도/보고서, 조회 월) 단위로 Redis에 24시간 캐시한다.
         """
-        current_year = datetime.now().year
-        current_month = datetime.now().month
-
-        # 보고서 유형 순서 결정 (가장 최신 데이터부터)
-        # 1월: 전년도 3분기 → 반기 → 전전년도 사업보고서
-        # 4월 이후: 올해 1분기 → 전년도 사업보고서 등
-        report_attempts = []
-
-        if current_month <= 3:
-            # 1~3월: 전년도 3분기 → 반기 → 1분기 → 전전년도 사업보고서
-            report_attempts = [
-                (str(current_year - 1), "11014"),  # 전년도 3분기
-                (str(current_year - 1), "11012"),  # 전년도 반기
-                (str(current_year - 1), "11013"),  # 전년도 1분기
-                (str(current_year - 2), "11011"),  # 전전년도 사업보고서
-            ]
-        elif current_month <= 5:
-            # 4~5월: 전년도 사업보고서 → 전년도 3분기
-            report_attempts = [
-                (str(current_year - 1), "11011"),  # 전년도 사업보고서
-                (str(current_year - 1), "11014"),  # 전년도 3분기
-                (str(current_year - 1), "11012"),  # 전년도 반기
-            ]
-        elif current_month <= 8:
-            # 6~8월: 올해 1분기 → 전년도 사업보고서
-            report_attempts = [
-                (str(current_year), "11013"),      # 올해 1분기
-                (str(current_year - 1), "11011"),  # 전년도 사업보고서
-                (str(current_year - 1), "11014"),  # 전년도 3분기
-            ]
-        elif current_month <= 11:
-            # 9~11월: 올해 반기 → 1분기 → 전년도 사업보고서
-            report_attempts = [
-                (str(current_year), "11012"),      # 올해 반기
-                (str(current_year), "11013"),      # 올해 1분기
-                (str(current_year - 1), "11011"),  # 전년도 사업보고서
-            ]
-        else:
-            # 12월: 올해 3분기 → 반기 → 전년도 사업보고서
-            report_attempts = [
-                (str(current_year), "11014"),      # 올해 3분기
-                (str(current_year), "11012"),      # 올해 반기
-                (str(current_year - 1), "11011"),  # 전년도 사업보고서
-            ]
+        now = datetime.now()
+        cache_key = f"dart:fs:{corp_code}:{year or '-'}:{report_code or '-'}:{now:%Y%m}"
+        cached = await self._cache_get(cache_key)
+        if cached:
+            return FinancialData(**cached)
+
+        report_attempts = list(_report_attempts(now.year, now.month))
 
         # 특정 연도/보고서가 지정된 경우 우선 시도
         if year and report_code:
             report_attempts.insert(0, (year, report_code))
 
-        for try_year, try_report_code in report_attempts:
-            try:
-                # 단일회사 주요계정 조회 API
-                data = await self._request("fnlttSinglAcnt.json", {
-                    "corp_code": corp_code,
-                    "bsns_year": try_year,
-                    "reprt_code": try_report_code,
-                })
-
-                if data.get("status") == "000" and data.get("list"):
-                    logger.info(f"DART 재무제표 조회 성공: {try_year}년 보고서({try_report_code})")
-                    break
-            except Exception as e:
-                logger.debug(f"DART 재무제표 시도 실패 ({try_year}, {try_report_code}): {e}")
-                continue
-        else:
+        found = await self._fetch_first_report(corp_code, report_attempts)
+        if found is None:
             # 모든 시도 실패
             logger.warning(f"재무제표 조회 실패: 모든 보고서 유형 시도 완료")
             return None
+        try_year, data = found
 
         try:
             # 재무 데이터 파싱
@@ -376,43 +647,28 @@ class DartClient:
                 fiscal_year=try_year,
             )
 
-            for item in accounts:
-                account_nm = item.get("account_nm", "")
-                # 당기 금액 (thstrm_amount)
-                amount_str = item.get("thstrm_amount", "").replace(",", "")
-                amount = int(amount_str) if amount_str and amount_str != "-" else None
-
-                # 전기 금액 (frmtrm_amount) - 성장률 계산용
-                prev_str = item.get("frmtrm_amount", "").replace(",", "")
-                prev_amount = int(prev_str) if prev_str and prev_str != "-" else None
+            # 회사 식별 정보는 행마다 같으므로 처음 값이 있는 행에서 한 번만 읽는다
+            financial.corp_name = next((v for item in accounts if (v := item.get("corp_code"))), "")
+            financial.stock_code = next((v for item in accounts if (v := item.get("stock_code"))), "")
 
-                if not financial.corp_name:
-                    financial.corp_name = item.get("corp_code", "")
-                if not financial.stock_code:
-                    financial.stock_code = item.get("stock_code", "")
+            for item in accounts:
+                get = item.get
 
-                # 계정과목 매핑
-                if "매출액" in account_nm or "수익(매출액)" in account_nm:
-                    financial.revenue = amount
-                    if amount and prev_amount and prev_amount != 0:
-                        financial.revenue_growth = ((amount - prev_amount) / abs(prev_amount)) * 100
+                # 계정과목 매핑 (매핑되지 않는 계정은 금액 파싱 생략)
+                field = _account_field(get("account_nm", ""))
+                if field is None:
+                    continue
 
-                elif "영업이익" in account_nm:
-                    financial.operating_income = amount
+                # 당기 금액 (thstrm_amount)
+                amount = _parse_amount(get("thstrm_amount"))
+                setattr(financial, field, amount)
 
-                elif "당기순이익" in account_nm or "당기순손익" in account_nm:
-                    financial.net_income = amount
+                # 전기 금액 (frmtrm_amount) - 성장률 계산용
+                growth_field = _GROWTH_FIELDS.get(field)
+                if growth_field:
+                    prev_amount = _parse_amount(get("frmtrm_amount"))
                     if amount and prev_amount and prev_amount != 0:
-                        financial.income_growth = ((amount - prev_amount) / abs(prev_amount)) * 100
-
-                elif "자산총계" in account_nm:
-                    financial.total_assets = amount
-
-                elif "부채총계" in account_nm:
-                    financial.total_liabilities = amount
-
-                elif "자본총계" in account_nm:
-                    financial.total_equity = amount
+                        setattr(financial, growth_field, ((amount - prev_amount) / abs(prev_amount)) * 100)
 
             # 재무비율 계산
             if financial.revenue and financial.operating_income:
@@ -424,6 +680,7 @@ class DartClient:
             if financial.total_equity and financial.net_income:
                 financial.roe = (financial.net_income / financial.total_equity) * 100
 
+            await self._cache_set(cache_key, asdict(financial))
             return financial
 
         except Exception as e:
@@ -457,7 +714,7 @@ class DartClient:
 
                     if idx_val and idx_val != "-":
                         try:
-                            val = float(idx_val.replace(",", ""))
+                            val = float(_strip_commas(idx_val))
                             ratios[idx_nm] = val
                         except ValueError:
                             pass
@@ -489,6 +746,25 @@ class DartClient:
 
         return await self.get_financial_statements(corp_code)
 
+    async def get_financial_data_many(
+        self,
+        stock_codes: List[str],
+        max_concurrent: int = 8,
+    ) -> Dict[str, Optional[FinancialData]]:
+        """여러 종목 재무제표 동시 조회 (DART 요청 한도 보호용 동시 실행 상한)"""
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def _fetch_one(stock_code: str) -> Optional[FinancialData]:
+            async with semaphore:
+                try:
+                    return await self.get_financial_data_by_stock_code(stock_code)
+                except Exception as e:
+                    logger.error(f"[{stock_code}] 재무제표 조회 실패: {e}")
+                    return None
+
+        results = await asyncio.gather(*(_fetch_one(code) for code in stock_codes))
+        return dict(zip(stock_codes, results))
+
 
 # 싱글톤 인스턴스
 dart_client = DartClient()
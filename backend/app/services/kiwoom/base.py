@@ -28,7 +28,7 @@ class OrderSide(str, Enum):
     SELL = "2"  # 매도
 
 
-@dataclass
+@dataclass(slots=True)
 class StockPrice:
     """주식 시세 정보"""
     symbol: str
@@ -44,7 +44,7 @@ class StockPrice:
     timestamp: datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderResult:
     """주문 결과"""
     order_no: str
@@ -58,7 +58,7 @@ class OrderResult:
     timestamp: datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class Balance:
     """계좌 잔고"""
     total_deposit: int  # 예수금총액
@@ -69,7 +69,7 @@ class Balance:
     profit_rate: float  # 수익률
 
 
-@dataclass
+@dataclass(slots=True)
 class Holding:
     """보유 종목"""
     symbol: str
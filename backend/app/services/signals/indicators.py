@@ -8,6 +8,9 @@
 import logging
 from typing import List, Dict, Any, Optional
 
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
 from .models import IndicatorData
 
 logger = logging.getLogger(__name__)
@@ -53,22 +56,29 @@ class QuantIndicatorCalculator:
         lows = [p.get("low", 0) for p in prices]
         volumes = [p.get("volume", 0) for p in prices]
 
-        # 각 지표 계산
+        # 각 지표 계산 — 최소 길이가 고정된 지표는 이력이 짧으면(신규 상장 등) 호출 자체를 생략
+        n = len(closes)
+        has_14 = n >= 15   # ADX/ATR/MFI/RSI(14)
         self._calc_trading_value_ratios(data, trading_values)
         self._calc_volume_ratios(data, volumes)
         self._calc_obv(data, closes, volumes)
         self._calc_avwap(data, prices)
         self._calc_cmf_clv(data, prices)
-        self._calc_adx(data, highs, lows, closes)
-        self._calc_bollinger_bbwp_ttm(data, closes)
-        self._calc_atr(data, highs, lows, closes)
-        self._calc_mfi(data, highs, lows, closes, volumes)
+        if has_14:
+            self._calc_adx(data, highs, lows, closes)
+        self._calc_moving_averages(data, closes)  # MA20은 볼린저 중심선으로 재사용
+        if n >= 20:
+            self._calc_bollinger_bbwp_ttm(data, closes)
+        if has_14:
+            self._calc_atr(data, highs, lows, closes)
+            self._calc_mfi(data, highs, lows, closes, volumes)
         self._calc_udvr(data, closes, volumes)
         self._calc_rvol(data, volumes)
         self._calc_52w_position(data, highs, lows, closes)
-        self._calc_moving_averages(data, closes)
-        self._calc_rsi(data, closes)
-        self._calc_macd(data, closes)
+        if has_14:
+            self._calc_rsi(data, closes)
+        if n >= 35:  # MACD(12, 26, 9)
+            self._calc_macd(data, closes)
 
         return data
 
@@ -320,37 +330,40 @@ class QuantIndicatorCalculator:
         if n < bb_period:
             return
 
-        # 볼린저 밴드 계산
+        # 볼린저 밴드 중심선 = MA20 (이미 계산됐으면 재사용)
         recent = closes[-bb_period:]
-        sma = sum(recent) / bb_period
-        variance = sum((x - sma) ** 2 for x in recent) / bb_period
-        std = variance ** 0.5
+        sma = data.ma_20 or sum(recent) / bb_period
+
+        # BBWP 계산: 현재 BB 폭이 과거 252일(1년) BB 폭 중 몇 % 위치인지
+        # (lookback+1개의 20일 창을 sliding_window_view로 한 번에 계산)
+        lookback = min(252, n - bb_period)
+        if lookback > 0:
+            windows = sliding_window_view(
+                np.asarray(closes[n - lookback - bb_period:], dtype=np.float64), bb_period,
+            )
+            w_sma = windows.sum(axis=1) / bb_period
+            w_var = ((windows - w_sma[:, None]) ** 2).sum(axis=1) / bb_period
+            w_std = np.sqrt(w_var)
+            # 마지막 창 = 현재 20일 → 표준편차 재사용 (20개 배열엔 np.std 호출보다 이쪽이 저렴)
+            std = float(w_std[-1])
+            w_upper = w_sma + bb_std_mult * w_std
+            w_lower = w_sma - bb_std_mult * w_std
+            bb_widths = np.divide(
+                w_upper - w_lower, w_sma, out=np.zeros_like(w_sma), where=w_sma > 0,
+            )
+
+            current_width = bb_widths[-1]
+            below_count = int(np.count_nonzero(bb_widths < current_width))
+            data.bbwp = (below_count / len(bb_widths)) * 100
+        else:
+            variance = sum((x - sma) ** 2 for x in recent) / bb_period
+            std = variance ** 0.5
 
         data.bb_middle = sma
         data.bb_upper = sma + bb_std_mult * std
         data.bb_lower = sma - bb_std_mult * std
         data.bb_width = (data.bb_upper - data.bb_lower) / data.bb_middle if data.bb_middle > 0 else 0
 
-        # BBWP 계산: 현재 BB 폭이 과거 252일(1년) BB 폭 중 몇 % 위치인지
-        lookback = min(252, n - bb_period)
-        if lookback > 0:
-            bb_widths = []
-            for i in range(n - lookback, n + 1):
-                if i >= bb_period:
-                    window = closes[i - bb_period:i]
-                    w_sma = sum(window) / bb_period
-                    w_var = sum((x - w_sma) ** 2 for x in window) / bb_period
-                    w_std = w_var ** 0.5
-                    w_upper = w_sma + bb_std_mult * w_std
-                    w_lower = w_sma - bb_std_mult * w_std
-                    w_width = (w_upper - w_lower) / w_sma if w_sma > 0 else 0
-                    bb_widths.append(w_width)
-
-            if bb_widths:
-                current_width = bb_widths[-1]
-                below_count = sum(1 for w in bb_widths if w < current_width)
-                data.bbwp = (below_count / len(bb_widths)) * 100
-
         # TTM Squeeze: 볼린저 밴드가 켈트너 채널 안에 들어왔는지
         # 켈트너 채널 = 20 EMA +/- 1.5 * ATR(10)
         if n >= bb_period:
@@ -468,7 +481,8 @@ class QuantIndicatorCalculator:
         """상대 거래량 20/50"""
         n = len(volumes)
         if n >= 20:
-            avg_20 = sum(volumes[-20:]) / 20
+            # 20일 평균 거래량은 _calc_volume_ratios의 V20과 동일
+            avg_20 = data.v20 or sum(volumes[-20:]) / 20
             data.rvol_20 = volumes[-1] / avg_20 if avg_20 > 0 else 0
         if n >= 50:
             avg_50 = sum(volumes[-50:]) / 50
@@ -519,13 +533,19 @@ class QuantIndicatorCalculator:
         n = len(closes)
         if n < period + 1:
             return
-        # 최근 period+1 가격으로 변화량 계산
-        recent = closes[-(period + 1):]
-        changes = [recent[i + 1] - recent[i] for i in range(period)]
-        gains = [c for c in changes if c > 0]
-        losses = [-c for c in changes if c < 0]
-        avg_gain = sum(gains) / period if gains else 0
-        avg_loss = sum(losses) / period if losses else 0
+        # 최근 period+1 가격의 변화량을 한 번의 순회로 상승/하락 합산
+        # (15개 원소에서는 NumPy 배열 변환 비용이 계산보다 커서 순수 루프가 더 빠름)
+        gain_sum = loss_sum = 0.0
+        prev = closes[-(period + 1)]
+        for close in closes[-period:]:
+            change = close - prev
+            prev = close
+            if change > 0:
+                gain_sum += change
+            else:
+                loss_sum -= change
+        avg_gain = gain_sum / period
+        avg_loss = loss_sum / period
         if avg_loss == 0:
             data.rsi_14 = 100.0
             return
@@ -539,32 +559,38 @@ class QuantIndicatorCalculator:
         if n < slow + signal:
             return
 
-        def ema_series(values: List[float], period: int) -> List[float]:
-            k = 2 / (period + 1)
-            result = [sum(values[:period]) / period]
-            for v in values[period:]:
-                result.append(v * k + result[-1] * (1 - k))
-            return result
-
-        ema_fast = ema_series(closes, fast)
-        ema_slow = ema_series(closes, slow)
-        if not ema_fast or not ema_slow:
-            return
-
-        min_len = min(len(ema_fast), len(ema_slow))
-        macd_line = [ema_fast[-(min_len - i)] - ema_slow[-(min_len - i)] for i in range(min_len)]
-
-        if len(macd_line) < signal:
-            return
-
-        signal_line = ema_series(macd_line, signal)
-        if not signal_line:
-            data.macd_line = round(macd_line[-1], 2)
-            return
-
-        data.macd_line = round(macd_line[-1], 2)
-        data.macd_signal = round(signal_line[-1], 2)
-        data.macd_histogram = round(macd_line[-1] - signal_line[-1], 2)
+        # 마지막 값만 필요하므로 빠른/느린 EMA, MACD, 시그널 EMA를 한 번의 순회로 갱신한다.
+        # 각 EMA는 첫 period 구간 SMA로 시작해 v * k + prev * (1 - k)로 진행 (기존 시리즈 계산과 동일).
+        k_fast, k_slow, k_signal = 2 / (fast + 1), 2 / (slow + 1), 2 / (signal + 1)
+        q_fast, q_slow, q_signal = 1 - k_fast, 1 - k_slow, 1 - k_signal
+
+        ema_fast = sum(closes[:fast]) / fast
+        for v in closes[fast:slow]:
+            ema_fast = v * k_fast + ema_fast * q_fast
+        ema_slow = sum(closes[:slow]) / slow
+
+        # 시그널 EMA 시드: 첫 signal개 MACD 값의 평균
+        macd = ema_fast - ema_slow
+        seed = [macd]
+        rest = iter(closes[slow:])
+        for v in rest:
+            ema_fast = v * k_fast + ema_fast * q_fast
+            ema_slow = v * k_slow + ema_slow * q_slow
+            macd = ema_fast - ema_slow
+            seed.append(macd)
+            if len(seed) == signal:
+                break
+        signal_ema = sum(seed) / signal
+
+        for v in rest:
+            ema_fast = v * k_fast + ema_fast * q_fast
+            ema_slow = v * k_slow + ema_slow * q_slow
+            macd = ema_fast - ema_slow
+            signal_ema = macd * k_signal + signal_ema * q_signal
+
+        data.macd_line = round(macd, 2)
+        data.macd_signal = round(signal_ema, 2)
+        data.macd_histogram = round(macd - signal_ema, 2)
 
     # ========================
     # 유틸리티
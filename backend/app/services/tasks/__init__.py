@@ -16,6 +16,7 @@ from .execution_tasks import (  # noqa: F401
     auto_execute_signal,
     process_council_queue,
     rebalance_holdings,
+    collect_rebalance_batches,
 )
 from .scanning_tasks import (  # noqa: F401
     scan_signals,
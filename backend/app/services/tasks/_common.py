@@ -14,10 +14,25 @@ def run_async(coro):
 
     Resets the global async Redis client before each call because
     asyncio.run() destroys the previous loop, leaving stale connections.
+
+    Background audit writes are awaited before the loop closes, since
+    asyncio.run() cancels any tasks still pending. The loop's LLM
+    connection pool is closed with it.
     """
     import app.core.redis as redis_module
+    from app.core.audit import drain_background_events
+    from app.services.council.llm_utils import close_llm_clients
+
     redis_module.redis_client = None
-    return asyncio.run(coro)
+
+    async def _run():
+        try:
+            return await coro
+        finally:
+            await drain_background_events()
+            await close_llm_clients()
+
+    return asyncio.run(_run())
 
 
 def is_market_hours() -> bool:
@@ -20,6 +20,11 @@ from ._common import is_market_hours, run_async
 
 logger = logging.getLogger(__name__)
 
+# 결과 대기 중인 리밸런싱 배치 (batch_id → 재평가 입력/맥락 JSON)
+REBALANCE_BATCH_KEY = "rebalance:batches"
+# 수집 오류가 계속되는 배치 보관 한도 (Batch API 완료 기한 24시간 + 여유)
+REBALANCE_BATCH_MAX_AGE = 48 * 3600
+
 
 @celery_app.task(name="app.services.tasks.auto_execute_signal")
 def auto_execute_signal(signal_id: int, quantity: int):
@@ -120,80 +125,44 @@ def rebalance_holdings(self):
 
         from app.services.council.orchestrator import council_orchestrator
 
-        reviewed = []
-        escalated = []
-
+        # 종목별 GPT 호출 대신 묶음 분석 1회로 재평가
+        review_inputs = []
         for holding in holdings:
             try:
                 prev_stop, prev_target = _get_active_signal_prices(holding.symbol)
-
-                result = run_async(
-                    council_orchestrator.start_rebalance_review(
-                        symbol=holding.symbol,
-                        company_name=holding.name,
-                        current_holdings=holding.quantity,
-                        avg_buy_price=holding.avg_price,
-                        current_price=holding.current_price,
-                        prev_target_price=int(prev_target) if prev_target else None,
-                        prev_stop_loss=int(prev_stop) if prev_stop else None,
-                    )
-                )
-
-                if not result:
-                    continue
-
-                change_reason = (
-                    f"[리밸런싱 {datetime.now().strftime('%m/%d')}] "
-                    f"score={result['score']}, "
-                    f"target: {int(prev_target):,}→{result['new_target_price']:,}" if prev_target else
-                    f"[리밸런싱 {datetime.now().strftime('%m/%d')}] "
-                    f"score={result['score']}, "
-                    f"target: 미설정→{result['new_target_price']:,}" if result.get('new_target_price') else ""
-                )
-                if result.get("new_stop_loss"):
-                    stop_part = (
-                        f", stop: {int(prev_stop):,}→{result['new_stop_loss']:,}" if prev_stop
-                        else f", stop: 미설정→{result['new_stop_loss']:,}"
-                    )
-                    change_reason += stop_part
-
-                if result.get("new_target_price") or result.get("new_stop_loss"):
-                    _update_signal_prices(
-                        symbol=holding.symbol,
-                        new_target=result.get("new_target_price"),
-                        new_stop=result.get("new_stop_loss"),
-                        reason=change_reason,
-                    )
-
-                reviewed.append({
+                review_inputs.append({
                     "symbol": holding.symbol,
-                    "name": holding.name,
-                    "score": result["score"],
-                    "new_target": result.get("new_target_price"),
-                    "new_stop": result.get("new_stop_loss"),
-                    "recommend_sell": result.get("recommend_sell", False),
+                    "company_name": holding.name,
+                    "current_holdings": holding.quantity,
+                    "avg_buy_price": holding.avg_price,
+                    "current_price": holding.current_price,
+                    "prev_target_price": int(prev_target) if prev_target else None,
+                    "prev_stop_loss": int(prev_stop) if prev_stop else None,
                 })
-
-                if result.get("recommend_sell"):
-                    logger.warning(
-                        f"[리밸런싱] {holding.symbol} score={result['score']} ≤ 3 → 매도 회의 에스컬레이션"
-                    )
-                    run_async(
-                        council_orchestrator.start_sell_meeting(
-                            symbol=holding.symbol,
-                            company_name=holding.name,
-                            sell_reason=f"리밸런싱 재평가 저점수 (score={result['score']})",
-                            current_holdings=holding.quantity,
-                            avg_buy_price=holding.avg_price,
-                            current_price=result.get("current_price", holding.current_price),
-                        )
-                    )
-                    escalated.append(holding.symbol)
-
             except Exception as e:
                 logger.error(f"[리밸런싱] {holding.symbol} 개별 오류: {e}")
 
-            time.sleep(1)
+        # 지연 허용 시 Batch API로 제출 → collect_rebalance_batches가 결과 반영
+        if settings.rebalance_use_batch_api:
+            submitted = run_async(council_orchestrator.submit_rebalance_batch(review_inputs))
+            if submitted:
+                batch_id, contexts = submitted
+                _store_rebalance_batch(batch_id, review_inputs, contexts)
+                deadline_triggered = run_async(_check_holding_deadlines(holdings))
+                return {
+                    "status": "submitted",
+                    "total_holdings": len(holdings),
+                    "batch_id": batch_id,
+                    "deadline_triggered": deadline_triggered,
+                }
+            logger.warning("[리밸런싱] Batch API 제출 실패 — 동기 묶음 분석으로 진행")
+
+        try:
+            review_results = run_async(council_orchestrator.start_rebalance_reviews(review_inputs))
+        except Exception as e:
+            logger.error(f"[리밸런싱] 묶음 재평가 오류: {e}")
+            review_results = {}
+        reviewed, escalated = _apply_rebalance_results(review_inputs, review_results)
 
         logger.info(
             f"[리밸런싱] 완료: {len(reviewed)}/{len(holdings)}건 재평가, "
@@ -217,8 +186,155 @@ def rebalance_holdings(self):
         self.retry(exc=e)
 
 
+@celery_app.task(name="app.services.tasks.collect_rebalance_batches")
+def collect_rebalance_batches():
+    """Batch API로 제출한 리밸런싱 재평가 결과 수집 및 반영.
+
+    30분마다 실행. 처리 중인 배치는 다음 실행 때 다시 확인한다.
+    """
+    from app.core.redis import get_redis_sync
+    from app.services.council.orchestrator import council_orchestrator
+
+    redis = get_redis_sync()
+    pending = redis.hgetall(REBALANCE_BATCH_KEY)
+    if not pending:
+        return {"status": "skipped", "reason": "no_pending_batches"}
+
+    collected = []
+    for batch_id, raw in pending.items():
+        try:
+            payload = json.loads(raw)
+        except ValueError as e:
+            logger.error("[리밸런싱] 배치 %s 저장 데이터 손상 — 삭제: %s", batch_id, e)
+            redis.hdel(REBALANCE_BATCH_KEY, batch_id)
+            continue
+
+        try:
+            review_results = run_async(
+                council_orchestrator.collect_rebalance_batch(batch_id, payload["contexts"])
+            )
+        except Exception as e:
+            logger.error("[리밸런싱] 배치 %s 수집 오류: %s", batch_id, e)
+            if time.time() - payload.get("submitted_at", 0) > REBALANCE_BATCH_MAX_AGE:
+                logger.warning("[리밸런싱] 배치 %s 보관 기한 초과 — 삭제", batch_id)
+                redis.hdel(REBALANCE_BATCH_KEY, batch_id)
+            continue
+        if review_results is None:
+            continue
+
+        # 종료된 배치는 결과 반영 성공 여부와 관계없이 대기 목록에서 제거 (무한 재수집 방지)
+        redis.hdel(REBALANCE_BATCH_KEY, batch_id)
+        try:
+            reviewed, escalated = _apply_rebalance_results(payload["inputs"], review_results)
+        except Exception as e:
+            logger.error("[리밸런싱] 배치 %s 결과 반영 오류: %s", batch_id, e)
+            continue
+
+        logger.info(
+            "[리밸런싱] 배치 %s 반영: %d/%d건 재평가, %d건 매도 에스컬레이션",
+            batch_id, len(reviewed), len(payload["inputs"]), len(escalated),
+        )
+        collected.append({
+            "batch_id": batch_id,
+            "reviewed": len(reviewed),
+            "escalated_symbols": escalated,
+        })
+
+    return {"status": "success", "pending": len(pending) - len(collected), "collected": collected}
+
+
 # ── Helper functions ──
 
+def _store_rebalance_batch(batch_id: str, review_inputs: list[dict], contexts: dict) -> None:
+    from app.core.redis import get_redis_sync
+
+    get_redis_sync().hset(
+        REBALANCE_BATCH_KEY,
+        batch_id,
+        json.dumps(
+            {"inputs": review_inputs, "contexts": contexts, "submitted_at": time.time()},
+            ensure_ascii=False,
+        ),
+    )
+
+
+def _apply_rebalance_results(
+    review_inputs: list[dict],
+    review_results: dict[str, Optional[dict]],
+) -> tuple[list[dict], list[str]]:
+    """재평가 결과로 시그널 목표가/손절가 갱신, 저점수 종목은 매도 회의 에스컬레이션.
+
+    Returns:
+        (reviewed, escalated_symbols)
+    """
+    from app.services.council.orchestrator import council_orchestrator
+
+    reviewed = []
+    escalated = []
+
+    for h in review_inputs:
+        symbol = h["symbol"]
+        try:
+            prev_stop, prev_target = h["prev_stop_loss"], h["prev_target_price"]
+            result = review_results.get(symbol)
+
+            if not result:
+                continue
+
+            change_reason = (
+                f"[리밸런싱 {datetime.now().strftime('%m/%d')}] "
+                f"score={result['score']}, "
+                f"target: {int(prev_target):,}→{result['new_target_price']:,}" if prev_target else
+                f"[리밸런싱 {datetime.now().strftime('%m/%d')}] "
+                f"score={result['score']}, "
+                f"target: 미설정→{result['new_target_price']:,}" if result.get('new_target_price') else ""
+            )
+            if result.get("new_stop_loss"):
+                stop_part = (
+                    f", stop: {int(prev_stop):,}→{result['new_stop_loss']:,}" if prev_stop
+                    else f", stop: 미설정→{result['new_stop_loss']:,}"
+                )
+                change_reason += stop_part
+
+            if result.get("new_target_price") or result.get("new_stop_loss"):
+                _update_signal_prices(
+                    symbol=symbol,
+                    new_target=result.get("new_target_price"),
+                    new_stop=result.get("new_stop_loss"),
+                    reason=change_reason,
+                )
+
+            reviewed.append({
+                "symbol": symbol,
+                "name": h["company_name"],
+                "score": result["score"],
+                "new_target": result.get("new_target_price"),
+                "new_stop": result.get("new_stop_loss"),
+                "recommend_sell": result.get("recommend_sell", False),
+            })
+
+            if result.get("recommend_sell"):
+                logger.warning(
+                    f"[리밸런싱] {symbol} score={result['score']} ≤ 3 → 매도 회의 에스컬레이션"
+                )
+                run_async(
+                    council_orchestrator.start_sell_meeting(
+                        symbol=symbol,
+                        company_name=h["company_name"],
+                        sell_reason=f"리밸런싱 재평가 저점수 (score={result['score']})",
+                        current_holdings=h["current_holdings"],
+                        avg_buy_price=h["avg_buy_price"],
+                        current_price=result.get("current_price", h["current_price"]),
+                    )
+                )
+                escalated.append(symbol)
+                time.sleep(1)  # 매도 회의 GPT 호출 간 간격
+
+        except Exception as e:
+            logger.error(f"[리밸런싱] {symbol} 개별 오류: {e}")
+
+    return reviewed, escalated
+
 
 async def _process_council_queue_from_db() -> dict:
     """DB의 queued 시그널을 직접 조회해서 체결 시도."""
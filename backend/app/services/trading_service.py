@@ -5,7 +5,7 @@ Trading Service
 키움증권 API를 통해 실제 거래를 수행합니다.
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, AsyncIterator
 from datetime import date, datetime
 from decimal import Decimal
 
@@ -358,44 +358,59 @@ class TradingService:
 
             return order_result
 
+    @staticmethod
+    def _pending_signal_query(limit: int):
+        return (
+            select(TradingSignal)
+            .where(
+                TradingSignal.is_executed == False,
+                TradingSignal.signal_status.in_(["pending", "queued"]),
+            )
+            .order_by(TradingSignal.created_at.desc())
+            .limit(limit)
+        )
+
+    @staticmethod
+    def _pending_signal_to_dict(s: TradingSignal) -> Dict[str, Any]:
+        return {
+            "id": s.id,
+            "symbol": s.symbol,
+            "company_name": s.company_name or "",
+            "signal_type": s.signal_type,
+            "strength": float(s.strength),
+            "source_agent": s.source_agent,
+            "reason": s.reason,
+            "target_price": float(s.target_price) if s.target_price else None,
+            "stop_loss": float(s.stop_loss) if s.stop_loss else None,
+            "quantity": s.quantity,
+            "signal_status": s.signal_status,
+            "quant_score": s.quant_score or 0,
+            "fundamental_score": s.fundamental_score or 0,
+            "allocation_percent": float(s.allocation_percent) if s.allocation_percent else 0.0,
+            "suggested_amount": s.suggested_amount or 0,
+            "created_at": s.created_at.isoformat(),
+        }
+
     async def get_pending_signals(
         self,
         limit: int = 20,
     ) -> List[Dict[str, Any]]:
         """미실행 트레이딩 시그널 조회"""
         async with async_session_maker() as session:
-            result = await session.execute(
-                select(TradingSignal)
-                .where(
-                    TradingSignal.is_executed == False,
-                    TradingSignal.signal_status.in_(["pending", "queued"]),
-                )
-                .order_by(TradingSignal.created_at.desc())
-                .limit(limit)
-            )
+            result = await session.execute(self._pending_signal_query(limit))
             signals = result.scalars().all()
 
-            return [
-                {
-                    "id": s.id,
-                    "symbol": s.symbol,
-                    "company_name": s.company_name or "",
-                    "signal_type": s.signal_type,
-                    "strength": float(s.strength),
-                    "source_agent": s.source_agent,
-                    "reason": s.reason,
-                    "target_price": float(s.target_price) if s.target_price else None,
-                    "stop_loss": float(s.stop_loss) if s.stop_loss else None,
-                    "quantity": s.quantity,
-                    "signal_status": s.signal_status,
-                    "quant_score": s.quant_score or 0,
-                    "fundamental_score": s.fundamental_score or 0,
-                    "allocation_percent": float(s.allocation_percent) if s.allocation_percent else 0.0,
-                    "suggested_amount": s.suggested_amount or 0,
-                    "created_at": s.created_at.isoformat(),
-                }
-                for s in signals
-            ]
+            return [self._pending_signal_to_dict(s) for s in signals]
+
+    async def iter_pending_signals(
+        self,
+        limit: int = 20,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """미실행 트레이딩 시그널 스트리밍 조회 (행 단위 yield, 전체 적재 없음)"""
+        async with async_session_maker() as session:
+            result = await session.stream_scalars(self._pending_signal_query(limit))
+            async for s in result:
+                yield self._pending_signal_to_dict(s)
 
 
 # 싱글톤 인스턴스
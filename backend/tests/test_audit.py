@@ -3,6 +3,7 @@
 audit.py의 sync/async 함수, SignalEvent 모델, 구조화 로그.
 """
 
+import asyncio
 import logging
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -123,6 +124,49 @@ async def test_audit_db_failure_is_non_fatal():
         )
 
 
+# ── Test 4b: 백그라운드 감사 기록 — 호출자는 대기하지 않고 drain 시 완료 ──
+
+@pytest.mark.asyncio
+async def test_background_audit_is_drained():
+    from app.core import audit
+
+    written = []
+
+    async def slow_write():
+        await asyncio.sleep(0.01)
+        written.append("event")
+
+    audit.log_in_background(slow_write())
+    assert written == []
+    assert len(audit._background_tasks) == 1
+
+    await audit.drain_background_events()
+    assert written == ["event"]
+    assert not audit._background_tasks
+
+
+def test_run_async_flushes_background_audit(event_loop):
+    from app.core import audit
+    from app.services.tasks._common import run_async
+
+    written = []
+
+    async def write():
+        await asyncio.sleep(0.01)
+        written.append("event")
+
+    async def task():
+        audit.log_in_background(write())
+        return "done"
+
+    try:
+        # run_async(asyncio.run)는 끝나면서 현재 루프를 비우므로 세션 루프를 되돌린다
+        assert run_async(task()) == "done"
+    finally:
+        asyncio.set_event_loop(event_loop)
+    assert written == ["event"]
+
+
 # ── Test 5: JSON 로그에 extra_data 필드 포함 ──
 
 def test_structured_log_contains_extra_data(caplog):
@@ -0,0 +1,382 @@
+"""dart_client.py 테스트 — corpCode ZIP 스트리밍 파싱."""
+
+import asyncio
+import io
+import os
+import time
+import zipfile
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from lxml import etree
+
+from app.config import settings
+from app.services.dart_client import (
+    _ACCOUNT_FIELDS,
+    DartClient,
+    FinancialData,
+    _parse_amount,
+    _report_attempts,
+    _scan_account_field,
+)
+
+
+def _corp_zip(entries) -> bytes:
+    rows = "".join(
+        f"<list><corp_code>{corp}</corp_code><corp_name>회사</corp_name>"
+        f"<stock_code>{stock}</stock_code><modify_date>20260101</modify_date></list>"
+        for corp, stock in entries
+    )
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        zf.writestr("CORPCODE.xml", f'<?xml version="1.0" encoding="UTF-8"?><result>{rows}</result>')
+    return buf.getvalue()
+
+
+def test_parse_corp_codes_keeps_listed_companies_only():
+    zip_bytes = _corp_zip([
+        ("00126380", "005930"),
+        ("00164779", " 000660 "),
+        ("00999999", " "),  # 비상장 (종목코드 공백)
+    ])
+
+    assert DartClient._parse_corp_codes(zip_bytes) == {
+        "005930": "00126380",
+        "000660": "00164779",
+    }
+
+
+
+class _FakeResponse:
+    def __init__(self, content: bytes, content_type: str = "application/json;charset=UTF-8"):
+        self.content = content
+        self.headers = {"content-type": content_type}
+
+    def raise_for_status(self):
+        pass
+
+
+class _FakeAsyncClient:
+    response = _FakeResponse(b"{}")
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.is_closed = False
+        self.calls = []
+
+    async def get(self, url, **kwargs):
+        self.calls.append((url, kwargs))
+        return self.response
+
+    async def aclose(self):
+        self.is_closed = True
+
+
+@pytest.mark.asyncio
+async def test_shared_http_client_is_reused_and_closed():
+    client = DartClient()
+
+    with patch("app.services.dart_client.httpx.AsyncClient", _FakeAsyncClient):
+        first = client._get_client()
+        assert client._get_client() is first
+        assert first.kwargs["timeout"] == 30.0
+
+        await client.close()
+        assert first.is_closed
+        assert client._get_client() is not first
+        await client.close()
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.store[key] = value
+
+
+@pytest.fixture(autouse=True)
+def corp_code_file(tmp_path, monkeypatch):
+    path = tmp_path / "dart_corp_codes.json"
+    monkeypatch.setattr(settings, "dart_corp_code_cache_path", str(path))
+    return path
+
+
+@pytest.fixture
+def fake_redis():
+    redis = _FakeRedis()
+    with patch("app.services.dart_client.get_redis", AsyncMock(return_value=redis)):
+        yield redis
+
+
+@pytest.mark.asyncio
+async def test_financial_statements_account_mapping(fake_redis):
+    rows = [
+        {"account_nm": "매출액", "thstrm_amount": "1,200", "frmtrm_amount": "1,000", "stock_code": "005930"},
+        {"account_nm": "영업이익", "thstrm_amount": "300", "frmtrm_amount": "-"},
+        {"account_nm": "당기순이익(손실)", "thstrm_amount": "150", "frmtrm_amount": "200"},
+        {"account_nm": "유동자산", "thstrm_amount": "not-a-number"},  # 매핑 대상 아님
+        {"account_nm": "자산총계", "thstrm_amount": "5,000"},
+        {"account_nm": "부채총계", "thstrm_amount": "2,000"},
+        {"account_nm": "자본총계", "thstrm_amount": "3,000"},
+    ]
+    client = DartClient()
+    client._request = AsyncMock(return_value={"status": "000", "list": rows})
+
+    financial = await client.get_financial_statements("00126380", year="2025", report_code="11011")
+
+    assert (financial.revenue, financial.operating_income, financial.net_income) == (1_200, 300, 150)
+    assert (financial.total_assets, financial.total_liabilities, financial.total_equity) == (5_000, 2_000, 3_000)
+    assert financial.revenue_growth == pytest.approx(20.0)
+    assert financial.income_growth == pytest.approx(-25.0)
+    assert financial.stock_code == "005930"
+    assert financial.debt_ratio == pytest.approx(2_000 / 3_000 * 100)
+
+
+@pytest.mark.asyncio
+async def test_request_decodes_json_body():
+    client = DartClient()
+    client._api_key = "test-key"
+    body = '{"status": "000", "list": [{"account_nm": "매출액", "thstrm_amount": "1,200"}]}'
+
+    with patch("app.services.dart_client.httpx.AsyncClient", _FakeAsyncClient):
+        client._get_client().response = _FakeResponse(body.encode())
+        data = await client._request("fnlttSinglAcnt.json", {"corp_code": "00126380"})
+
+    assert data == {"status": "000", "list": [{"account_nm": "매출액", "thstrm_amount": "1,200"}]}
+    url, kwargs = client._client.calls[0]
+    assert url.endswith("/fnlttSinglAcnt.json")
+    assert kwargs["params"]["corp_code"] == "00126380"
+
+
+def test_parse_corp_codes_rejects_malformed_xml():
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        zf.writestr("CORPCODE.xml", "<result><list><corp_code>00126380</corp_code>")
+
+    with pytest.raises(etree.XMLSyntaxError):
+        DartClient._parse_corp_codes(buf.getvalue())
+
+
+def test_canonical_account_fields_agree_with_substring_scan():
+    for account_nm, field in _ACCOUNT_FIELDS.items():
+        assert _scan_account_field(account_nm) == field, account_nm
+
+
+def test_parse_amount_handles_dart_number_formats():
+    assert _parse_amount("227,062,266,000,000") == 227_062_266_000_000
+    assert _parse_amount("-1,234") == -1_234
+    assert _parse_amount("1200") == 1_200
+    assert [_parse_amount(v) for v in ("-", "", None)] == [None, None, None]
+
+
+def test_report_attempts_follow_filing_calendar():
+    assert _report_attempts(2026, 2) == (
+        ("2025", "11014"), ("2025", "11012"), ("2025", "11013"), ("2024", "11011"),
+    )
+    assert _report_attempts(2026, 5)[0] == ("2025", "11011")
+    assert _report_attempts(2026, 7)[0] == ("2026", "11013")
+    assert _report_attempts(2026, 10)[0] == ("2026", "11012")
+    assert _report_attempts(2026, 12)[0] == ("2026", "11014")
+    assert _report_attempts(2026, 10) is _report_attempts(2026, 10)
+
+
+@pytest.mark.asyncio
+async def test_financial_statements_and_company_info_are_cached(fake_redis):
+    responses = {
+        "fnlttSinglAcnt.json": {"status": "000", "list": [{"account_nm": "매출액", "thstrm_amount": "1,200"}]},
+        "company.json": {"status": "000", "corp_name": "삼성전자", "stock_code": "005930", "emp_cnt": "0"},
+    }
+    client = DartClient()
+    client._request = AsyncMock(side_effect=lambda endpoint, params: responses[endpoint])
+
+    first = await client.get_financial_statements("00126380", year="2025", report_code="11011")
+    info = await client.get_company_info("00126380")
+    calls = client._request.await_count
+
+    again = await client.get_financial_statements("00126380", year="2025", report_code="11011")
+    assert again == first and again is not first
+    assert await client.get_company_info("00126380") == info
+    assert client._request.await_count == calls
+    assert any(k.startswith("dart:fs:00126380:2025:11011:") for k in fake_redis.store)
+    assert "dart:company:00126380" in fake_redis.store
+
+
+@pytest.mark.asyncio
+async def test_response_cache_fails_open_without_redis():
+    client = DartClient()
+    client._request = AsyncMock(return_value={
+        "status": "000", "list": [{"account_nm": "영업이익", "thstrm_amount": "300"}],
+    })
+    with patch("app.services.dart_client.get_redis", AsyncMock(side_effect=ConnectionError("down"))):
+        financial = await client.get_financial_statements("00126380", year="2025", report_code="11011")
+    assert financial.operating_income == 300
+
+
+@pytest.mark.asyncio
+async def test_concurrent_corp_code_lookups_load_list_once():
+    client = DartClient()
+
+    async def load():
+        await asyncio.sleep(0)
+        client._corp_code_cache = {"005930": "00126380", "000660": "00164779"}
+        return True
+
+    client._load_corp_codes = AsyncMock(side_effect=load)
+
+    results = await asyncio.gather(*(client.get_corp_code(s) for s in ("005930", "000660", "999999")))
+
+    assert results == ["00126380", "00164779", None]
+    assert client._load_corp_codes.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_get_financial_data_many_bounds_concurrency():
+    client = DartClient()
+    active = peak = 0
+
+    async def fetch(stock_code):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0)
+        active -= 1
+        if stock_code == "000003":
+            raise RuntimeError("boom")
+        return f"fs-{stock_code}"
+
+    client.get_financial_data_by_stock_code = fetch
+    codes = [f"{i:06d}" for i in range(10)]
+
+    results = await client.get_financial_data_many(codes, max_concurrent=3)
+
+    assert list(results) == codes
+    assert results["000001"] == "fs-000001"
+    assert results["000003"] is None
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_corp_codes_load_from_warm_cache_without_download(fake_redis):
+    fake_redis.store["dart:corp_codes"] = b'{"005930": "00126380"}'
+    client = DartClient()
+    client._api_key = None  # 캐시가 있으면 API 키 없이도 로드
+
+    with patch.object(client, "_get_client", side_effect=AssertionError("download")):
+        assert await client._load_corp_codes() is True
+
+    assert client._corp_code_cache == {"005930": "00126380"}
+
+
+@pytest.mark.asyncio
+async def test_corp_codes_file_cache_skips_redis(fake_redis, corp_code_file):
+    fake_redis.store["dart:corp_codes"] = b'{"005930": "00126380"}'
+    warm = DartClient()
+    assert await warm._load_corp_codes() is True
+    assert corp_code_file.read_bytes() == b'{"005930":"00126380"}'  # Redis 적중 시 파일에 기록
+
+    fake_redis.store.clear()
+    client = DartClient()
+    with patch("app.services.dart_client.get_redis", AsyncMock(side_effect=AssertionError("redis"))):
+        assert await client._load_corp_codes() is True
+    assert client._corp_code_cache == {"005930": "00126380"}
+
+    # 유효 기간이 지나거나 손상된 파일은 무시
+    stale = time.time() - DartClient.CORP_CODE_CACHE_TTL - 60
+    os.utime(corp_code_file, (stale, stale))
+    assert await DartClient()._load_corp_codes() is False
+    corp_code_file.write_bytes(b"{broken")
+    assert await DartClient()._load_corp_codes() is False
+
+
+def test_financial_data_uses_slots():
+    financial = FinancialData(corp_code="00126380", corp_name="", stock_code="005930", fiscal_year="2025")
+    assert not hasattr(financial, "__dict__")
+    setattr(financial, "revenue", 1_200)  # 선언된 필드는 그대로 setattr 가능
+    assert financial.revenue == 1_200
+
+
+def test_financial_prompt_text_formats_units():
+    financial = FinancialData(
+        corp_code="00126380", corp_name="삼성전자", stock_code="005930", fiscal_year="2025",
+        revenue=300_000_000_000_000, operating_income=35_000_000_000, net_income=-12_345,
+        per=12.345, roe=8.0,
+    )
+
+    lines = financial.to_prompt_text().splitlines()
+
+    assert lines[0] == "📊 삼성전자 (005930) - 2025 재무제표"
+    assert lines[3:6] == ["- 매출액: 300.0조원", "- 영업이익: 350억원", "- 당기순이익: -12,345원"]
+    assert "- 자산총계: N/A" in lines
+    assert "- PER: 12.35배" in lines and "- PBR: N/A배" in lines
+    assert "- ROE: 8.0%" in lines
+    assert lines[-1] == "- 순이익 성장률: N/A"
+
+
+@pytest.mark.asyncio
+async def test_report_attempts_run_concurrently_and_keep_priority(fake_redis):
+    client = DartClient()
+    delays = {"11011": 0.0, "11014": 0.02, "11012": 0.0, "11013": 0.2}
+    revenue = {"11014": "300", "11012": "200", "11013": "100"}
+    started, finished, active, peak = [], [], 0, 0
+
+    async def request(endpoint, params):
+        nonlocal active, peak
+        code = params["reprt_code"]
+        started.append(code)
+        active += 1
+        peak = max(peak, active)
+        try:
+            await asyncio.sleep(delays[code])
+        finally:
+            active -= 1
+        finished.append(code)
+        if code == "11011":
+            return {"status": "013", "message": "조회된 데이타가 없습니다."}
+        return {"status": "000", "list": [{"account_nm": "매출액", "thstrm_amount": revenue[code]}]}
+
+    client._request = request
+    with patch("app.services.dart_client._report_attempts", return_value=(
+        ("2025", "11014"), ("2025", "11012"), ("2025", "11013"),
+    )):
+        financial = await client.get_financial_statements("00126380", year="2025", report_code="11011")
+
+    # 11012가 먼저 도착해도 우선순위가 높은 11014를 채택하고, 남은 11013 요청은 취소
+    assert financial.revenue == 300
+    assert started == ["11011", "11014", "11012", "11013"]
+    assert "11013" not in finished
+    assert peak == DartClient.REPORT_FANOUT
+
+
+@pytest.mark.asyncio
+async def test_corp_code_preload_runs_in_background_and_shares_lock():
+    client = DartClient()
+    release = asyncio.Event()
+
+    async def load():
+        await release.wait()
+        client._corp_code_cache = {"005930": "00126380"}
+        return True
+
+    client._load_corp_codes = AsyncMock(side_effect=load)
+
+    task = client.start_corp_code_preload()
+    assert client.start_corp_code_preload() is task
+    await asyncio.sleep(0)
+    assert not task.done()  # 호출자는 로드 완료를 기다리지 않음
+
+    lookup = asyncio.create_task(client.get_corp_code("005930"))
+    await asyncio.sleep(0)
+    release.set()
+    assert await lookup == "00126380"
+    assert client._load_corp_codes.await_count == 1
+
+    release.clear()
+    client._corp_code_cache = {}
+    pending = client.start_corp_code_preload()
+    await asyncio.sleep(0)
+    await client.close()  # 종료 시 진행 중인 프리로드 취소
+    assert pending.cancelled()
@@ -58,6 +58,8 @@ def _mock_orch():
     orch.add_meeting = lambda m: None
     orch.set_queued_executions = lambda sigs: setattr(orch, '_queued_executions', sigs)
     orch.get_queued_executions = lambda: list(orch._queued_executions)
+    orch.pop_queued_execution = lambda: orch._queued_executions.pop(0)
+    orch.queued_execution_count = lambda: len(orch._queued_executions)
     return orch
 
 
@@ -183,3 +185,37 @@ async def test_insufficient_balance_cancels_buy():
         ) or "cancelled" in str(call_kwargs)
         # Queue should be empty (signal consumed, not remaining)
         assert len(orch._queued_executions) == 0
+
+
+# ── Test 5: 주문 실패 건은 큐 뒤로 재삽입, 틱당 1회만 시도 ──
+
+@pytest.mark.asyncio
+async def test_failed_queue_order_requeued_once_per_tick():
+    """Failed order goes back to the tail and is not retried in the same pass."""
+    failing = _make_signal(symbol="000660", action="SELL")
+    passing = _make_signal(symbol="005930", action="SELL")
+    orch = _mock_orch()
+    orch._queued_executions = [failing, passing]
+
+    async def _place_order(symbol, **kw):
+        if symbol == "000660":
+            return _OrderResult(status="failed", message="거부")
+        return _OrderResult(status="submitted", order_no="ORD200")
+
+    with (
+        patch("app.services.council.order_executor.kiwoom_client") as mock_kiwoom,
+        patch("app.services.council.order_executor.trading_hours") as mock_hours,
+        patch("app.services.council.order_executor.log_signal_event_async", new_callable=AsyncMock),
+        patch("app.services.council.order_executor.update_signal_status_in_db", new_callable=AsyncMock),
+    ):
+        mock_hours.can_execute_order.return_value = (True, "market_open")
+        mock_kiwoom.get_balance = AsyncMock(return_value=_Balance())
+        mock_kiwoom.place_order = AsyncMock(side_effect=_place_order)
+
+        from app.services.council.order_executor import process_queued_executions
+
+        executed = await process_queued_executions(orch)
+
+        assert executed == [passing]
+        assert orch._queued_executions == [failing]
+        assert mock_kiwoom.place_order.await_count == 2
@@ -0,0 +1,150 @@
+"""signals/indicators.py 테스트 — RSI 계산이 기존 정의와 일치."""
+
+import random
+
+import pytest
+
+from app.services.signals.indicators import QuantIndicatorCalculator
+from app.services.signals.models import IndicatorData
+
+
+def _reference_rsi(closes, period=14):
+    recent = closes[-(period + 1):]
+    changes = [recent[i + 1] - recent[i] for i in range(period)]
+    avg_gain = sum(c for c in changes if c > 0) / period
+    avg_loss = sum(-c for c in changes if c < 0) / period
+    if avg_loss == 0:
+        return 100.0
+    return round(100 - (100 / (1 + avg_gain / avg_loss)), 2)
+
+
+def _rsi(closes):
+    data = IndicatorData(symbol="005930")
+    QuantIndicatorCalculator()._calc_rsi(data, closes)
+    return data.rsi_14
+
+
+def test_rsi_matches_reference_definition():
+    rng = random.Random(5)
+    for _ in range(200):
+        closes = [rng.randint(9_000, 11_000) for _ in range(rng.randint(15, 250))]
+        assert _rsi(closes) == _reference_rsi(closes)
+
+
+def test_rsi_edge_cases():
+    assert _rsi([10_000] * 14) is None           # 데이터 부족
+    assert _rsi(list(range(100, 115))) == 100.0  # 하락 없음
+    assert _rsi(list(range(115, 100, -1))) == 0.0
+    assert _rsi([10_000] * 15) == 100.0          # 변화 없음
+
+
+def _reference_macd(closes, fast=12, slow=26, signal=9):
+    def ema_series(values, period):
+        k = 2 / (period + 1)
+        result = [sum(values[:period]) / period]
+        for v in values[period:]:
+            result.append(v * k + result[-1] * (1 - k))
+        return result
+
+    ema_fast, ema_slow = ema_series(closes, fast), ema_series(closes, slow)
+    min_len = min(len(ema_fast), len(ema_slow))
+    macd_line = [f - s for f, s in zip(ema_fast[-min_len:], ema_slow[-min_len:])]
+    signal_line = ema_series(macd_line, signal)
+    return (
+        round(macd_line[-1], 2),
+        round(signal_line[-1], 2),
+        round(macd_line[-1] - signal_line[-1], 2),
+    )
+
+
+def test_macd_matches_series_definition():
+    rng = random.Random(9)
+    calc = QuantIndicatorCalculator()
+    for _ in range(200):
+        closes = [rng.randint(1_000, 200_000) for _ in range(rng.randint(35, 300))]
+        data = IndicatorData(symbol="005930")
+        calc._calc_macd(data, closes)
+        assert (data.macd_line, data.macd_signal, data.macd_histogram) == _reference_macd(closes)
+
+    short = IndicatorData(symbol="005930")
+    calc._calc_macd(short, [10_000] * 34)
+    assert short.macd_line is None
+
+
+def _reference_bbwp(closes, bb_period=20, bb_std_mult=2.0):
+    n = len(closes)
+    lookback = min(252, n - bb_period)
+    widths = []
+    for i in range(n - lookback, n + 1):
+        window = closes[i - bb_period:i]
+        sma = sum(window) / bb_period
+        std = (sum((x - sma) ** 2 for x in window) / bb_period) ** 0.5
+        widths.append(((sma + bb_std_mult * std) - (sma - bb_std_mult * std)) / sma if sma > 0 else 0)
+    return sum(1 for w in widths if w < widths[-1]) / len(widths) * 100
+
+
+def test_bbwp_matches_rolling_window_definition():
+    rng = random.Random(13)
+    calc = QuantIndicatorCalculator()
+    for i in range(300):
+        n = rng.randint(21, 320)
+        if i % 5 == 0:
+            closes = [rng.choice([100, 101, 102]) for _ in range(n)]  # 폭이 같은 창이 많은 경우
+        else:
+            closes = [rng.randint(1_000, 200_000) for _ in range(n)]
+        data = IndicatorData(symbol="005930")
+        calc._calc_bollinger_bbwp_ttm(data, closes)
+        assert data.bbwp == _reference_bbwp(closes)
+
+
+def test_shared_20_day_averages():
+    rng = random.Random(17)
+    prices = [
+        {"close": rng.randint(9_000, 11_000), "high": 11_500, "low": 8_500, "volume": rng.randint(1, 10_000)}
+        for _ in range(80)
+    ]
+
+    data = QuantIndicatorCalculator().calculate_all("005930", prices)
+
+    closes = [p["close"] for p in reversed(prices)]
+    volumes = [p["volume"] for p in reversed(prices)]
+    assert data.bb_middle == data.ma_20 == sum(closes[-20:]) / 20
+    assert data.rvol_20 == volumes[-1] / (sum(volumes[-20:]) / 20)
+
+    standalone = IndicatorData(symbol="005930")  # MA 미계산 상태에서도 직접 계산
+    QuantIndicatorCalculator()._calc_bollinger_bbwp_ttm(standalone, closes)
+    assert standalone.bb_middle == data.bb_middle
+
+
+def test_bollinger_band_matches_population_std():
+    rng = random.Random(19)
+    calc = QuantIndicatorCalculator()
+    for n in (20, 21, 60, 300):  # n=20은 BBWP 창 없이 직접 계산
+        closes = [rng.randint(1_000, 200_000) for _ in range(n)]
+        data = IndicatorData(symbol="005930")
+        calc._calc_bollinger_bbwp_ttm(data, closes)
+
+        recent = closes[-20:]
+        sma = sum(recent) / 20
+        std = (sum((x - sma) ** 2 for x in recent) / 20) ** 0.5
+        assert data.bb_middle == sma
+        assert data.bb_upper == pytest.approx(sma + 2 * std, rel=1e-12)
+        assert data.bb_lower == pytest.approx(sma - 2 * std, rel=1e-12)
+
+
+def test_short_history_skips_fixed_window_indicators():
+    calc = QuantIndicatorCalculator()
+    rng = random.Random(23)
+    for n in (1, 5, 14, 15, 19, 20, 34, 35):
+        prices = [
+            {"close": rng.randint(9_000, 11_000), "high": 11_500, "low": 8_500, "volume": rng.randint(1, 10_000)}
+            for _ in range(n)
+        ]
+        data = calc.calculate_all("005930", prices)
+        closes = [p["close"] for p in reversed(prices)]
+
+        assert (data.rsi_14 is None) is (n < 15)
+        assert (data.macd_line is None) is (n < 35)
+        assert (data.bb_middle == 0) is (n < 20)
+        if n >= 15:
+            assert data.rsi_14 == _rsi(closes)
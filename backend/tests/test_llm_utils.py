@@ -1,10 +1,51 @@
 """Tests for LLM response parsing and call utilities."""
 
 import asyncio
-from unittest.mock import AsyncMock
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
 
-from app.services.council.llm_utils import parse_llm_json, call_analyst_with_timeout
-from app.services.council.models import AnalystRole
+import pytest
+
+from app.services.council import llm_utils
+from app.services.council.llm_utils import (
+    AnalystResponseCache,
+    AsyncRateLimiter,
+    build_conversation,
+    call_analyst_with_timeout,
+    close_llm_clients,
+    get_openai_client,
+    openai_call_slot,
+    parse_llm_json,
+    read_streamed_json,
+)
+from app.services.council.models import AnalystRole, CouncilMeeting, CouncilMessage
+
+
+class TestBuildConversation:
+    def _msg(self, speaker, content):
+        return CouncilMessage(role=AnalystRole.GPT_QUANT, speaker=speaker, content=content)
+
+    def test_empty(self):
+        assert build_conversation([]) == "(첫 번째 발언입니다)"
+
+    def test_keeps_last_six_and_truncates(self):
+        messages = [self._msg(f"s{i}", "x" * 300) for i in range(8)]
+        lines = build_conversation(messages).split("\n")
+        assert len(lines) == 6
+        assert lines[0] == f"[s2]: {'x' * 200}"
+
+    def test_same_tail_returns_cached_string(self):
+        first = build_conversation([self._msg("a", "hello"), self._msg("b", "world")])
+        second = build_conversation([self._msg("a", "hello"), self._msg("b", "world")])
+        assert first == "[a]: hello\n[b]: world"
+        assert second is first
+
+    def test_meeting_conversation_matches_build_conversation(self):
+        meeting = CouncilMeeting()
+        assert meeting.conversation_text() == build_conversation(meeting.messages)
+        for i in range(9):
+            meeting.add_message(self._msg(f"s{i}", f"{i}" * (150 + 20 * i)))
+            assert meeting.conversation_text() == build_conversation(meeting.messages)
 
 
 class TestParseLlmJson:
@@ -20,6 +61,12 @@ class TestParseLlmJson:
         assert result == {"score": 8}
         assert err is None
 
+    def test_code_block_with_prose_and_unclosed_fence(self):
+        result, err = parse_llm_json('분석 결과입니다.\n```json\n{"score": 7}\n```\n끝.')
+        assert (result, err) == ({"score": 7}, None)
+        result, err = parse_llm_json('```json\n{"score": 6}\n')
+        assert (result, err) == ({"score": 6}, None)
+
     def test_raw_json(self):
         result, err = parse_llm_json('{"score": 8}')
         assert result == {"score": 8}
@@ -42,46 +89,247 @@ class TestParseLlmJson:
         assert err is None
 
 
+class _FakeStream:
+    def __init__(self, deltas):
+        self._deltas = deltas
+        self.consumed = 0
+        self.closed = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.consumed >= len(self._deltas):
+            raise StopAsyncIteration
+        delta = self._deltas[self.consumed]
+        self.consumed += 1
+        return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=delta))])
+
+    async def close(self):
+        self.closed = True
+
+
+class TestReadStreamedJson:
+    @pytest.mark.asyncio
+    async def test_stops_when_object_closes(self):
+        stream = _FakeStream(['```json\n{"a": {"b": "}', '{\\""}, "c": 1', '}\n```', " 이후 설명", "..."])
+        text = await read_streamed_json(stream)
+        assert stream.consumed == 3
+        assert stream.closed
+        assert parse_llm_json(text) == ({"a": {"b": '}{"'}, "c": 1}, None)
+
+    @pytest.mark.asyncio
+    async def test_returns_partial_text_when_stream_ends(self):
+        stream = _FakeStream(['{"a": ', None, "1"])
+        assert await read_streamed_json(stream) == '{"a": 1'
+        assert stream.closed
+
+
 class TestCallAnalystWithTimeout:
-    def test_success(self):
+    @pytest.mark.asyncio
+    async def test_success(self):
         async def _ok():
             return "analyst_result"
 
-        msg, ok = asyncio.run(call_analyst_with_timeout(
+        msg, ok = await call_analyst_with_timeout(
             _ok(),
             timeout=5.0,
             fallback_role=AnalystRole.MODERATOR,
             fallback_speaker="test",
             fallback_content="fallback",
-        ))
+        )
         assert ok is True
         assert msg == "analyst_result"
 
-    def test_timeout(self):
+    @pytest.mark.asyncio
+    async def test_timeout(self):
         async def _slow():
             await asyncio.sleep(10)
 
-        msg, ok = asyncio.run(call_analyst_with_timeout(
+        msg, ok = await call_analyst_with_timeout(
             _slow(),
             timeout=0.01,
             fallback_role=AnalystRole.MODERATOR,
             fallback_speaker="test",
             fallback_content="timeout fallback",
-        ))
+        )
         assert ok is False
         assert msg.content == "timeout fallback"
         assert msg.speaker == "시스템"
 
-    def test_exception(self):
+    @pytest.mark.asyncio
+    async def test_exception(self):
         async def _fail():
             raise RuntimeError("boom")
 
-        msg, ok = asyncio.run(call_analyst_with_timeout(
+        msg, ok = await call_analyst_with_timeout(
             _fail(),
             timeout=5.0,
             fallback_role=AnalystRole.MODERATOR,
             fallback_speaker="test",
             fallback_content="error fallback",
-        ))
+        )
         assert ok is False
         assert msg.content == "error fallback"
+
+
+class TestAnalystResponseCache:
+    def _msg(self, content="분석 결과"):
+        return CouncilMessage(role=AnalystRole.GPT_QUANT, speaker="퀀트", content=content, data={"score": 7})
+
+    def test_key_depends_on_conversation(self):
+        a = AnalystResponseCache.make_key("q", "005930", "뉴스", [self._msg("a")])
+        b = AnalystResponseCache.make_key("q", "005930", "뉴스", [self._msg("b")])
+        assert a != b
+        assert a == AnalystResponseCache.make_key("q", "005930", "뉴스", [self._msg("a")])
+
+    def test_hit_returns_fresh_copy(self):
+        cache = AnalystResponseCache()
+        original = self._msg()
+        cache.put("k", original)
+
+        hit = cache.get("k")
+        assert hit.content == original.content
+        assert hit.id != original.id
+        hit.data["score"] = 1
+        assert original.data["score"] == 7
+
+    def test_expired_entry_is_miss(self):
+        cache = AnalystResponseCache(ttl=10)
+        with patch("app.services.council.llm_utils.time.monotonic", side_effect=[0.0, 11.0]):
+            cache.put("k", self._msg())
+            assert cache.get("k") is None
+
+    def test_lru_eviction(self):
+        cache = AnalystResponseCache(maxsize=2)
+        cache.put("a", self._msg())
+        cache.put("b", self._msg())
+        cache.get("a")
+        cache.put("c", self._msg())
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+
+    @pytest.mark.asyncio
+    async def test_single_flight_coalesces_concurrent_calls(self):
+        cache = AnalystResponseCache()
+        calls = 0
+
+        async def analyze():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return self._msg()
+
+        first, second = await asyncio.gather(
+            cache.single_flight("k", analyze), cache.single_flight("k", analyze),
+        )
+        assert calls == 1
+        assert first.content == second.content
+        assert first.id != second.id
+        assert not cache._inflight
+
+        await cache.single_flight("k", analyze)  # 완료 후에는 새 호출
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_single_flight_leader_timeout_reaches_waiters(self):
+        cache = AnalystResponseCache()
+        started = asyncio.Event()
+
+        async def slow():
+            started.set()
+            await asyncio.sleep(10)
+
+        leader = asyncio.ensure_future(asyncio.wait_for(cache.single_flight("k", slow), 0.01))
+        await started.wait()
+        with pytest.raises(asyncio.TimeoutError):
+            await cache.single_flight("k", slow)
+        with pytest.raises(asyncio.TimeoutError):
+            await leader
+        assert not cache._inflight
+
+
+class TestSharedOpenAIClient:
+    @pytest.mark.asyncio
+    async def test_clients_share_one_pool_and_close(self):
+        http_client = MagicMock(aclose=AsyncMock())
+        with (
+            patch.object(llm_utils.httpx, "AsyncClient", return_value=http_client) as make_http,
+            patch.object(llm_utils, "AsyncOpenAI", side_effect=lambda **kw: MagicMock(**kw)),
+        ):
+            openai_a = get_openai_client("key", "https://a")
+            assert get_openai_client("key", "https://a") is openai_a
+            other = get_openai_client("other", "https://b")
+
+            assert other is not openai_a
+            assert openai_a.http_client is other.http_client is http_client
+            assert openai_a.max_retries == llm_utils.settings.openai_max_retries
+            make_http.assert_called_once()
+
+            await close_llm_clients()
+            http_client.aclose.assert_awaited_once()
+            assert get_openai_client("key", "https://a") is not openai_a
+            await close_llm_clients()
+
+    def test_each_event_loop_gets_its_own_pool(self, event_loop):
+        async def client_and_pool():
+            client = get_openai_client("key", "https://a")
+            return client, client.http_client
+
+        # Celery run_async처럼 태스크마다 새 루프 (세션 루프는 끝나고 되돌린다)
+        loops = [asyncio.new_event_loop() for _ in range(2)]
+        try:
+            with (
+                patch.object(llm_utils.httpx, "AsyncClient", side_effect=lambda **kw: MagicMock(aclose=AsyncMock())),
+                patch.object(llm_utils, "AsyncOpenAI", side_effect=lambda **kw: MagicMock(**kw)),
+            ):
+                (first, first_pool), (second, second_pool) = (
+                    loop.run_until_complete(client_and_pool()) for loop in loops
+                )
+        finally:
+            for loop in loops:
+                loop.close()
+            asyncio.set_event_loop(event_loop)
+
+        assert second is not first
+        assert second_pool is not first_pool
+
+
+class TestOpenAICallThrottle:
+    @pytest.mark.asyncio
+    async def test_rate_limiter_allows_burst_then_waits_for_refill(self):
+        limiter = AsyncRateLimiter(max_rate=2, period=60.0)
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+            limiter._updated -= delay  # 대기한 만큼 시간 경과
+
+        with patch.object(llm_utils.asyncio, "sleep", side_effect=fake_sleep):
+            for _ in range(3):
+                await limiter.acquire()
+
+        assert len(sleeps) == 1
+        assert sleeps[0] == pytest.approx(30.0, rel=0.01)
+
+    @pytest.mark.asyncio
+    async def test_call_slot_bounds_concurrency(self):
+        active = peak = 0
+
+        async def call():
+            nonlocal active, peak
+            async with openai_call_slot():
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        with (
+            patch.object(llm_utils.settings, "openai_max_concurrency", 2),
+            patch.object(llm_utils.settings, "openai_rpm", 1000),
+        ):
+            llm_utils._openai_guards.clear()
+            await asyncio.gather(*(call() for _ in range(6)))
+        llm_utils._openai_guards.clear()
+
+        assert peak == 2
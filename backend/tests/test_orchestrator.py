@@ -0,0 +1,110 @@
+"""CouncilOrchestrator 테스트 — 인메모리 상태, 합의 라운드 생략, 콜백 알림, 현재가 없음."""
+
+from collections import deque
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.services.council.models import CouncilMeeting, InvestmentSignal
+from app.services.council.orchestrator import CouncilOrchestrator
+
+
+def _orch_with_limits(max_meetings: int = 3, max_pending: int = 3) -> CouncilOrchestrator:
+    orch = CouncilOrchestrator()
+    orch._meetings = deque(maxlen=max_meetings)
+    orch._pending_signals = deque(maxlen=max_pending)
+    return orch
+
+
+def test_meetings_are_bounded_and_index_follows_eviction():
+    orch = _orch_with_limits(max_meetings=3)
+    meetings = [CouncilMeeting(symbol=f"00000{i}") for i in range(5)]
+    for m in meetings:
+        orch.add_meeting(m)
+
+    assert orch.get_recent_meetings(10) == meetings[2:]
+    assert orch.get_meeting(meetings[0].id) is None
+    assert orch.get_meeting(meetings[4].id) is meetings[4]
+
+
+def test_recent_meetings_returns_tail_in_insertion_order():
+    orch = _orch_with_limits(max_meetings=10)
+    meetings = [CouncilMeeting() for _ in range(4)]
+    for m in meetings:
+        orch.add_meeting(m)
+
+    assert orch.get_recent_meetings(2) == meetings[2:]
+    assert orch.get_recent_meetings(0) == []
+
+
+def test_pending_signals_are_bounded():
+    orch = _orch_with_limits(max_pending=2)
+    signals = [InvestmentSignal(symbol=str(i)) for i in range(3)]
+    for s in signals:
+        orch.add_pending_signal(s)
+
+    assert orch.iter_pending_signals() == signals[1:]
+
+
+# ── 합의 라운드 생략 ──
+
+def test_agreed_consensus_uses_average_when_analysts_agree():
+    orch = CouncilOrchestrator()
+    msg = orch._agreed_consensus(10.0, 11.0, 8, 7, {"risk_score": 4})
+
+    assert msg is not None
+    assert msg.data["suggested_percent"] == 10.5
+    assert msg.data["holding_days"] == 7
+
+
+def test_agreed_consensus_defers_to_llm_on_divergence():
+    orch = CouncilOrchestrator()
+    assert orch._agreed_consensus(5.0, 15.0, 8, 8, {"risk_score": 3}) is None
+    assert orch._agreed_consensus(10.0, 10.0, 8, 6, {"risk_score": 3}) is None
+
+
+def test_agreed_consensus_defers_to_llm_on_high_risk():
+    orch = CouncilOrchestrator()
+    assert orch._agreed_consensus(10.0, 10.0, 8, 8, {"risk_score": 8}) is None
+
+
+# ── 콜백 알림 ──
+
+@pytest.mark.asyncio
+async def test_notify_signal_runs_all_callbacks_despite_failure():
+    orch = CouncilOrchestrator()
+    received = []
+
+    async def _failing(signal):
+        raise RuntimeError("ws closed")
+
+    async def _recording(signal):
+        received.append(signal)
+
+    orch.add_signal_callback(_failing)
+    orch.add_signal_callback(_recording)
+
+    signal = InvestmentSignal(symbol="005930")
+    await orch._notify_signal(signal)
+
+    assert received == [signal]
+
+
+# ── 현재가 없음 → 회의 생략 ──
+
+@pytest.mark.asyncio
+async def test_start_meeting_without_price_skips_analysts():
+    orch = CouncilOrchestrator()
+    orch._fetch_technical_data = AsyncMock(return_value=None)
+    orch._fetch_financial_data = AsyncMock(return_value=None)
+
+    with patch("app.services.council.orchestrator.call_analyst_with_timeout", new_callable=AsyncMock) as mock_call:
+        meeting = await orch.start_meeting(
+            symbol="005930", company_name="삼성전자",
+            news_title="테스트", news_score=8, current_price=0,
+        )
+
+    mock_call.assert_not_called()
+    assert meeting.signal.action == "HOLD"
+    assert meeting.signal.consensus_reason == "가격 정보 없음"
+    assert orch.get_meeting(meeting.id) is meeting
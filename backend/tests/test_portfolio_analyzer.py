@@ -0,0 +1,270 @@
+"""portfolio_analyzer.py 테스트 — 벡터화된 포트폴리오 분석이 포지션별 분석과 일치."""
+
+import random
+
+import pytest
+
+from app.services.council.portfolio_analyzer import (
+    URGENCY_CRITICAL,
+    URGENCY_HIGH,
+    URGENCY_LOW,
+    URGENCY_MEDIUM,
+    PortfolioAnalyzer,
+    PortfolioPosition,
+    SellSignalReason,
+    TechnicalSnapshot,
+    _pack_reasons,
+)
+
+
+def _position(symbol: str, **kwargs) -> PortfolioPosition:
+    defaults = dict(
+        symbol=symbol,
+        company_name=f"종목{symbol}",
+        quantity=10,
+        avg_price=10_000,
+        current_price=10_000,
+        market_value=100_000,
+        profit_loss=0,
+        profit_loss_rate=0.0,
+        holding_days=5,
+        portfolio_weight=10.0,
+    )
+    defaults.update(kwargs)
+    return PortfolioPosition(**defaults)
+
+
+def _random_positions(n: int, seed: int = 7):
+    rng = random.Random(seed)
+    positions = []
+    for i in range(n):
+        avg = rng.randint(1_000, 100_000)
+        cur = int(avg * rng.uniform(0.8, 1.3))
+        positions.append(_position(
+            f"{i:06d}",
+            avg_price=avg,
+            current_price=cur,
+            profit_loss_rate=(cur - avg) / avg * 100,
+            holding_days=rng.randint(0, 120),
+            portfolio_weight=rng.uniform(0, 40),
+        ))
+    return positions
+
+
+def _summary(candidates):
+    return [
+        (c.position.symbol, c.suggested_action, c.total_score,
+         [(r.reason_type, r.description) for r in c.reasons])
+        for c in candidates
+    ]
+
+
+@pytest.mark.asyncio
+async def test_analyze_portfolio_matches_per_position_analysis():
+    positions = _random_positions(200)
+    news = {p.symbol: 0.1 for p in positions[::7]}
+    # 트레일링 스탑 경로를 타도록 고점 기록
+    highs = {p.symbol: int(p.avg_price * 1.5) for p in positions[::3]}
+    # 기술적 지표 악화 경로 (MACD 데드크로스, 볼린저 하단 돌파, 이평선 역배열)
+    technical = {
+        p.symbol: {
+            "rsi_14": 25.0,
+            "macd": -2.0 if i % 2 else 1.0,
+            "macd_signal": -1.0,
+            "bb_lower": p.current_price * (1.05 if i % 3 else 0.9),
+            "ma_20": p.current_price * 1.1,
+            "ma_60": p.current_price * (1.2 if i % 4 else 1.0),
+        }
+        for i, p in enumerate(positions[::5])
+    }
+    technical[positions[1].symbol] = {"rsi_14": None}
+
+    vectorized = PortfolioAnalyzer()
+    for symbol, high in highs.items():
+        vectorized.update_highest_price(symbol, high)
+    result = await vectorized.analyze_portfolio(
+        positions, technical_data_map=technical, news_sentiment_map=news,
+    )
+
+    reference = PortfolioAnalyzer()
+    for symbol, high in highs.items():
+        reference.update_highest_price(symbol, high)
+    expected = [
+        reference.analyze_position(
+            p, technical_data=technical.get(p.symbol), news_sentiment=news.get(p.symbol),
+        )
+        for p in positions
+    ]
+    expected = [c for c in expected if c.suggested_action != "HOLD"]
+    expected.sort(key=lambda c: c.total_score, reverse=True)
+
+    assert result
+    assert any(r.reason_type == "technical" for c in result for r in c.reasons)
+    assert _summary(result) == _summary(expected)
+
+    top = await vectorized.analyze_portfolio(
+        positions, technical_data_map=technical, news_sentiment_map=news, top_k=5,
+    )
+    assert _summary(top) == _summary(expected[:5])
+
+
+@pytest.mark.asyncio
+async def test_analyze_portfolio_stop_loss_position_is_sell_candidate():
+    analyzer = PortfolioAnalyzer()
+    losing = _position("005930", current_price=9_000, profit_loss_rate=-10.0)
+    flat = _position("000660")
+
+    result = await analyzer.analyze_portfolio([losing, flat])
+
+    assert [c.position.symbol for c in result] == ["005930"]
+    assert result[0].reasons[0].reason_type == "stop_loss"
+
+
+@pytest.mark.asyncio
+async def test_analyze_portfolio_empty():
+    assert await PortfolioAnalyzer().analyze_portfolio([]) == []
+
+
+def _reason(urgency: int, confidence: float) -> SellSignalReason:
+    return SellSignalReason(reason_type="t", description="d", urgency=urgency, confidence=confidence)
+
+
+def test_sell_score_small_and_vectorized_paths_agree():
+    analyzer = PortfolioAnalyzer()
+    reasons = [
+        _reason(URGENCY_CRITICAL, 0.95),
+        _reason(URGENCY_HIGH, 0.8),
+        _reason(URGENCY_MEDIUM, 0.6),
+        _reason(URGENCY_LOW, 0.5),
+    ]
+    small = analyzer._calculate_sell_score(reasons[:2])
+    assert small == pytest.approx((3.0 * 0.95 + 2.0 * 0.8) * 2)
+
+    # 5개 이상은 np.vdot 경로 — 10점 상한 적용
+    assert analyzer._calculate_sell_score(reasons + [_reason(URGENCY_LOW, 0.1)]) == 10.0
+    low_only = [_reason(URGENCY_LOW, 0.5)] * 5
+    assert analyzer._calculate_sell_score(low_only) == pytest.approx(2.5)
+
+
+@pytest.mark.asyncio
+async def test_sell_recommendations_expose_urgency_name():
+    analyzer = PortfolioAnalyzer()
+    losing = _position("005930", current_price=8_000, profit_loss_rate=-20.0, portfolio_weight=40.0)
+    candidates = await analyzer.analyze_portfolio([losing], news_sentiment_map={"005930": 0.0})
+
+    recs = analyzer.get_sell_recommendations(candidates)
+    assert [r["urgency"] for r in recs[0]["reasons"]] == ["critical", "medium", "medium"]
+
+    # 재호출 시 직렬화 결과 재사용
+    assert analyzer.get_sell_recommendations(candidates)[0] is recs[0]
+
+
+@pytest.mark.asyncio
+async def test_analyze_portfolio_includes_technical_deterioration():
+    heavy = _position("005930", portfolio_weight=35.0)
+    news = {"005930": 0.1}
+
+    without = await PortfolioAnalyzer().analyze_portfolio([heavy], news_sentiment_map=news)
+    assert without == []  # 비중 과다 + 부정 뉴스만으로는 HOLD
+
+    technical = {"005930": {"macd": -2.0, "macd_signal": -1.0}}
+    result = await PortfolioAnalyzer().analyze_portfolio(
+        [heavy], technical_data_map=technical, news_sentiment_map=news,
+    )
+    assert [r.reason_type for r in result[0].reasons] == ["overweight", "technical", "news"]
+    assert result[0].suggested_action == "WATCH"
+
+
+def test_highest_prices_grow_past_initial_capacity():
+    analyzer = PortfolioAnalyzer()
+    positions = [_position(f"{i:06d}", current_price=1_000 + i) for i in range(1_500)]
+
+    analyzer.update_highest_prices(positions)
+    analyzer.update_highest_prices([_position("000000", current_price=500)])  # 낮은 가격은 무시
+
+    assert len(analyzer._highs_arr) >= 1_500
+    assert analyzer.get_highest_price("000000", 0) == 1_000
+    assert analyzer.get_highest_price("001499", 0) == 2_499
+    assert analyzer.get_highest_price("999999", 7) == 7
+    assert analyzer.get_highs([positions[10], _position("999999")]).tolist() == [1_010, 10_000]
+
+
+def test_portfolio_dataclasses_use_slots():
+    assert not hasattr(_position("005930"), "__dict__")
+    assert not hasattr(_reason(URGENCY_LOW, 0.5), "__dict__")
+
+
+def test_fused_checks_stop_once_score_is_capped():
+    analyzer = PortfolioAnalyzer()
+    analyzer.update_highest_price("005930", 20_000)
+    position = _position(
+        "005930", current_price=8_000, profit_loss_rate=-20.0,
+        holding_days=120, portfolio_weight=40.0,
+    )
+
+    candidate = analyzer._build_candidate(position, news_sentiment=0.0)
+
+    assert [r.reason_type for r in candidate.reasons] == [
+        "stop_loss", "trailing_stop", "holding_period", "overweight",
+    ]
+    assert (candidate.total_score, candidate.suggested_action) == (10.0, "SELL")
+
+
+def test_bulk_sell_scores_match_per_candidate_scores():
+    analyzer = PortfolioAnalyzer()
+    reasons_list = [
+        [_reason(URGENCY_CRITICAL, 0.95), _reason(URGENCY_HIGH, 0.8)],
+        [],
+        [_reason(URGENCY_LOW, 0.5)] * 6,
+        [_reason(URGENCY_CRITICAL, 0.95)] * 3,
+    ]
+
+    buf = _pack_reasons(reasons_list)
+    scores = analyzer._calculate_sell_scores_bulk(buf, len(reasons_list))
+
+    assert len(buf) == 11
+    assert scores.tolist() == [analyzer._calculate_sell_score(r) for r in reasons_list]
+
+
+@pytest.mark.asyncio
+async def test_check_technical_deterioration_with_snapshot():
+    analyzer = PortfolioAnalyzer()
+    position = _position("005930", current_price=8_000, profit_loss_rate=-20.0)
+
+    snapshot = TechnicalSnapshot.from_dict(
+        {"rsi_14": 25.0, "bb_lower": 8_500, "ma_20": 9_000, "ma_60": 9_500, "macd": None}
+    )
+    reason = await analyzer.check_technical_deterioration(position, snapshot)
+
+    assert snapshot.macd == 0.0
+    assert reason.description == (
+        "RSI 과매도 진입(25.0), 볼린저밴드 하단 돌파 (하단: 8,500원), 20일선 < 60일선 (하락 추세)"
+    )
+    assert await analyzer.check_technical_deterioration(position, TechnicalSnapshot()) is None
+    assert await analyzer.check_technical_deterioration(position, None) is None
+
+
+@pytest.mark.asyncio
+async def test_vectorized_technical_check_matches_scalar():
+    rng = random.Random(11)
+    analyzer = PortfolioAnalyzer()
+    positions = _random_positions(150, seed=3)
+    snapshots = []
+    for p in positions:
+        if rng.random() < 0.2:
+            snapshots.append(None)
+            continue
+        snapshots.append(TechnicalSnapshot(
+            rsi_14=rng.choice([0.0, rng.uniform(10, 90)]),
+            macd=rng.uniform(-2, 2),
+            macd_signal=rng.choice([0.0, rng.uniform(-2, 2)]),
+            bb_lower=rng.choice([0, int(p.current_price * rng.uniform(0.9, 1.1))]),
+            ma_20=p.current_price * rng.uniform(0.9, 1.1),
+            ma_60=rng.choice([0.0, p.current_price * rng.uniform(0.9, 1.2)]),
+        ))
+
+    vectorized = analyzer.check_technical_deterioration_vectorized(positions, snapshots)
+    expected = [await analyzer.check_technical_deterioration(p, s) for p, s in zip(positions, snapshots)]
+
+    assert any(expected)
+    assert [r and r.description for r in vectorized] == [r and r.description for r in expected]
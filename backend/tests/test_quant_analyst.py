@@ -0,0 +1,412 @@
+"""quant_analyst.py 테스트 — 규칙 기반 시그널 커널, 독립 시그널 배치 검증, 묶음 분석."""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services.council.quant_analyst import (
+    ACTION_BUY,
+    ACTION_HOLD,
+    ACTION_SELL,
+    QuantAnalyst,
+    _quick_score_cached,
+    _rule_signal_kernel,
+)
+from app.services.council.technical_indicators import (
+    TechnicalAnalysisResult,
+    TechnicalIndicatorCalculator,
+)
+
+
+def _td(**kwargs) -> TechnicalAnalysisResult:
+    defaults = dict(
+        symbol="005930",
+        current_price=10_000,
+        rsi_14=50.0,
+        macd=0.0,
+        macd_signal=0.0,
+        bb_upper=11_000.0,
+        bb_lower=9_000.0,
+        ma_5=10_000.0,
+        ma_20=10_000.0,
+        ma_60=10_000.0,
+        volume_ratio=1.0,
+    )
+    defaults.update(kwargs)
+    return TechnicalAnalysisResult(**defaults)
+
+
+def test_kernel_hold_for_neutral_indicators():
+    buy, sell, action, _ = _rule_signal_kernel(50.0, 0.0, 0.0, 10_000, 0.5, 0, 0, 0, 1.0)
+    assert (buy, sell, action) == (0, 0, ACTION_HOLD)
+
+
+def test_technical_result_derived_values():
+    td = _td(current_price=9_500, ma_5=9_000.0, ma_20=8_900.0, ma_60=8_800.0)
+    assert td.bb_percent == 0.25
+    assert td.ma_alignment == 1
+    assert _td(ma_5=8_800.0, ma_20=8_900.0, ma_60=9_000.0).ma_alignment == -1
+
+    empty = TechnicalAnalysisResult(symbol="005930", current_price=10_000)
+    assert empty.bb_percent != empty.bb_percent  # NaN
+    assert empty.ma_alignment == 0
+
+
+def test_technical_prompt_text_is_rendered_once():
+    td = _td(rsi_signal="중립", macd=None, volume_avg_20=1_234_567)
+    text = td.to_prompt_text()
+
+    assert text.splitlines()[:8] == [
+        "현재가: 10,000원",
+        "",
+        "【RSI 지표】",
+        "- RSI(14): 50.0",
+        "- 신호: 중립",
+        "",
+        "【MACD 지표】",
+        "- MACD: 데이터 부족",
+    ]
+    assert "- 상단: 11,000원" in text
+    assert "- 20일 평균: 1,234,567주" in text
+    assert td.to_prompt_text() is text
+
+
+def test_technical_analyze_maps_indicators_and_score():
+    # 최신순 일봉, 꾸준한 상승 추세 + 당일 급등·거래량 급증
+    prices = [
+        {"close": 20_000 - 50 * i, "high": 20_100 - 50 * i, "low": 19_900 - 50 * i,
+         "volume": 10_000}
+        for i in range(120)
+    ]
+    prices[0] = {"close": 21_000, "high": 21_000, "low": 20_000, "volume": 50_000}
+
+    result = TechnicalIndicatorCalculator().analyze("005930", prices)
+
+    assert result.current_price == 21_000
+    assert (result.rsi_14, result.rsi_signal) == (100.0, "과매수 (매도 신호)")
+    assert result.ma_trend == "정배열 (상승 추세)"
+    assert result.ma_5 > result.ma_20 > result.ma_60
+    assert result.bb_position == "상단 돌파 (과매수 주의)"
+    assert result.volume_ratio >= 2.0
+    # 5 - 2(RSI) - 1(BB 상단) + 1(정배열) + 1(거래량) ± 1(MACD)
+    expected = 4 + (1 if result.macd_histogram > 0 else -1)
+    assert result.technical_score == expected
+
+
+def test_kernel_buy_and_sell():
+    assert _rule_signal_kernel(25.0, 1.0, 0.5, 9_050, 0.025, 9_000, 8_900, 1, 2.5)[:3] == (8, 0, ACTION_BUY)
+    assert _rule_signal_kernel(75.0, -1.0, -0.5, 10_950, 0.975, 0, 0, 0, 1.0)[:3] == (0, 5, ACTION_SELL)
+
+
+def test_rule_based_signal_hold_skips_descriptions():
+    ok, action, data = QuantAnalyst()._rule_based_signal(_td(rsi_14=35.0))
+    assert (ok, action) == (False, "HOLD")
+    assert data["signals"] == []
+    assert data["reason"] == "신호 불충분 (매수:1, 매도:0)"
+
+
+def test_rule_based_signal_without_indicators_short_circuits():
+    td = TechnicalAnalysisResult(symbol="005930", current_price=10_000)  # 지표 모두 None
+    ok, action, data = QuantAnalyst()._rule_based_signal(td)
+    assert (ok, action) == (False, "HOLD")
+    assert data["reason"] == "신호 불충분 (매수:0, 매도:0)"
+
+
+def test_rule_based_signal_buy_describes_fired_rules():
+    td = _td(
+        rsi_14=25.0, macd=1.0, macd_signal=0.5, current_price=9_050,
+        ma_5=9_000.0, ma_20=8_900.0, ma_60=8_800.0, volume_ratio=2.5,
+    )
+    ok, action, data = QuantAnalyst()._rule_based_signal(td)
+    assert (ok, action) == (True, "BUY")
+    assert data["signals"] == [
+        "RSI 과매도(25.0)",
+        "MACD 골든크로스",
+        "볼린저밴드 하단 돌파(2%)",
+        "정배열 (가격>MA5>MA20)",
+        "이동평균선 정배열",
+        "거래량 급등(2.5배)",
+    ]
+    assert data["reason"].startswith("매수 신호 우세 (8 vs 0): ")
+
+
+def test_quick_technical_score():
+    analyst = QuantAnalyst()
+    bullish = _td(rsi_14=25.0, macd=1.0, macd_signal=0.5, current_price=9_100, ma_20=9_000.0)
+    bearish = _td(rsi_14=75.0, macd=-1.0, macd_signal=-0.5, current_price=10_900, ma_20=11_000.0)
+    assert analyst.quick_technical_score(bullish) == 10
+    assert analyst.quick_technical_score(bearish) == 1
+    assert analyst.quick_technical_score(_td(current_price=0)) == 5
+
+
+def test_quick_technical_score_reuses_quantized_inputs():
+    analyst = QuantAnalyst()
+    _quick_score_cached.cache_clear()
+
+    assert analyst.quick_technical_score(_td(rsi_14=35.01)) == analyst.quick_technical_score(_td(rsi_14=35.04))
+    info = _quick_score_cached.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+    # 밴드 정보가 없는 경우도 캐시 키로 사용 가능
+    no_band = _td(bb_upper=None, bb_lower=None)
+    assert analyst.quick_technical_score(no_band) == analyst.quick_technical_score(no_band)
+
+
+_BUY_KWARGS = dict(
+    rsi_14=25.0, macd=1.0, macd_signal=0.5, current_price=9_050,
+    ma_5=9_000.0, ma_20=8_900.0, ma_60=8_800.0, volume_ratio=2.5,
+)
+
+
+def _analyst_with_response(payload: dict) -> QuantAnalyst:
+    analyst = QuantAnalyst()
+    analyst._initialize = lambda: None
+    analyst._client = MagicMock()
+    message = SimpleNamespace(content=json.dumps(payload))
+    analyst._client.chat.completions.create = AsyncMock(
+        return_value=SimpleNamespace(choices=[SimpleNamespace(message=message)])
+    )
+    return analyst
+
+
+@pytest.mark.asyncio
+async def test_independent_signals_batch_uses_one_call_for_passing_symbols():
+    analyst = _analyst_with_response({"signals": {
+        "000001": {"confirm_signal": True, "action": "BUY", "confidence": 0.8, "score": 8},
+        "000002": {"confirm_signal": False},
+    }})
+    items = [
+        ("000001", "A", _td(symbol="000001", **_BUY_KWARGS)),
+        ("000002", "B", _td(symbol="000002", **_BUY_KWARGS)),
+        ("000003", "C", _td(symbol="000003", **_BUY_KWARGS)),  # 응답 누락
+        ("000004", "D", _td(symbol="000004")),                 # 규칙 필터 미통과
+    ]
+
+    results = await analyst.generate_independent_signals_batch(items)
+
+    analyst._client.chat.completions.create.assert_awaited_once()
+    assert results["000001"][:2] == (True, "BUY")
+    assert results["000001"][2]["rule_based_signal"] == "BUY"
+    assert results["000002"] == (False, "HOLD", {"reason": "GPT 검증 미통과"})
+    assert results["000003"] == (False, "HOLD", {"reason": "GPT 검증 미통과"})
+    assert results["000004"][:2] == (False, "HOLD")
+
+
+@pytest.mark.asyncio
+async def test_independent_signal_wraps_batch_of_one():
+    analyst = _analyst_with_response({"signals": {
+        "005930": {"confirm_signal": True, "action": "BUY", "confidence": 0.9},
+    }})
+    ok, action, data = await analyst.generate_independent_signal("005930", "삼성전자", _td(**_BUY_KWARGS))
+    assert (ok, action, data["confidence"]) == (True, "BUY", 0.9)
+    assert analyst._client.chat.completions.create.call_args.kwargs["max_tokens"] == 512
+
+    ok, action, data = await analyst.generate_independent_signal("005930", "삼성전자", _td(current_price=0))
+    assert (ok, action, data) == (False, "HOLD", {"reason": "기술적 데이터 없음"})
+
+
+@pytest.mark.asyncio
+async def test_analyze_keeps_system_prefix_stable_across_symbols():
+    analyst = _analyst_with_response({"analysis": "ok", "score": 6, "suggested_percent": 10})
+    create = analyst._client.chat.completions.create
+
+    await analyst.analyze("005930", "삼성전자", "뉴스 A", [], technical_data=_td())
+    await analyst.respond_to("000660", "SK하이닉스", "뉴스 B", [], other_analysis="의견")
+
+    first, second = (c.kwargs["messages"] for c in create.call_args_list)
+    assert first[0] == second[0] == {"role": "system", "content": QuantAnalyst.ANALYSIS_SYSTEM_PROMPT}
+    assert "[응답 형식]" not in first[1]["content"]
+    assert "000660" in second[1]["content"]
+
+
+@pytest.mark.asyncio
+async def test_analyze_parses_fenced_json_and_falls_back_to_raw_text():
+    analyst = _analyst_with_response({})
+    message = analyst._client.chat.completions.create.return_value.choices[0].message
+
+    message.content = '분석입니다.\n```json\n{"analysis": "상승 추세", "score": 8}\n```'
+    parsed = await analyst.analyze("005930", "삼성전자", "뉴스", [])
+    assert parsed.data["score"] == 8
+    assert "상승 추세" in parsed.content
+
+    message.content = "JSON 없이 답변"
+    raw = await analyst.analyze("005930", "삼성전자", "뉴스", [])
+    assert raw.data == {"score": 5, "suggested_percent": 0}
+    assert raw.content.endswith("JSON 없이 답변")
+
+    # 거부(content=None)·객체가 아닌 JSON도 같은 폴백 경로
+    for content in (None, "[1, 2]", '"문자열"', "7"):
+        message.content = content
+        fallback = await analyst.analyze("005930", "삼성전자", "뉴스", [])
+        assert fallback.data == {"score": 5, "suggested_percent": 0}, content
+
+
+@pytest.mark.asyncio
+async def test_analyze_batch_packs_symbols_and_reanalyzes_missing():
+    analyst = _analyst_with_response({"results": {
+        "000001": {"analysis": "상승", "score": 7, "target_price": 11_000},
+    }})
+    items = [
+        ("000001", "A", "재평가", _td(symbol="000001"), "목표가 재설정"),
+        ("000002", "B", "재평가", None, "목표가 재설정"),  # 응답 누락 → 개별 분석
+    ]
+
+    results = await analyst.analyze_batch(items)
+
+    create = analyst._client.chat.completions.create
+    batch_call = create.call_args_list[0].kwargs
+    assert batch_call["messages"][0]["content"] == QuantAnalyst.ANALYSIS_SYSTEM_PROMPT
+    assert "000001" in batch_call["messages"][1]["content"]
+    assert "000002" in batch_call["messages"][1]["content"]
+    assert batch_call["max_tokens"] == 1600
+    assert create.await_count == 2
+    assert results["000001"].data["target_price"] == 11_000
+    assert "상승" in results["000001"].content
+    assert set(results) == {"000001", "000002"}
+    assert await analyst.analyze_batch([]) == {}
+
+
+@pytest.mark.asyncio
+async def test_analyze_batch_chunks_by_max_symbols():
+    analyst = _analyst_with_response({"results": {}})
+    analyst.analyze = AsyncMock(return_value=None)
+    n = QuantAnalyst.ANALYSIS_BATCH_MAX_SYMBOLS + 1
+    items = [(f"{i:06d}", "X", "재평가", None, "요청") for i in range(n)]
+
+    await analyst.analyze_batch(items)
+
+    assert analyst._client.chat.completions.create.await_count == 2
+    assert analyst.analyze.await_count == n
+
+
+@pytest.mark.asyncio
+async def test_submit_analysis_batch_uploads_one_request_per_symbol():
+    analyst = _analyst_with_response({})
+    analyst._client.files.create = AsyncMock(return_value=SimpleNamespace(id="file-1"))
+    analyst._client.batches.create = AsyncMock(return_value=SimpleNamespace(id="batch-1"))
+    items = [
+        ("000001", "A", "재평가", _td(symbol="000001"), "목표가 재설정"),
+        ("000002", "B", "재평가", None, "목표가 재설정"),
+    ]
+
+    assert await analyst.submit_analysis_batch(items) == "batch-1"
+
+    _, body = analyst._client.files.create.call_args.kwargs["file"]
+    lines = [json.loads(line) for line in body.splitlines()]
+    assert [line["custom_id"] for line in lines] == ["000001", "000002"]
+    assert lines[0]["body"]["messages"][0]["content"] == QuantAnalyst.ANALYSIS_SYSTEM_PROMPT
+    assert analyst._client.batches.create.call_args.kwargs["input_file_id"] == "file-1"
+
+
+@pytest.mark.asyncio
+async def test_collect_analysis_batch_waits_then_parses_output():
+    analyst = _analyst_with_response({})
+    analyst._client.batches.retrieve = AsyncMock(
+        return_value=SimpleNamespace(status="in_progress", output_file_id=None)
+    )
+    assert await analyst.collect_analysis_batch("batch-1") is None
+
+    def ok(symbol, score):
+        return json.dumps({"custom_id": symbol, "response": {"status_code": 200, "body": {"choices": [
+            {"message": {"content": json.dumps({"analysis": "분석", "score": score})}},
+        ]}}})
+
+    output = "\n".join([
+        ok("000001", 7),
+        json.dumps({"custom_id": "000002", "response": {"status_code": 500, "body": {}}}),
+        json.dumps({"custom_id": "000003", "response": {"status_code": 200, "body": {"choices": [{}]}}}),
+        '{"custom_id": "000004", "resp',  # 잘린 줄
+        ok("000005", 3),
+    ])
+    analyst._client.batches.retrieve.return_value = SimpleNamespace(
+        status="completed", output_file_id="file-out",
+    )
+    analyst._client.files.content = AsyncMock(return_value=SimpleNamespace(text=output))
+
+    results = await analyst.collect_analysis_batch("batch-1")
+
+    # 실패·손상된 줄은 건너뛰고 나머지 결과는 유지
+    assert list(results) == ["000001", "000005"]
+    assert results["000001"].data["score"] == 7
+
+
+@pytest.mark.asyncio
+async def test_analyze_uses_prepared_conversation():
+    analyst = _analyst_with_response({"analysis": "ok", "score": 6})
+
+    await analyst.analyze("005930", "삼성전자", "뉴스", [], conversation="[퀀트]: 이전 발언")
+
+    prompt = analyst._client.chat.completions.create.call_args.kwargs["messages"][1]["content"]
+    assert "[퀀트]: 이전 발언" in prompt
+    assert "(첫 번째 발언입니다)" not in prompt
+
+
+class _DeltaStream:
+    def __init__(self, deltas):
+        self._deltas = iter(deltas)
+        self.closed = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        delta = next(self._deltas, None)
+        if delta is None:
+            raise StopAsyncIteration
+        return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=delta))])
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_analyze_stream_stops_after_json_object():
+    analyst = _analyst_with_response({})
+    stream = _DeltaStream(['```json\n{"analysis": "상승", ', '"score": 7}', "\n```\n추가 설명", "..."])
+    analyst._client.chat.completions.create.return_value = stream
+
+    message = await analyst.analyze("005930", "삼성전자", "뉴스", [], stream=True)
+
+    assert analyst._client.chat.completions.create.call_args.kwargs["stream"] is True
+    assert message.data["score"] == 7
+    assert stream.closed
+    assert next(stream._deltas) == "\n```\n추가 설명"
+
+
+def test_build_analysis_prompt_variants():
+    analyst = QuantAnalyst()
+    triggers = {
+        "composite_score": 72, "bullish_count": 2, "bearish_count": 0,
+        "triggers": [{"name": "골든크로스", "signal": "bullish", "score": 30, "details": {"ma": 20}}],
+    }
+
+    with_quant = analyst._build_analysis_prompt("005930", "삼성전자", "뉴스", "대화", _td(), triggers, "요청")
+    assert "종합 점수: 72/100\n매수 신호: 2개 | 매도 신호: 0개" in with_quant
+    assert "  - [📈 매수] 골든크로스: 점수 30 (ma=20)" in with_quant
+    assert with_quant.endswith("[이전 대화]\n대화\n\n[요청]\n요청")
+
+    chart = analyst._build_analysis_prompt("005930", "삼성전자", "뉴스", "대화", _td(), None, "요청")
+    assert "뉴스: 뉴스\n\n[실제 기술적 지표 데이터]\n" in chart
+
+    no_data = analyst._build_analysis_prompt("005930", "삼성전자", "뉴스", "대화", None, None, "요청")
+    assert "⚠️ 실시간 차트 데이터를 조회할 수 없습니다." in no_data
+
+
+@pytest.mark.asyncio
+async def test_analyze_requests_strict_schema_and_accepts_null_prices():
+    analyst = _analyst_with_response({
+        "analysis": "뉴스 기반 판단", "score": 6, "suggested_percent": 5, "reasoning": "근거",
+        "risk_factors": [], "entry_price": None, "stop_loss": None, "target_price": None,
+        "reply_to_other": None,
+    })
+
+    message = await analyst.analyze("005930", "삼성전자", "뉴스", [])
+
+    response_format = analyst._client.chat.completions.create.call_args.kwargs["response_format"]
+    schema = response_format["json_schema"]["schema"]
+    assert response_format["json_schema"]["strict"] is True
+    assert set(schema["required"]) == set(schema["properties"])
+    assert message.data["score"] == 6
+    assert "매매 전략" not in message.content
@@ -5,6 +5,7 @@ Gate A/B/C, 데이터 품질 게이트, determine_action, clamp 함수.
 
 import pytest
 from dataclasses import dataclass
+from types import SimpleNamespace
 from typing import List
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -33,6 +34,15 @@ def _make_holdings(symbols: List[str]) -> List[_Holding]:
 _KIWOOM_PATCH = "app.services.kiwoom.rest_client.kiwoom_client"
 
 
+@pytest.fixture(autouse=True)
+def _fresh_account_snapshot():
+    from app.services.council.risk_gate import invalidate_account_snapshot
+
+    invalidate_account_snapshot()
+    yield
+    invalidate_account_snapshot()
+
+
 # ── Gate A: min_position ──
 
 @pytest.mark.asyncio
@@ -194,6 +204,78 @@ async def test_gate_c_passes_additional_buy():
         assert result.blocked is False
 
 
+@pytest.mark.asyncio
+async def test_gates_report_all_failures():
+    """A/B/C가 모두 실패하면 모든 사유와 게이트별 감사 이벤트를 남긴다."""
+    mock_client = AsyncMock()
+    mock_client.get_balance.return_value = SimpleNamespace(
+        available_amount=100_000, total_deposit=100_000, total_evaluation=9_900_000,
+    )
+    mock_client.get_holdings.return_value = _make_holdings([f"0000{i:02d}" for i in range(10)])
+
+    with (
+        patch(_KIWOOM_PATCH, mock_client),
+        patch("app.services.council.risk_gate.log_signal_event_async", new_callable=AsyncMock) as mock_log,
+        patch("app.services.council.risk_gate.settings") as mock_settings,
+    ):
+        mock_settings.min_position_pct = 8.0
+        mock_settings.min_cash_reserve_pct = 5.0
+        mock_settings.max_positions = 10
+
+        from app.core.audit import drain_background_events
+        from app.services.council.risk_gate import check_buy_gates
+
+        result = await check_buy_gates("999999", 500_000)
+        await drain_background_events()
+
+    assert result.blocked is True
+    assert result.gate_name == "A,B,C"
+    assert [r.split(":")[0] for r in result.reason.split("; ")] == [
+        "Gate A 최소 포지션 미달", "Gate B 현금 보유 부족", "Gate C 최대 종목 수 초과",
+    ]
+    assert [c.args[0] for c in mock_log.call_args_list] == [
+        "gate_block_min_position", "gate_block_cash_reserve", "gate_block_max_positions",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_check_buy_gates_batch_uses_one_snapshot():
+    mock_client = AsyncMock()
+    mock_client.get_balance.return_value = SimpleNamespace(
+        available_amount=50_000_000, total_deposit=50_000_000, total_evaluation=50_000_000,
+    )
+    held = [f"0000{i:02d}" for i in range(10)]
+    mock_client.get_holdings.return_value = _make_holdings(held)
+
+    with (
+        patch(_KIWOOM_PATCH, mock_client),
+        patch("app.services.council.risk_gate.log_signal_event_async", new_callable=AsyncMock),
+        patch("app.services.council.risk_gate.settings") as mock_settings,
+    ):
+        mock_settings.min_position_pct = 1.0
+        mock_settings.min_cash_reserve_pct = 1.0
+        mock_settings.max_positions = 10
+
+        from app.services.council.risk_gate import check_buy_gates_batch
+
+        results = await check_buy_gates_batch([(held[0], 5_000_000), ("999999", 5_000_000), ("888888", 1)])
+
+    mock_client.get_balance.assert_awaited_once()
+    mock_client.get_holdings.assert_awaited_once()
+    assert results[held[0]].blocked is False
+    assert results["999999"].gate_name == "C"
+    assert results["888888"].gate_name == "A,C"
+
+
+def test_holding_stats_single_pass():
+    from app.services.council.risk_gate import _holding_stats
+
+    holdings = _make_holdings(["000001", "000002"]) + [_Holding(symbol="000003", quantity=0)]
+    assert _holding_stats(holdings, "000002") == (2, True)
+    assert _holding_stats(holdings, "000003") == (2, False)
+    assert _holding_stats([], "000001") == (0, False)
+
+
 # ── Data quality gate ──
 
 def test_data_quality_gate_blocks_on_two_failures():
@@ -211,6 +293,35 @@ def test_data_quality_gate_passes_on_one_failure():
     assert result.blocked is False
 
 
+
+@pytest.mark.asyncio
+async def test_account_snapshot_reused_within_ttl_and_invalidated():
+    from app.services.council.risk_gate import (
+        _get_account_snapshot, invalidate_account_snapshot,
+    )
+
+    mock_client = AsyncMock()
+    mock_client.get_balance.return_value = _Balance(available_amount=1_000)
+    mock_client.get_holdings.return_value = _make_holdings(["005930"])
+
+    with (
+        patch(_KIWOOM_PATCH, mock_client),
+        patch(
+            "app.services.council.risk_gate._time",
+            MagicMock(monotonic=MagicMock(side_effect=[100.0, 101.0, 102.0, 102.0])),
+        ),
+    ):
+        first = await _get_account_snapshot()
+        assert await _get_account_snapshot() == first       # 1초 경과 — 캐시
+        assert mock_client.get_balance.await_count == 1
+        await _get_account_snapshot()                        # 2초 경과 — 재조회
+        assert mock_client.get_balance.await_count == 2
+
+    invalidate_account_snapshot()
+    with patch(_KIWOOM_PATCH, mock_client):
+        await _get_account_snapshot()
+    assert mock_client.get_holdings.await_count == 3
+
 # ── determine_action boundary values ──
 
 def test_determine_action_buy_news_trigger():
@@ -255,6 +366,58 @@ def test_determine_action_sell_low_news_score():
     assert result == "SELL"
 
 
+
+@pytest.mark.parametrize(
+    ("quant_score", "fundamental_score", "final_percent", "trigger_source", "expected"),
+    [
+        (4, 4.4, 20.0, "news", "HOLD"),    # 평균 4.2 — 0.5 단위로 내림하면 SELL로 뒤집힘
+        (4, 4, 20.0, "news", "SELL"),      # 평균 4.0
+        (5, 5.9, 15.0, "quant", "BUY"),    # 평균 5.45 < 5.5지만 비율 15%+ 규칙 충족
+        (5, 5.9, 14.9, "quant", "HOLD"),   # 평균 5.45, 비율 15% 미달
+        (5, 6, 10.0, "quant", "BUY"),      # 평균 5.5
+        (6, 5.9, 10.0, "news", "HOLD"),    # 평균 5.95 < 6
+    ],
+)
+def test_determine_action_fractional_boundaries(
+    quant_score, fundamental_score, final_percent, trigger_source, expected,
+):
+    from app.services.council.risk_gate import determine_action
+
+    result = determine_action(
+        final_percent=final_percent, quant_score=quant_score,
+        fundamental_score=fundamental_score, news_score=6,
+        trigger_source=trigger_source, confidence=0.8,
+    )
+    assert result == expected
+
+def test_determine_action_returns_trade_action():
+    from app.services.council.models import InvestmentSignal, TradeAction
+    from app.services.council.risk_gate import determine_action
+
+    result = determine_action(
+        final_percent=-5.0, quant_score=6, fundamental_score=6, news_score=7,
+    )
+    assert result is TradeAction.SELL
+    assert result == "SELL"
+    assert f"{result}" == "SELL"
+    assert InvestmentSignal(action=result.value).to_dict()["action"] == "SELL"
+
+
+def test_determine_action_log_messages(caplog):
+    import logging
+
+    from app.services.council.risk_gate import determine_action
+
+    with caplog.at_level(logging.INFO, logger="app.services.council.risk_gate"):
+        determine_action(final_percent=-5.0, quant_score=6, fundamental_score=6, news_score=7)
+        determine_action(final_percent=12.0, quant_score=6, fundamental_score=6, news_score=7, confidence=0.8)
+
+    assert caplog.messages == [
+        "SELL 결정: AI 매도 권장 (비율: -5.0%)",
+        "BUY 결정: 긍정적 분석 (비율: 12.0%, 평균: 6.0, 신뢰도: 80%)",
+    ]
+
+
 # ── clamp_stop_loss / clamp_target_price ──
 
 def test_clamp_stop_loss_within_bounds():
@@ -307,3 +470,32 @@ def test_clamp_target_price_default_when_none():
         # None → default: current * (1 + take_profit_percent/100) = 120000
         result = clamp_target_price(None, 100000)
         assert result == 120000
+
+
+def test_clamp_factors_match_percent_formula_and_follow_settings():
+    with patch("app.services.council.risk_gate.settings") as mock_settings:
+        mock_settings.max_stop_loss_percent = 12.3
+        mock_settings.min_stop_loss_percent = 2.7
+        mock_settings.stop_loss_percent = 4.1
+        mock_settings.min_take_profit_percent = 6.6
+        mock_settings.max_take_profit_percent = 33.3
+        mock_settings.take_profit_percent = 17.9
+
+        from app.services.council.risk_gate import clamp_stop_loss, clamp_target_price
+
+        for price in (1_234, 56_789, 987_654):
+            for gpt in (None, 1, price // 2, price, price * 2):
+                assert clamp_stop_loss(gpt, price) == (
+                    max(int(price * (1 - 12.3 / 100)), min(int(price * (1 - 2.7 / 100)), gpt))
+                    if gpt else int(price * (1 - 4.1 / 100))
+                )
+                assert clamp_target_price(gpt, price) == (
+                    max(int(price * (1 + 6.6 / 100)), min(int(price * (1 + 33.3 / 100)), gpt))
+                    if gpt else int(price * (1 + 17.9 / 100))
+                )
+
+    # 실제 settings로 복귀하면 계수 재계산
+    from app.config import settings
+    from app.services.council.risk_gate import clamp_stop_loss
+
+    assert clamp_stop_loss(None, 100_000) == int(100_000 * (1 - settings.stop_loss_percent / 100))
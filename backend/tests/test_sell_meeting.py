@@ -0,0 +1,251 @@
+"""sell_meeting.py 테스트 — 매도 회의 I/O 병렬화, 퀀트 응답 캐시, 리밸런싱 묶음 분석."""
+
+import asyncio
+import functools
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.services.council.llm_utils import analyst_response_cache
+from app.services.council.models import AnalystRole, CouncilMessage
+from app.services.council.orchestrator import CouncilOrchestrator
+from app.services.council.sell_meeting import run_sell_meeting
+
+
+@pytest.fixture(autouse=True)
+def _clear_response_cache():
+    analyst_response_cache.clear()
+    yield
+    analyst_response_cache.clear()
+
+
+async def _call_without_throttle(coro, *, fallback_role, fallback_speaker, fallback_content, fallback_data=None, **_):
+    # call_analyst_with_timeout의 호출 후 2초 대기 없이 동일하게 동작
+    try:
+        return await coro, True
+    except Exception:
+        return CouncilMessage(role=fallback_role, speaker="시스템", content=fallback_content, data=fallback_data or {}), False
+
+
+@pytest.fixture(autouse=True)
+def _no_analyst_throttle():
+    with patch("app.services.council.orchestrator.call_analyst_with_timeout", _call_without_throttle):
+        yield
+
+
+def _mock_orch(events):
+    orch = MagicMock()
+    orch.auto_execute = False
+
+    async def notify(meeting):
+        events.append("notify_start")
+        await asyncio.sleep(0)
+        events.append("notify_end")
+
+    async def fetch(symbol):
+        events.append("fetch_start")
+        return None
+
+    orch._notify_meeting_update = AsyncMock(side_effect=notify)
+    orch._fetch_technical_data = AsyncMock(side_effect=fetch)
+    orch._notify_signal = AsyncMock()
+    orch._persist_signal_to_db = AsyncMock()
+    orch._call_analyst_cached = functools.partial(CouncilOrchestrator._call_analyst_cached, orch)
+    return orch
+
+
+@pytest.mark.asyncio
+async def test_sell_meeting_fetches_chart_while_notifying():
+    events = []
+    orch = _mock_orch(events)
+    quant_msg = CouncilMessage(
+        role=AnalystRole.GPT_QUANT, speaker="퀀트", content="매도",
+        data={"score": 4, "suggested_percent": 60},
+    )
+
+    with patch(
+        "app.services.council.sell_meeting.quant_analyst.analyze",
+        AsyncMock(return_value=quant_msg),
+    ):
+        meeting = await run_sell_meeting(
+            orch, "005930", "삼성전자", "손절 검토",
+            current_holdings=10, avg_buy_price=10_000, current_price=10_000,
+        )
+
+    assert events[:3] == ["notify_start", "fetch_start", "notify_end"]
+    assert meeting.signal.action == "SELL"
+    assert meeting.signal.suggested_quantity == 6
+    orch._notify_signal.assert_awaited_once_with(meeting.signal)
+    orch._persist_signal_to_db.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_sell_meeting_reuses_cached_quant_analysis():
+    quant_msg = CouncilMessage(
+        role=AnalystRole.GPT_QUANT, speaker="퀀트", content="매도",
+        data={"score": 4, "suggested_percent": 60},
+    )
+    analyze = AsyncMock(return_value=quant_msg)
+
+    with patch("app.services.council.sell_meeting.quant_analyst.analyze", analyze):
+        for _ in range(2):
+            meeting = await run_sell_meeting(
+                _mock_orch([]), "005930", "삼성전자", "손절 검토",
+                current_holdings=10, avg_buy_price=10_000, current_price=10_000,
+            )
+        await run_sell_meeting(
+            _mock_orch([]), "005930", "삼성전자", "익절 검토",
+            current_holdings=10, avg_buy_price=10_000, current_price=10_000,
+        )
+
+    assert analyze.await_count == 2
+    cached = meeting.messages[1]
+    assert cached.content == "매도" and cached.id != quant_msg.id
+
+
+@pytest.mark.asyncio
+async def test_sell_meeting_falls_back_when_quant_analysis_fails():
+    with patch(
+        "app.services.council.sell_meeting.quant_analyst.analyze",
+        AsyncMock(side_effect=RuntimeError("boom")),
+    ):
+        meeting = await run_sell_meeting(
+            _mock_orch([]), "005930", "삼성전자", "손절 검토",
+            current_holdings=10, avg_buy_price=10_000, current_price=9_800,
+        )
+
+    assert meeting.messages[1].speaker == "시스템"
+    assert meeting.signal.suggested_quantity == 10  # 손실 구간 폴백은 전량 매도
+    assert not analyst_response_cache._entries  # 폴백 응답은 캐시하지 않음
+
+
+@pytest.mark.asyncio
+async def test_rebalance_reviews_use_one_batched_analysis():
+    from app.services.council.sell_meeting import run_rebalance_reviews
+    from app.services.council.technical_indicators import TechnicalAnalysisResult
+
+    orch = _mock_orch([])
+    orch._fetch_technical_data = AsyncMock(side_effect=lambda s: (
+        TechnicalAnalysisResult(symbol=s, current_price=11_000) if s != "000003" else None
+    ))
+    holdings = [
+        dict(symbol=s, company_name=s, current_holdings=10, avg_buy_price=10_000,
+             current_price=10_000, prev_target_price=None, prev_stop_loss=None)
+        for s in ("000001", "000002", "000003")
+    ]
+    messages = {
+        s: CouncilMessage(role=AnalystRole.GPT_QUANT, speaker="퀀트", content="분석",
+                          data={"score": score})
+        for s, score in (("000001", 7), ("000002", 2))
+    }
+    analyze_batch = AsyncMock(return_value=messages)
+
+    with patch("app.services.council.sell_meeting.quant_analyst.analyze_batch", analyze_batch):
+        results = await run_rebalance_reviews(orch, holdings)
+
+    analyze_batch.assert_awaited_once()
+    items = analyze_batch.call_args.args[0]
+    assert [item[0] for item in items] == ["000001", "000002"]
+    assert "수익률 +10.0%" in items[0][4]
+    assert results["000003"] is None
+    assert results["000001"]["current_price"] == 11_000
+    assert results["000001"]["recommend_sell"] is False
+    assert results["000002"]["recommend_sell"] is True
+
+
+@pytest.mark.asyncio
+async def test_rebalance_batch_submit_and_collect():
+    from app.services.council.sell_meeting import collect_rebalance_batch, submit_rebalance_batch
+    from app.services.council.technical_indicators import TechnicalAnalysisResult
+
+    orch = _mock_orch([])
+    orch._fetch_technical_data = AsyncMock(
+        return_value=TechnicalAnalysisResult(symbol="000001", current_price=9_000)
+    )
+    holdings = [dict(symbol="000001", company_name="A", current_holdings=10, avg_buy_price=10_000,
+                     current_price=10_000, prev_target_price=12_000, prev_stop_loss=None)]
+    message = CouncilMessage(role=AnalystRole.GPT_QUANT, speaker="퀀트", content="분석",
+                             data={"score": 3})
+
+    with patch("app.services.council.sell_meeting.quant_analyst") as analyst:
+        analyst.submit_analysis_batch = AsyncMock(return_value="batch-1")
+        batch_id, contexts = await submit_rebalance_batch(orch, holdings)
+        analyst.collect_analysis_batch = AsyncMock(return_value=None)
+        assert await collect_rebalance_batch(batch_id, contexts) is None
+        analyst.collect_analysis_batch = AsyncMock(return_value={"000001": message})
+        results = await collect_rebalance_batch(batch_id, contexts)
+
+    assert batch_id == "batch-1"
+    assert contexts["000001"]["current_price"] == 9_000
+    assert results["000001"]["recommend_sell"] is True
+    assert results["000001"]["profit_rate"] == pytest.approx(-10.0)
+
+
+@pytest.mark.asyncio
+async def test_rebalance_fetches_are_paced_and_bounded():
+    from app.services.council import sell_meeting
+    from app.services.council.technical_indicators import TechnicalAnalysisResult
+
+    starts, active, peak = [], 0, 0
+
+    async def fetch(symbol):
+        nonlocal active, peak
+        starts.append(asyncio.get_running_loop().time())
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.05)
+        active -= 1
+        return TechnicalAnalysisResult(symbol=symbol, current_price=10_000)
+
+    orch = _mock_orch([])
+    orch._fetch_technical_data = fetch
+    holdings = [
+        dict(symbol=f"{i:06d}", company_name="A", current_holdings=1, avg_buy_price=10_000,
+             current_price=10_000)
+        for i in range(6)
+    ]
+
+    with (
+        patch.object(sell_meeting, "KIWOOM_REQUEST_INTERVAL", 0.01),
+        patch.object(sell_meeting, "REBALANCE_FETCH_CONCURRENCY", 2),
+    ):
+        items, contexts = await sell_meeting._prepare_rebalance_items(orch, holdings)
+
+    assert len(items) == len(contexts) == 6
+    assert peak == 2
+    assert all(b - a >= 0.009 for a, b in zip(starts, starts[1:]))
+
+
+@pytest.mark.asyncio
+async def test_rebalance_batch_timeout_keeps_other_chunks():
+    from app.services.council import sell_meeting
+    from app.services.council.technical_indicators import TechnicalAnalysisResult
+
+    orch = _mock_orch([])
+    orch._fetch_technical_data = AsyncMock(
+        side_effect=lambda s: TechnicalAnalysisResult(symbol=s, current_price=10_000)
+    )
+    holdings = [
+        dict(symbol=s, company_name=s, current_holdings=10, avg_buy_price=10_000, current_price=10_000)
+        for s in ("000001", "000002", "000003")
+    ]
+
+    async def analyze_batch(chunk):
+        symbol = chunk[0][0]
+        if symbol == "000002":
+            await asyncio.sleep(1)
+        if symbol == "000003":
+            raise RuntimeError("boom")
+        return {symbol: CouncilMessage(role=AnalystRole.GPT_QUANT, speaker="퀀트", content="분석",
+                                       data={"score": 7})}
+
+    with (
+        patch.object(sell_meeting, "KIWOOM_REQUEST_INTERVAL", 0),
+        patch.object(sell_meeting, "REBALANCE_BATCH_TIMEOUT", 0.05),
+        patch.object(sell_meeting.quant_analyst, "ANALYSIS_BATCH_MAX_SYMBOLS", 1),
+        patch.object(sell_meeting.quant_analyst, "analyze_batch", analyze_batch),
+    ):
+        results = await sell_meeting.run_rebalance_reviews(orch, holdings)
+
+    assert results["000001"]["recommend_sell"] is False
+    assert results["000002"] is None and results["000003"] is None
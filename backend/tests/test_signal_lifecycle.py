@@ -54,6 +54,8 @@ def _mock_orch():
     orch.add_meeting = lambda m: None
     orch.set_queued_executions = lambda sigs: setattr(orch, '_queued_executions', sigs)
     orch.get_queued_executions = lambda: list(orch._queued_executions)
+    orch.pop_queued_execution = lambda: orch._queued_executions.pop(0)
+    orch.queued_execution_count = lambda: len(orch._queued_executions)
     return orch
 
 
@@ -255,8 +257,12 @@ async def test_restore_pending_signals():
         },
     ]
 
+    async def _iter_pending(limit=20):
+        for row in mock_pending:
+            yield row
+
     with patch("app.services.council.order_executor.trading_service") as mock_ts:
-        mock_ts.get_pending_signals = AsyncMock(return_value=mock_pending)
+        mock_ts.iter_pending_signals = _iter_pending
 
         from app.services.council.order_executor import restore_pending_signals
 
@@ -265,7 +271,27 @@ async def test_restore_pending_signals():
         assert len(orch._queued_executions) == 1
         assert orch._queued_executions[0].symbol == "005930"
         assert orch._queued_executions[0].status == SignalStatus.QUEUED
+        assert orch._queued_executions[0].db_id == 1
 
         assert len(orch._pending_signals) == 1
         assert orch._pending_signals[0].symbol == "000660"
         assert orch._pending_signals[0].status == SignalStatus.PENDING
+
+
+# ── Test 9: to_dict 캐시는 상태 변경 시 무효화 ──
+
+def test_to_dict_cache_invalidated_on_status_change():
+    """Cached to_dict() reflects later mutations (status/executed_at)."""
+    signal = _make_signal(status=SignalStatus.PENDING)
+
+    first = signal.to_dict()
+    assert first["status"] == "pending"
+    assert signal.to_dict() == first
+
+    signal.status = SignalStatus.EXECUTED
+    assert signal.to_dict()["status"] == "executed"
+
+    # 반환값 수정이 캐시에 영향 주지 않음
+    snapshot = signal.to_dict()
+    snapshot["status"] = "tampered"
+    assert signal.to_dict()["status"] == "executed"
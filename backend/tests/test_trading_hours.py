@@ -0,0 +1,139 @@
+"""trading_hours.py 테스트 — 주문 가능 판정 캐시, 현재 시각 캐시."""
+
+import importlib
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.services.council.trading_hours import KST, TradingHoursChecker
+
+# 패키지 속성 council.trading_hours는 싱글톤 인스턴스이므로 모듈은 직접 로드
+th = importlib.import_module("app.services.council.trading_hours")
+
+
+_MONDAY_OPEN = datetime(2026, 3, 9, 10, 0, tzinfo=KST)
+_MONDAY_CLOSED = datetime(2026, 3, 9, 20, 0, tzinfo=KST)
+
+
+def test_can_execute_order_with_explicit_dt_is_not_cached():
+    checker = TradingHoursChecker()
+    assert checker.can_execute_order(_MONDAY_OPEN)[0] is True
+    assert checker.can_execute_order(_MONDAY_CLOSED)[0] is False
+
+
+def test_can_execute_order_reuses_result_within_ttl():
+    checker = TradingHoursChecker()
+    with (
+        patch("app.services.council.trading_hours.get_kst_now", return_value=_MONDAY_OPEN) as mock_now,
+        patch("app.services.council.trading_hours._time.monotonic", side_effect=[100.0, 100.5]),
+    ):
+        assert checker.can_execute_order()[0] is True
+        assert checker.can_execute_order()[0] is True
+    assert mock_now.call_count == 1
+
+
+def test_can_execute_order_refreshes_after_ttl():
+    checker = TradingHoursChecker()
+    with (
+        patch(
+            "app.services.council.trading_hours.get_kst_now",
+            side_effect=[_MONDAY_OPEN, _MONDAY_CLOSED],
+        ),
+        patch("app.services.council.trading_hours._time.monotonic", side_effect=[100.0, 101.5]),
+    ):
+        assert checker.can_execute_order()[0] is True
+        assert checker.can_execute_order()[0] is False
+
+
+@pytest.mark.asyncio
+async def test_get_kst_now_cached_reuses_value_within_same_tick():
+    th._kst_now_cache = None
+    with patch(
+        "app.services.council.trading_hours.get_kst_now",
+        side_effect=[_MONDAY_OPEN, _MONDAY_CLOSED],
+    ):
+        first = th.get_kst_now_cached()
+        second = th.get_kst_now_cached()
+    assert first is second is _MONDAY_OPEN
+
+
+def test_get_kst_now_cached_without_loop_falls_back():
+    with patch("app.services.council.trading_hours.get_kst_now", return_value=_MONDAY_CLOSED):
+        assert th.get_kst_now_cached() is _MONDAY_CLOSED
+
+
+def test_holiday_lookup_and_next_session_skip_holidays():
+    checker = TradingHoursChecker()
+    assert checker.is_holiday(datetime(2026, 2, 17, 10, 0, tzinfo=KST))
+    assert not checker.is_holiday(_MONDAY_OPEN)
+
+    # 설 연휴(2/16~2/18) 직전 금요일 장 마감 후 → 다음 거래일은 2/19(목)
+    friday_night = datetime(2026, 2, 13, 21, 0, tzinfo=KST)
+    next_dt, _ = checker.get_next_trading_session(friday_night)
+    assert next_dt.date().isoformat() == "2026-02-19"
+    assert next_dt.tzinfo is KST
+
+
+def test_next_trading_day_scan_is_cached_per_date():
+    checker = TradingHoursChecker()
+    friday_night = datetime(2026, 2, 13, 21, 0, tzinfo=KST)
+
+    first, _ = checker.get_next_trading_session(friday_night)
+    with patch.object(checker, "_is_trading_date", side_effect=AssertionError("재탐색")):
+        again, _ = checker.get_next_trading_session(friday_night.replace(hour=23))
+    assert first == again
+    assert checker._next_trading_ordinal.cache_info().hits == 1
+
+
+@pytest.mark.asyncio
+async def test_wait_for_market_open_sleeps_until_next_session():
+    saturday = datetime(2026, 3, 7, 12, 0, tzinfo=KST)
+    monday_0750 = datetime(2026, 3, 9, 7, 50, tzinfo=KST)
+    monday_0830 = datetime(2026, 3, 9, 8, 30, tzinfo=KST)
+    with (
+        patch(
+            "app.services.council.trading_hours.get_kst_now",
+            side_effect=[saturday, monday_0750, monday_0830],
+        ),
+        patch("app.services.council.trading_hours.asyncio.sleep", new=AsyncMock()) as mock_sleep,
+    ):
+        await th.wait_for_market_open()
+
+    # 주말엔 1시간 단위로만 깨고, 마지막엔 장전 시작(08:30)까지 정확히 대기
+    assert [c.args[0] for c in mock_sleep.await_args_list] == [th.MARKET_WAIT_MAX_SLEEP, 2400]
+
+
+def test_day_table_matches_weekend_and_holiday_rules():
+    checker = TradingHoursChecker()
+    holidays = checker.HOLIDAYS_2025 | checker.HOLIDAYS_2026
+    start = datetime(2024, 12, 1, 12, 0, tzinfo=KST)
+
+    for offset in range(800):  # 테이블 범위 앞뒤 포함
+        dt = start + timedelta(days=offset)
+        covered = dt.year <= 2026
+        expected_holiday = covered and dt.date() in holidays
+        assert checker.is_holiday(dt) is expected_holiday, dt
+        assert checker.is_trading_day(dt) is (dt.weekday() < 5 and not expected_holiday), dt
+        assert checker._is_trading_date(dt.date()) is checker.is_trading_day(dt)
+
+    assert len(checker._day_table) == 730
+
+
+def test_holiday_cache_file_extends_calendar(tmp_path, monkeypatch):
+    cache = tmp_path / "krx_holidays.json"
+    cache.write_text('["2027-01-01", "2027-02-08"]')
+    monkeypatch.setattr(th.settings, "krx_holiday_cache_path", str(cache))
+    TradingHoursChecker._load_holidays.cache_clear()
+    try:
+        checker = TradingHoursChecker()
+        assert checker._last_covered_year == 2027
+        assert checker.is_holiday(datetime(2027, 2, 8, 10, 0, tzinfo=KST))  # 월요일
+        assert checker.is_holiday(datetime(2026, 2, 17, 10, 0, tzinfo=KST))  # 폴백 유지
+        assert not checker.is_trading_day(datetime(2027, 1, 1, 10, 0, tzinfo=KST))
+
+        cache.write_text("{broken")
+        TradingHoursChecker._load_holidays.cache_clear()
+        assert TradingHoursChecker()._last_covered_year == 2026
+    finally:
+        TradingHoursChecker._load_holidays.cache_clear()